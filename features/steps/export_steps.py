@@ -5,7 +5,10 @@ from src.data.generator import SchemaGenerator, ProtobufGenerator
 
 @when("I request an SQL export")  # type: ignore
 def step_impl_sql_request(context):
-    generator = SchemaGenerator()
+    # Type foreign keys like the columns they reference
+    generator = SchemaGenerator(
+        resolved_columns=context.registry.resolve_all(strict=False)
+    )
     # Need to pass list of tables to generate_ddl
     # Using get_ordered_schemas if available for correct dependency order (SQL FKs)
     if hasattr(context.registry, "get_ordered_schemas"):
@@ -28,7 +31,9 @@ def step_impl_sql_check(context):
 
 @when("I request a ProtoBuf export")  # type: ignore
 def step_impl_proto_request(context):
-    generator = ProtobufGenerator()
+    generator = ProtobufGenerator(
+        resolved_columns=context.registry.resolve_all(strict=False)
+    )
     # ProtoBuf message order matters less, but list_schemas is fine
     tables = context.registry.list_schemas()
     context.generated_proto = generator.generate_proto(tables)
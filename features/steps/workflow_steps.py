@@ -65,7 +65,6 @@ def step_check_counts(context, node_count, edge_count):
 
 @then('the node "{node_id}" should be reachable from the start')  # type: ignore
 def step_check_reachability(context, node_id):
-    # This is implicitly checked by validate_workflow (island detection),
-    # but we can verify it explicitly if needed.
-    # For this test, relies on the fact that validate_workflow passed.
-    pass
+    assert node_id in context.workflow.graph.reachable_from(), (
+        f"{node_id} is not reachable from a trigger"
+    )
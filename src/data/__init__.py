@@ -5,12 +5,24 @@ from .schema import (
     RetentionPolicy,
     TableUIHints,
     EnumSchema,
+    IndexSchema,
+    PartitionType,
+    PartitionSchema,
     ColumnSchema,
+    ResolvedColumn,
     TableSchema,
 )
+from .enums import EnumRegistry
 from .generator import SchemaGenerator
 from .storage import YAMLStorage
-from .registry import SchemaRegistry
+from .registry import SchemaRegistry, SchemaLoadError, ReloadResult
+from .cache import OutputCache, SchemaCache
+from .watcher import SchemaWatcher
+from .provision import apply_ddl_levels, provision
+from .diff import diff_database, diff_metadata, diff_registries
+from .loader import DataLoader, DataLoadError, read_rows
+from .retention import RetentionEngine, RetentionError, retention_column
+from .masking import DataMasker, MaskingPlan
 
 __all__ = [
     "DataType",
@@ -19,9 +31,32 @@ __all__ = [
     "RetentionPolicy",
     "TableUIHints",
     "EnumSchema",
+    "IndexSchema",
+    "PartitionType",
+    "PartitionSchema",
     "ColumnSchema",
+    "ResolvedColumn",
     "TableSchema",
+    "EnumRegistry",
     "SchemaGenerator",
     "YAMLStorage",
     "SchemaRegistry",
+    "SchemaLoadError",
+    "SchemaCache",
+    "OutputCache",
+    "ReloadResult",
+    "SchemaWatcher",
+    "apply_ddl_levels",
+    "provision",
+    "diff_database",
+    "diff_metadata",
+    "diff_registries",
+    "DataLoader",
+    "DataLoadError",
+    "read_rows",
+    "RetentionEngine",
+    "RetentionError",
+    "retention_column",
+    "DataMasker",
+    "MaskingPlan",
 ]
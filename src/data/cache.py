@@ -0,0 +1,218 @@
+import hashlib
+import json
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .schema import TableSchema
+
+# Bump when the on-disk layout of the cache changes.
+CACHE_FORMAT_VERSION = 1
+
+
+@dataclass
+class FileStamp:
+    """Identity of a schema file's content at the time it was read."""
+
+    mtime_ns: int
+    size: int
+    digest: str
+
+
+@dataclass
+class _CacheEntry:
+    stamp: FileStamp
+    schemas: List[TableSchema]
+
+
+def file_digest(file_path: Path) -> str:
+    """SHA-256 hex digest of a file's content."""
+    return hashlib.sha256(file_path.read_bytes()).hexdigest()
+
+
+def _model_version() -> str:
+    """
+    Hash of the TableSchema model definition, so pickled schemas are discarded
+    whenever fields are added or changed.
+    """
+    definition = json.dumps(TableSchema.model_json_schema(), sort_keys=True)
+    digest = hashlib.sha256(definition.encode("utf-8")).hexdigest()
+    return f"{CACHE_FORMAT_VERSION}:{digest}"
+
+
+class SchemaCache:
+    """
+    Persistent cache of validated TableSchema objects keyed by source file.
+
+    An entry is reused while the file's mtime and size are unchanged. If either
+    differs, the content hash decides whether the file really needs re-parsing.
+    Entries are stored as a single pickle so an unchanged registry loads
+    without touching YAML or re-running pydantic validation.
+    """
+
+    def __init__(self, path: Path | str):
+        self.path = Path(path)
+        self._version = _model_version()
+        self._entries: Dict[str, _CacheEntry] = {}
+        self._dirty = False
+        self._read()
+
+    def _read(self) -> None:
+        if not self.path.exists():
+            return
+        try:
+            with self.path.open("rb") as f:
+                payload = pickle.load(f)
+        except Exception:
+            # A corrupt or foreign cache file is simply rebuilt
+            return
+        if isinstance(payload, dict) and payload.get("version") == self._version:
+            self._entries = payload["entries"]
+
+    @staticmethod
+    def _key(file_path: Path) -> str:
+        return str(file_path.resolve())
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(
+        self, file_path: Path
+    ) -> Tuple[Optional[List[TableSchema]], Optional[FileStamp]]:
+        """
+        Return the cached schemas for a file, or None on a miss.
+        On a miss the file's current stamp is returned so it can be passed to
+        store() once the file has been parsed.
+        """
+        stat = file_path.stat()
+        entry = self._entries.get(self._key(file_path))
+        if entry is not None:
+            if (
+                entry.stamp.mtime_ns == stat.st_mtime_ns
+                and entry.stamp.size == stat.st_size
+            ):
+                return entry.schemas, None
+
+        stamp = FileStamp(stat.st_mtime_ns, stat.st_size, file_digest(file_path))
+        if entry is not None and entry.stamp.digest == stamp.digest:
+            # Touched but not edited; remember the new mtime
+            entry.stamp = stamp
+            self._dirty = True
+            return entry.schemas, None
+        return None, stamp
+
+    def store(
+        self, file_path: Path, stamp: FileStamp, schemas: List[TableSchema]
+    ) -> None:
+        """Record the schemas parsed from a file with the stamp taken before parsing."""
+        self._entries[self._key(file_path)] = _CacheEntry(stamp, schemas)
+        self._dirty = True
+
+    def prune(self, directory: Path, keep: Iterable[Path]) -> None:
+        """Drop entries for files under ``directory`` that are not in ``keep``."""
+        prefix = str(directory.resolve()) + os.sep
+        kept = {self._key(p) for p in keep}
+        stale = [k for k in self._entries if k.startswith(prefix) and k not in kept]
+        for key in stale:
+            del self._entries[key]
+        if stale:
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache to disk if anything changed since it was read."""
+        if not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with tmp_path.open("wb") as f:
+            pickle.dump(
+                {"version": self._version, "entries": self._entries},
+                f,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        # Atomic replace so concurrent readers never see a partial file
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+
+
+class OutputCache:
+    """
+    Cache of generated text (DDL statements, proto fragments) keyed by
+    TableSchema fingerprint.
+
+    Lookups go through an in-memory LRU of ``max_entries`` items first and,
+    when ``directory`` is set, fall back to one file per entry under
+    ``directory/<kind>/``. ``kind`` separates output flavours (for example the
+    SQL dialect) that share a fingerprint. Safe to use from several threads.
+    """
+
+    def __init__(self, directory: Optional[Path | str] = None, max_entries: int = 4096):
+        self.directory = Path(directory) if directory is not None else None
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _file(self, kind: str, key: str) -> Optional[Path]:
+        if self.directory is None:
+            return None
+        return self.directory / kind / f"{key}.txt"
+
+    def _remember(self, cache_key: Tuple[str, str], value: str) -> None:
+        self._entries[cache_key] = value
+        self._entries.move_to_end(cache_key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def get(self, kind: str, key: str) -> Optional[str]:
+        """Return the cached output, or None on a miss."""
+        cache_key = (kind, key)
+        with self._lock:
+            value = self._entries.get(cache_key)
+            if value is not None:
+                self._entries.move_to_end(cache_key)
+                self.hits += 1
+                return value
+
+        file_path = self._file(kind, key)
+        if file_path is not None:
+            try:
+                value = file_path.read_text(encoding="utf-8")
+            except OSError:
+                value = None
+
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._remember(cache_key, value)
+        return value
+
+    def put(self, kind: str, key: str, value: str) -> None:
+        """Store generated output in memory and, if configured, on disk."""
+        with self._lock:
+            self._remember((kind, key), value)
+
+        file_path = self._file(kind, key)
+        if file_path is None:
+            return
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = file_path.with_name(
+            f"{file_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        tmp_path.write_text(value, encoding="utf-8")
+        os.replace(tmp_path, file_path)
+
+    def clear(self) -> None:
+        """Drop the in-memory entries; files on disk are kept."""
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,334 @@
+import logging
+import re
+from typing import Dict, List, Optional, Set, Tuple, Union
+
+from sqlalchemy import (
+    Column,
+    ForeignKeyConstraint,
+    Index,
+    MetaData,
+    Table,
+    UniqueConstraint,
+)
+from sqlalchemy.dialects import mysql
+from sqlalchemy.engine import Connection, Dialect, Engine
+from sqlalchemy.schema import (
+    AddConstraint,
+    CreateIndex,
+    CreateTable,
+    DropConstraint,
+    DropIndex,
+    DropTable,
+)
+
+from .generator import SchemaGenerator
+from .registry import SchemaRegistry
+
+logger = logging.getLogger(__name__)
+
+# Integer display widths (INTEGER(11)) are cosmetic in MySQL and vary between
+# reflected and generated types.
+_DISPLAY_WIDTH = re.compile(r"^(TINYINT|SMALLINT|MEDIUMINT|INTEGER|BIGINT)\(\d+\)")
+
+_FKSignature = Tuple[Tuple[str, ...], str, Tuple[str, ...]]
+_UniqueKey = Union[UniqueConstraint, Index]
+
+
+def _type_key(column: Column, dialect: Dialect) -> str:
+    compiled = column.type.compile(dialect=dialect).upper()
+    if compiled in ("BOOL", "BOOLEAN", "TINYINT(1)"):
+        return "BOOL"
+    if compiled.startswith("INT(") or compiled == "INT":
+        compiled = "INTEGER" + compiled[3:]
+    return _DISPLAY_WIDTH.sub(r"\1", compiled)
+
+
+def _is_nullable(column: Column) -> bool:
+    return bool(column.nullable) and not column.primary_key
+
+
+def _fk_signature(fk: ForeignKeyConstraint) -> _FKSignature:
+    return (
+        tuple(fk.column_keys),
+        fk.referred_table.name,
+        tuple(element.column.name for element in fk.elements),
+    )
+
+
+def _foreign_keys(table: Table) -> Dict[_FKSignature, ForeignKeyConstraint]:
+    return {
+        _fk_signature(c): c
+        for c in table.constraints
+        if isinstance(c, ForeignKeyConstraint)
+    }
+
+
+def _fk_backing_names(table: Table) -> Set[object]:
+    # MySQL backs every foreign key with an index of the same name; those
+    # come and go with the constraint and are not diffed separately.
+    return {c.name for c in table.constraints if isinstance(c, ForeignKeyConstraint)}
+
+
+def _unique_keys(table: Table) -> Dict[Tuple[str, ...], _UniqueKey]:
+    """
+    Unique constraints and unique indexes by their columns. MySQL reflects a
+    unique constraint as a unique index, so the two are interchangeable.
+    """
+    fk_names = _fk_backing_names(table)
+    keys: Dict[Tuple[str, ...], _UniqueKey] = {
+        tuple(col.name for col in c.columns): c
+        for c in table.constraints
+        if isinstance(c, UniqueConstraint)
+    }
+    for index in sorted(table.indexes, key=lambda i: i.name or ""):
+        if index.unique and index.name not in fk_names:
+            keys.setdefault(tuple(col.name for col in index.columns), index)
+    return keys
+
+
+def _indexes(table: Table) -> Dict[Tuple[str, ...], Index]:
+    """Non-unique indexes by their columns."""
+    fk_names = _fk_backing_names(table)
+    return {
+        tuple(col.name for col in index.columns): index
+        for index in sorted(table.indexes, key=lambda i: i.name or "")
+        if not index.unique and index.name not in fk_names
+    }
+
+
+def _primary_key(table: Table) -> Tuple[str, ...]:
+    return tuple(col.name for col in table.primary_key.columns)
+
+
+class _MigrationBuilder:
+    """Collects migration statements into phases that are safe to run in order."""
+
+    def __init__(self, dialect: Dialect):
+        self.dialect = dialect
+        self.drop_foreign_keys: List[str] = []
+        self.drop_tables: List[str] = []
+        self.create_tables: List[str] = []
+        self.alter_tables: List[str] = []
+        self.add_foreign_keys: List[str] = []
+
+    def compile(self, element) -> str:
+        return str(element.compile(dialect=self.dialect)).strip() + ";"
+
+    def column_spec(self, column: Column) -> str:
+        compiler = self.dialect.ddl_compiler(self.dialect, CreateTable(column.table))
+        return compiler.get_column_specification(column)
+
+    def quote(self, name: str) -> str:
+        return self.dialect.identifier_preparer.quote(name)
+
+    def statements(self) -> List[str]:
+        return [
+            *self.drop_foreign_keys,
+            *self.drop_tables,
+            *self.create_tables,
+            *self.alter_tables,
+            *self.add_foreign_keys,
+        ]
+
+
+def diff_metadata(
+    current: MetaData, target: MetaData, dialect: Optional[Dialect] = None
+) -> List[str]:
+    """
+    Computes the DDL that migrates ``current`` to ``target``.
+
+    Statements use MySQL syntax by default (Dolt is MySQL compatible) and are
+    returned in dependency-safe order:
+
+    1. drop foreign keys that are removed or whose columns change type
+    2. drop removed tables, dependents first
+    3. create new tables, parents first, without their foreign keys
+    4. per existing table: drop indexes/unique constraints, drop, add and
+       modify columns, replace the primary key, add indexes/unique constraints
+    5. add new (or re-create dropped) foreign keys
+
+    Columns are compared by type and nullability; constraints and indexes are
+    compared by their columns, so differently named but equivalent objects
+    are left alone. Unique constraints and unique indexes count as the same
+    key, as MySQL reflects one as the other. Server defaults and comments are not compared.
+    """
+    dialect = dialect or mysql.dialect()
+    builder = _MigrationBuilder(dialect)
+
+    current_tables = {t.name: t for t in current.sorted_tables}
+    target_tables = {t.name: t for t in target.sorted_tables}
+
+    for table in reversed(current.sorted_tables):
+        if table.name not in target_tables:
+            builder.drop_tables.append(builder.compile(DropTable(table)))
+
+    for table in target.sorted_tables:
+        if table.name not in current_tables:
+            # Foreign keys are added last, once every referenced column exists
+            # with its final type
+            builder.create_tables.append(
+                builder.compile(CreateTable(table, include_foreign_key_constraints=[]))
+            )
+            for index in sorted(table.indexes, key=lambda i: i.name or ""):
+                builder.create_tables.append(builder.compile(CreateIndex(index)))
+            for fk in _foreign_keys(table).values():
+                builder.add_foreign_keys.append(builder.compile(AddConstraint(fk)))
+
+    # Columns whose type changes; foreign keys touching them are rebuilt
+    modified: Set[Tuple[str, str]] = set()
+    column_changes: Dict[str, List[Tuple[str, Column, Column]]] = {}
+    for name, new_table in target_tables.items():
+        old_table = current_tables.get(name)
+        if old_table is None:
+            continue
+        changes = column_changes.setdefault(name, [])
+        for new_col in new_table.columns:
+            old_col = old_table.columns.get(new_col.name)
+            if old_col is None:
+                continue
+            type_changed = _type_key(old_col, dialect) != _type_key(new_col, dialect)
+            if type_changed or _is_nullable(old_col) != _is_nullable(new_col):
+                changes.append((new_col.name, old_col, new_col))
+            if type_changed:
+                modified.add((name, new_col.name))
+
+    def touches_modified(table_name: str, sig: _FKSignature) -> bool:
+        local_cols, referred_table, referred_cols = sig
+        return any((table_name, c) in modified for c in local_cols) or any(
+            (referred_table, c) in modified for c in referred_cols
+        )
+
+    for name, new_table in target_tables.items():
+        old_table = current_tables.get(name)
+        if old_table is None:
+            continue
+        prefix = f"ALTER TABLE {builder.quote(name)}"
+
+        old_fks = _foreign_keys(old_table)
+        new_fks = _foreign_keys(new_table)
+        for sig, fk in old_fks.items():
+            if sig not in new_fks or touches_modified(name, sig):
+                builder.drop_foreign_keys.append(builder.compile(DropConstraint(fk)))
+        for sig, fk in new_fks.items():
+            if sig not in old_fks or touches_modified(name, sig):
+                builder.add_foreign_keys.append(builder.compile(AddConstraint(fk)))
+
+        old_uniques = _unique_keys(old_table)
+        new_uniques = _unique_keys(new_table)
+        old_indexes = _indexes(old_table)
+        new_indexes = _indexes(new_table)
+        for key, unique in old_uniques.items():
+            if key not in new_uniques:
+                builder.alter_tables.append(
+                    builder.compile(
+                        DropIndex(unique)
+                        if isinstance(unique, Index)
+                        else DropConstraint(unique)
+                    )
+                )
+        for key, index in old_indexes.items():
+            if key not in new_indexes:
+                builder.alter_tables.append(builder.compile(DropIndex(index)))
+
+        for old_col in old_table.columns:
+            if old_col.name not in new_table.columns:
+                builder.alter_tables.append(
+                    f"{prefix} DROP COLUMN {builder.quote(old_col.name)};"
+                )
+        for new_col in new_table.columns:
+            if new_col.name not in old_table.columns:
+                builder.alter_tables.append(
+                    f"{prefix} ADD COLUMN {builder.column_spec(new_col)};"
+                )
+        for _, _, new_col in column_changes[name]:
+            builder.alter_tables.append(
+                f"{prefix} MODIFY COLUMN {builder.column_spec(new_col)};"
+            )
+
+        old_pk = _primary_key(old_table)
+        new_pk = _primary_key(new_table)
+        if old_pk != new_pk:
+            parts = []
+            if old_pk:
+                parts.append("DROP PRIMARY KEY")
+            if new_pk:
+                columns = ", ".join(builder.quote(c) for c in new_pk)
+                parts.append(f"ADD PRIMARY KEY ({columns})")
+            builder.alter_tables.append(f"{prefix} {', '.join(parts)};")
+
+        for key, unique in new_uniques.items():
+            if key not in old_uniques:
+                builder.alter_tables.append(
+                    builder.compile(
+                        CreateIndex(unique)
+                        if isinstance(unique, Index)
+                        else AddConstraint(unique)
+                    )
+                )
+        for key, index in new_indexes.items():
+            if key not in old_indexes:
+                builder.alter_tables.append(builder.compile(CreateIndex(index)))
+
+    return builder.statements()
+
+
+def _generator_for(
+    registry: SchemaRegistry, dialect: Optional[Dialect]
+) -> SchemaGenerator:
+    return SchemaGenerator(
+        dialect,
+        resolved_columns=registry.resolve_all(strict=False),
+        enums=registry.enums(),
+    )
+
+
+def registry_metadata(
+    registry: SchemaRegistry, generator: Optional[SchemaGenerator] = None
+) -> MetaData:
+    """Builds SQLAlchemy metadata for every table in a registry."""
+    generator = generator or SchemaGenerator(
+        resolved_columns=registry.resolve_all(strict=False), enums=registry.enums()
+    )
+    for schema in registry.get_ordered_schemas():
+        generator.create_table_from_schema(schema)
+    return generator.metadata
+
+
+def diff_registries(
+    current: SchemaRegistry,
+    target: SchemaRegistry,
+    dialect: Optional[Dialect] = None,
+) -> List[str]:
+    """Computes the DDL that migrates the tables of one registry snapshot to another."""
+    return diff_metadata(
+        registry_metadata(current, _generator_for(current, dialect)),
+        registry_metadata(target, _generator_for(target, dialect)),
+        dialect,
+    )
+
+
+def diff_database(
+    bind: Engine | Connection,
+    target: SchemaRegistry,
+    dialect: Optional[Dialect] = None,
+    drop_unknown_tables: bool = False,
+) -> List[str]:
+    """
+    Computes the DDL that migrates a live database to a registry.
+    The database is reflected with MetaData.reflect. Tables that exist in the
+    database but not in the registry are only logged and left alone, unless
+    ``drop_unknown_tables`` is set, in which case they are dropped.
+    """
+    current = MetaData()
+    current.reflect(bind=bind)
+    unknown = [t for t in current.sorted_tables if target.get_schema(t.name) is None]
+    if unknown and not drop_unknown_tables:
+        logger.warning(
+            "Leaving tables not in the registry: %s",
+            ", ".join(t.name for t in unknown),
+        )
+        for table in unknown:
+            current.remove(table)
+    return diff_metadata(
+        current, registry_metadata(target, _generator_for(target, dialect)), dialect
+    )
@@ -0,0 +1,124 @@
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional
+
+from .schema import ColumnSchema, DataType, EnumSchema, TableSchema
+
+# Name transforms, compiled once rather than per enum column
+_WORD_BOUNDARY = re.compile("(.)([A-Z][a-z]+)")
+_LOWER_UPPER_BOUNDARY = re.compile("([a-z0-9])([A-Z])")
+_UNSAFE_VALUE_CHARS = re.compile("[ -]")
+
+
+def default_enum_name(table_name: str, column_name: str) -> str:
+    """Name given to the enum of a column that does not set enum_name."""
+    return f"{table_name}_{column_name}_enum"
+
+
+@lru_cache(maxsize=None)
+def proto_type_name(enum_name: str) -> str:
+    """Converts an enum name to its UpperCamelCase proto type name."""
+    # Handle snake_case to CamelCase conversion safely
+    if "_" in enum_name:
+        return "".join(
+            part[:1].upper() + part[1:] for part in enum_name.split("_") if part
+        )
+    # Ensure first letter is uppercase, preserve rest
+    return enum_name[:1].upper() + enum_name[1:]
+
+
+@lru_cache(maxsize=None)
+def proto_value_prefix(enum_name: str) -> str:
+    """
+    UPPER_SNAKE_CASE prefix for the values of an enum, since proto enum values
+    share their package's scope (e.g. TaskStatus -> TASK_STATUS).
+    """
+    type_name = proto_type_name(enum_name)
+    s1 = _WORD_BOUNDARY.sub(r"\1_\2", type_name)
+    return _LOWER_UPPER_BOUNDARY.sub(r"\1_\2", s1).upper()
+
+
+def proto_value_name(enum_name: str, value: str) -> str:
+    """Proto identifier of a single enum value (e.g. in_progress -> TASK_STATUS_IN_PROGRESS)."""
+    safe_value = _UNSAFE_VALUE_CHARS.sub("_", value.upper())
+    return f"{proto_value_prefix(enum_name)}_{safe_value}"
+
+
+class EnumRegistry:
+    """
+    Shared table of enum definitions.
+
+    Columns that use the same enum_name with the same values resolve to a
+    single EnumSchema, so generators define each enum once. Columns without an
+    enum_name get a per-column enum (see default_enum_name). Reusing a name
+    with different values is an error.
+    """
+
+    def __init__(self):
+        self._enums: Dict[str, EnumSchema] = {}
+
+    def __len__(self) -> int:
+        return len(self._enums)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._enums
+
+    def register(self, enum: EnumSchema) -> EnumSchema:
+        """Register an enum and return the shared definition for its name."""
+        existing = self._enums.get(enum.name)
+        if existing is None:
+            self._enums[enum.name] = enum
+            return enum
+        if existing.values != enum.values:
+            raise ValueError(
+                f"Enum '{enum.name}' is defined with conflicting values: "
+                f"{existing.values} and {enum.values}"
+            )
+        return existing
+
+    def get(self, name: str) -> Optional[EnumSchema]:
+        """Retrieve an enum by name."""
+        return self._enums.get(name)
+
+    def list_enums(self) -> List[EnumSchema]:
+        """List all registered enums."""
+        return list(self._enums.values())
+
+    def column_enum(self, table_name: str, column: ColumnSchema) -> EnumSchema:
+        """
+        Returns the shared enum for an ENUM column, registering it on first use.
+        A column that names a registered enum may omit enum_values.
+        """
+        name = column.enum_name or default_enum_name(table_name, column.name)
+        existing = self._enums.get(name)
+        if not column.enum_values:
+            if existing is None:
+                raise ValueError(
+                    f"Column {column.name} is of type ENUM but has no enum_values defined"
+                )
+            return existing
+        if existing is not None and existing.values == column.enum_values:
+            return existing
+        return self.register(EnumSchema(name=name, values=list(column.enum_values)))
+
+    def register_tables(self, tables: Iterable[TableSchema]) -> None:
+        """Register the enums of every ENUM column in the given tables."""
+        by_name = []
+        for table in tables:
+            for col in table.columns:
+                if col.data_type != DataType.ENUM:
+                    continue
+                if col.enum_values:
+                    self.column_enum(table.name, col)
+                else:
+                    # May name an enum defined by a later table
+                    by_name.append((table.name, col))
+        for table_name, col in by_name:
+            self.column_enum(table_name, col)
+
+    @classmethod
+    def from_tables(cls, tables: Iterable[TableSchema]) -> "EnumRegistry":
+        """Builds a registry holding the enums used by the given tables."""
+        registry = cls()
+        registry.register_tables(tables)
+        return registry
@@ -1,5 +1,10 @@
-from typing import List, Dict, Any
-import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Dict, Any, Iterable, Iterator, Mapping, Optional, TextIO, Tuple
+import hashlib
+import json
+import os
 from sqlalchemy import (
     MetaData,
     Table,
@@ -12,16 +17,161 @@ from sqlalchemy import (
     JSON,
     Enum,
     ForeignKey,
+    Index,
+    Numeric,
     UniqueConstraint,
+    BigInteger,
+    SmallInteger,
+    Text,
+    CHAR,
+    DECIMAL,
+    BINARY,
 )
-from sqlalchemy.schema import CreateTable
+from sqlalchemy.engine import Dialect
+from sqlalchemy.schema import CreateIndex, CreateTable
 from sqlalchemy.dialects import mysql
-from .schema import TableSchema, DataType
+from .cache import OutputCache
+from .enums import EnumRegistry, proto_type_name, proto_value_name
+from .pool import process_pool
+from .schema import (
+    ColumnSchema,
+    DataType,
+    EnumSchema,
+    PartitionType,
+    ResolvedColumn,
+    TableSchema,
+)
+
+
+# Deterministic constraint names, so migrations can drop constraints by name
+NAMING_CONVENTION = {
+    "ix": "ix_%(table_name)s_%(column_0_N_name)s",
+    "uq": "uq_%(table_name)s_%(column_0_N_name)s",
+    "fk": "fk_%(table_name)s_%(column_0_N_name)s_%(referred_table_name)s",
+}
+
+# Part of every OutputCache key. Bump whenever the generators produce
+# different output for an unchanged schema, so stale cache entries are ignored.
+OUTPUT_VERSION = 3
+
+ResolvedColumns = Mapping[Tuple[str, str], ResolvedColumn]
+
+# Well-known proto files required by column types
+PROTO_TYPE_IMPORTS = {
+    DataType.TIMESTAMP: "google/protobuf/timestamp.proto",
+}
+
+# First line of every file written by ProtobufGenerator.write_package
+PROTO_FINGERPRINT_PREFIX = "// fingerprint: "
+
+
+def _resolved_target(
+    resolved_columns: Optional[ResolvedColumns],
+    table_name: str,
+    col_def: ColumnSchema,
+) -> Optional[ResolvedColumn]:
+    """The non-reference column a REFERENCE column resolves to, if known."""
+    if resolved_columns is None:
+        return None
+    target = resolved_columns.get((table_name, col_def.name))
+    if target is None or target.column.data_type == DataType.REFERENCE:
+        return None
+    return target
+
+
+def _output_key(
+    table: TableSchema,
+    resolved_columns: Optional[ResolvedColumns],
+    enums: EnumRegistry,
+    enum_types: Optional[Mapping[str, str]] = None,
+) -> str:
+    """
+    OutputCache key of a table: its fingerprint, plus the definitions of
+    enums it only refers to by name or through a REFERENCE column, and any
+    enums defined in other files.
+    """
+    key = table.fingerprint(resolved_columns)
+    external = []
+    for col in table.columns:
+        if col.data_type == DataType.REFERENCE:
+            target = _resolved_target(resolved_columns, table.name, col)
+            if target is not None and target.column.data_type == DataType.ENUM:
+                enum = enums.column_enum(target.table, target.column)
+                external.append(enum.model_dump())
+            continue
+        if col.data_type != DataType.ENUM:
+            continue
+        if not col.enum_values:
+            external.append(enums.column_enum(table.name, col).model_dump())
+    if enum_types:
+        external.append(sorted(enum_types.items()))
+    if external:
+        digest = hashlib.sha256(json.dumps(external).encode("utf-8")).hexdigest()
+        key = f"{key}-{digest}"
+    return key
+
+
+@dataclass
+class _ProtoFileJob:
+    """Everything a worker process needs to write one namespace's proto file."""
+
+    path: Path
+    package_name: str
+    fingerprint: str
+    tables: List[TableSchema]
+    imports: List[str]
+    enums: EnumRegistry
+    enum_types: Dict[str, str] = field(default_factory=dict)
+    resolved_columns: Dict[Tuple[str, str], ResolvedColumn] = field(
+        default_factory=dict
+    )
+
+
+def _write_proto_file(job: _ProtoFileJob) -> Path:
+    generator = ProtobufGenerator(
+        job.package_name, resolved_columns=job.resolved_columns, enums=job.enums
+    )
+    generator.enum_types = job.enum_types
+    job.path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = job.path.with_name(f"{job.path.name}.{os.getpid()}.tmp")
+    with tmp_path.open("w", encoding="utf-8") as f:
+        f.write(f"{PROTO_FINGERPRINT_PREFIX}{job.fingerprint}\n")
+        generator.write_proto(job.tables, f, job.imports)
+    os.replace(tmp_path, job.path)
+    return job.path
+
+
+def _read_proto_fingerprint(file_path: Path) -> Optional[str]:
+    try:
+        with file_path.open(encoding="utf-8") as f:
+            first_line = f.readline().rstrip("\n")
+    except OSError:
+        return None
+    if first_line.startswith(PROTO_FINGERPRINT_PREFIX):
+        return first_line[len(PROTO_FINGERPRINT_PREFIX) :]
+    return None
 
 
 class SchemaGenerator:
-    def __init__(self):
-        self.metadata = MetaData()
+    def __init__(
+        self,
+        dialect: Optional[Dialect] = None,
+        cache: Optional[OutputCache] = None,
+        resolved_columns: Optional[ResolvedColumns] = None,
+        enums: Optional[EnumRegistry] = None,
+    ):
+        self.metadata = MetaData(naming_convention=NAMING_CONVENTION)
+        # Use MySQL dialect by default as Dolt is MySQL compatible.
+        # A single dialect instance is shared by every compilation.
+        self.dialect = dialect if dialect is not None else mysql.dialect()
+        # Compiled statements are cached by table fingerprint. Pass the
+        # registry's resolve_all() result as resolved_columns so that changes
+        # to referenced columns also invalidate dependent tables.
+        self.cache = cache
+        self.resolved_columns = resolved_columns
+        # Shared enum definitions; each one maps to a single SQLAlchemy type
+        self.enums = enums if enums is not None else EnumRegistry()
+        self._enum_types: Dict[Tuple[str, Tuple[str, ...]], Enum] = {}
         self.type_mapping = {
             DataType.INTEGER: Integer,
             DataType.STRING: String(255),
@@ -29,38 +179,25 @@ class SchemaGenerator:
             DataType.FLOAT: Float,
             DataType.TIMESTAMP: DateTime,
             DataType.JSON: JSON,
-            # REFERENCE type is handled specially in create_table_from_schema
+            DataType.TEXT: Text,
+            DataType.DECIMAL: DECIMAL,
+            # Compact binary form of a UUID
+            DataType.UUID: BINARY(16),
+            # ENUM and REFERENCE types are handled in _column_type
         }
+        # INTEGER columns by declared bit width
+        self.integer_widths = {16: SmallInteger, 32: Integer, 64: BigInteger}
 
     def create_table_from_schema(self, schema: TableSchema) -> Table:
         if schema.name in self.metadata.tables:
             return self.metadata.tables[schema.name]
 
+        # Columns that already lead a declared index
+        index_leads = {index.columns[0] for index in schema.indexes}
+
         columns = []
         for col_def in schema.columns:
-            col_type: Any
-            if col_def.data_type == DataType.ENUM:
-                if not col_def.enum_values:
-                    raise ValueError(
-                        f"Column {col_def.name} is of type ENUM but has no enum_values defined"
-                    )
-                # For SQLAlchemy Enum, we need to pass the allowed values
-                # We also set the name of the enum type to avoid conflicts
-                enum_name = (
-                    col_def.enum_name
-                    if col_def.enum_name
-                    else f"{schema.name}_{col_def.name}_enum"
-                )
-                col_type = Enum(*col_def.enum_values, name=enum_name)
-            elif col_def.data_type == DataType.REFERENCE:
-                # For foreign keys, we need to know the type of the target column.
-                # However, at this stage, we might not have the target table definition available.
-                # We assume standard integer keys for now, or we could look up the target table if we had a registry.
-                # Ideally, this would use the type of the referenced column.
-                # For now, we'll default to Integer, but this is a simplification.
-                col_type = Integer
-            else:
-                col_type = self.type_mapping[col_def.data_type]
+            col_type = self._column_type(schema.name, col_def)
 
             # Construct column arguments
             col_args: Dict[str, Any] = {
@@ -84,6 +221,13 @@ class SchemaGenerator:
                 )
                 fk_constraint = ForeignKey(f"{col_def.reference_table}.{ref_column}")
 
+                # Index foreign keys so lookups and joins from this side
+                # don't scan; key and unique columns are indexed already
+                if not (
+                    col_def.primary_key or col_def.unique or col_def.name in index_leads
+                ):
+                    col_args["index"] = True
+
                 # We append the ForeignKey constraint to the column definition
                 # Note: This is one way to define it. Alternatively we could add it to the Table args.
                 column = Column(col_def.name, col_type, fk_constraint, **col_args)
@@ -97,6 +241,25 @@ class SchemaGenerator:
         for unique_group in schema.composite_unique_constraints:
             args.append(UniqueConstraint(*unique_group))
 
+        # Declared secondary indexes. MySQL has no INCLUDE clause, so covered
+        # columns are appended to the key instead (IndexSchema rejects them on
+        # unique indexes, where they would weaken the key).
+        for index in schema.indexes:
+            args.append(
+                Index(index.name, *index.columns, *index.include, unique=index.unique)
+            )
+
+        # Retention purges range-scan the retention column
+        retention_column = schema.retention_column
+        if retention_column and retention_column not in index_leads:
+            pk_columns = [c.name for c in schema.columns if c.primary_key]
+            unique_columns = {c.name for c in schema.columns if c.unique}
+            if (
+                pk_columns[:1] != [retention_column]
+                and retention_column not in unique_columns
+            ):
+                args.append(Index(None, retention_column))
+
         # Build table comment with metadata
         comment_parts = []
         if schema.description:
@@ -118,23 +281,156 @@ class SchemaGenerator:
 
         comment = " ".join(comment_parts)
 
-        return Table(schema.name, self.metadata, *args, comment=comment)
+        return Table(
+            schema.name,
+            self.metadata,
+            *args,
+            comment=comment,
+            **self._partition_options(schema, columns),
+        )
+
+    def _partition_options(
+        self, schema: TableSchema, columns: List[Column]
+    ) -> Dict[str, Any]:
+        """MySQL table options for the schema's partitioning, if any."""
+        partition = schema.partition
+        if partition is None:
+            return {}
+
+        column_list = ", ".join(partition.columns)
+        if partition.type == PartitionType.HASH:
+            return {
+                "mysql_partition_by": f"HASH({column_list})",
+                "mysql_partitions": str(partition.count),
+            }
+        if partition.type == PartitionType.KEY:
+            return {
+                "mysql_partition_by": f"KEY({column_list})",
+                "mysql_partitions": str(partition.count),
+            }
+
+        sa_column = next(c for c in columns if c.name == partition.columns[0])
+        numeric = isinstance(sa_column.type, (Integer, Numeric))
+        definitions = []
+        for idx, bound in enumerate(partition.boundaries):
+            literal = bound if numeric else "'" + bound.replace("'", "''") + "'"
+            definitions.append(f"PARTITION p{idx} VALUES LESS THAN ({literal})")
+        definitions.append("PARTITION pmax VALUES LESS THAN (MAXVALUE)")
+        return {
+            "mysql_partition_by": (
+                f"RANGE COLUMNS({column_list}) ({', '.join(definitions)})"
+            )
+        }
+
+    def _column_type(self, table_name: str, col_def: ColumnSchema) -> Any:
+        if col_def.data_type == DataType.ENUM:
+            return self._enum_type(self.enums.column_enum(table_name, col_def))
+        if col_def.data_type == DataType.REFERENCE:
+            # Foreign keys take the type of the column they finally resolve
+            # to, so both sides of a join compare like types
+            target = _resolved_target(self.resolved_columns, table_name, col_def)
+            if target is None:
+                # Not resolved (no registry given, or a broken reference);
+                # assume standard integer keys
+                return Integer
+            return self._column_type(target.table, target.column)
+        if col_def.data_type == DataType.STRING and col_def.length is not None:
+            if col_def.fixed_length:
+                return CHAR(col_def.length)
+            return String(col_def.length)
+        if col_def.data_type == DataType.INTEGER and col_def.width is not None:
+            return self.integer_widths[col_def.width]
+        if col_def.data_type == DataType.DECIMAL and col_def.precision is not None:
+            return DECIMAL(col_def.precision, col_def.scale or 0)
+        return self.type_mapping[col_def.data_type]
+
+    def _enum_type(self, enum: EnumSchema) -> Enum:
+        key = (enum.name, tuple(enum.values))
+        enum_type = self._enum_types.get(key)
+        if enum_type is None:
+            # For SQLAlchemy Enum, we need to pass the allowed values
+            # We also set the name of the enum type to avoid conflicts
+            enum_type = Enum(*enum.values, name=enum.name)
+            self._enum_types[key] = enum_type
+        return enum_type
+
+    def table_statements(self, schema: TableSchema) -> List[str]:
+        """Compiles the DDL statements needed to create a single table."""
+        # The Table is always built: tables compiled later may reference it
+        sa_table = self.create_table_from_schema(schema)
+
+        kind = f"ddl-{self.dialect.name}-v{OUTPUT_VERSION}"
+        key = ""
+        if self.cache is not None:
+            key = _output_key(schema, self.resolved_columns, self.enums)
+            cached = self.cache.get(kind, key)
+            if cached is not None:
+                return json.loads(cached)
+
+        create_stmt = CreateTable(sa_table).compile(dialect=self.dialect)
+        statements = [str(create_stmt).strip() + ";"]
+        for index in sorted(sa_table.indexes, key=lambda i: i.name or ""):
+            create_index = CreateIndex(index).compile(dialect=self.dialect)
+            statements.append(str(create_index).strip() + ";")
+        if self.cache is not None:
+            self.cache.put(kind, key, json.dumps(statements))
+        return statements
 
     def generate_ddl(self, tables: List[TableSchema]) -> str:
         """Generates SQL DDL for a list of table schemas."""
         ddl_statements = []
         for table_schema in tables:
-            sa_table = self.create_table_from_schema(table_schema)
-            # Use MySQL dialect as Dolt is MySQL compatible
-            create_stmt = CreateTable(sa_table).compile(dialect=mysql.dialect())
-            ddl_statements.append(str(create_stmt).strip() + ";")
+            ddl_statements.extend(self.table_statements(table_schema))
 
         return "\n\n".join(ddl_statements)
 
+    def generate_ddl_levels(
+        self,
+        levels: List[List[TableSchema]],
+        max_workers: Optional[int] = None,
+    ) -> List[Dict[str, List[str]]]:
+        """
+        Generates DDL grouped by dependency level (see
+        SchemaRegistry.dependency_levels), mapping each table name to its
+        statements. Table objects are built serially because MetaData is not
+        thread-safe; compilation of each level is then spread over a thread pool.
+        """
+        for level in levels:
+            for table_schema in level:
+                self.create_table_from_schema(table_schema)
+
+        results: List[Dict[str, List[str]]] = []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for level in levels:
+                statements = executor.map(self.table_statements, level)
+                results.append(
+                    {
+                        table_schema.name: table_statements
+                        for table_schema, table_statements in zip(level, statements)
+                    }
+                )
+        return results
+
 
 class ProtobufGenerator:
-    def __init__(self, package_name: str = "systemcatalyst"):
+    def __init__(
+        self,
+        package_name: str = "systemcatalyst",
+        cache: Optional[OutputCache] = None,
+        resolved_columns: Optional[ResolvedColumns] = None,
+        enums: Optional[EnumRegistry] = None,
+    ):
         self.package_name = package_name
+        # Per-table fragments are cached by fingerprint, as in SchemaGenerator
+        self.cache = cache
+        self.resolved_columns = resolved_columns
+        # Shared enum definitions; each one is emitted once per file
+        self.enums = enums if enums is not None else EnumRegistry()
+        self._enum_fragments: Dict[Tuple[str, Tuple[str, ...]], str] = {}
+        # Named enums defined in another proto file, mapped to their fully
+        # qualified type. Columns using them reference that type instead of
+        # defining the enum locally. Set by write_package.
+        self.enum_types: Dict[str, str] = {}
         self.type_mapping = {
             DataType.INTEGER: "int32",
             DataType.STRING: "string",
@@ -142,94 +438,266 @@ class ProtobufGenerator:
             DataType.FLOAT: "float",
             DataType.TIMESTAMP: "google.protobuf.Timestamp",
             DataType.JSON: "string",  # Protobuf doesn't have native JSON, typically mapped to string
+            DataType.TEXT: "string",
+            # Exact decimals travel as their string form; float would round
+            DataType.DECIMAL: "string",
+            DataType.UUID: "bytes",
             # ENUM and REFERENCE handled dynamically
         }
 
+    def required_imports(self, tables: Iterable[TableSchema]) -> List[str]:
+        """Returns the well-known proto imports needed by a set of tables."""
+        imports = set()
+        for table in tables:
+            for col in table.columns:
+                imported = PROTO_TYPE_IMPORTS.get(col.data_type)
+                if imported is not None:
+                    imports.add(imported)
+            if len(imports) == len(PROTO_TYPE_IMPORTS):
+                # Nothing left to find
+                break
+        return sorted(imports)
+
+    def iter_proto(
+        self,
+        tables: Iterable[TableSchema],
+        imports: Optional[Iterable[str]] = None,
+    ) -> Iterator[str]:
+        """
+        Yields the Protobuf definitions for a list of table schemas fragment by
+        fragment: the header, then for each table the enums it is the first to
+        use followed by its message.
+
+        Imports have to precede the first message, so when ``imports`` is not
+        given the tables are collected first and scanned with required_imports.
+        Pass ``imports`` to consume ``tables`` lazily; enums referenced only by
+        name must then be registered in ``enums`` beforehand.
+        """
+        if imports is None:
+            tables = list(tables)
+            imports = self.required_imports(tables)
+            self.enums.register_tables(tables)
+
+        yield f'syntax = "proto3";\npackage {self.package_name};\n'
+        import_lines = "".join(f'import "{name}";\n' for name in imports)
+        if import_lines:
+            yield "\n" + import_lines
+        emitted = set()
+        for table in tables:
+            for col in table.columns:
+                enum = self._column_enum(table.name, col)
+                if enum is None:
+                    continue
+                if enum.name in emitted or enum.name in self.enum_types:
+                    continue
+                emitted.add(enum.name)
+                yield "\n" + self.enum_fragment(enum)
+            yield "\n" + self.table_fragment(table)
+
+    def write_proto(
+        self,
+        tables: Iterable[TableSchema],
+        sink: TextIO,
+        imports: Optional[Iterable[str]] = None,
+    ) -> None:
+        """Writes the Protobuf definitions to a text sink table by table."""
+        for fragment in self.iter_proto(tables, imports):
+            sink.write(fragment)
+
     def generate_proto(self, tables: List[TableSchema]) -> str:
         """Generates Protobuf definitions for a list of table schemas."""
-        lines = ['syntax = "proto3";', f"package {self.package_name};", ""]
-
-        # Check if we need to import Timestamp
-        has_timestamp = any(
-            col.data_type == DataType.TIMESTAMP
-            for table in tables
-            for col in table.columns
+        return "".join(self.iter_proto(tables))
+
+    def package_for(self, namespace: Optional[str]) -> str:
+        """Proto package of the file holding a namespace's tables."""
+        return f"{self.package_name}.{namespace}" if namespace else self.package_name
+
+    def file_for(self, namespace: Optional[str]) -> str:
+        """Path of a namespace's proto file, relative to the package root."""
+        return f"{namespace or self.package_name}.proto"
+
+    def write_package(
+        self,
+        tables: Iterable[TableSchema],
+        output_dir: Path | str,
+        max_workers: Optional[int] = None,
+    ) -> List[Path]:
+        """
+        Writes one .proto file per namespace into ``output_dir`` and returns
+        the paths that were (re)written.
+
+        Tables without a namespace go to ``<package_name>.proto``; the others
+        go to ``<namespace>.proto`` in package ``<package_name>.<namespace>``.
+        An enum is defined once, by the first namespace (in sorted order) that
+        uses it; other namespaces import that file and use the fully qualified
+        type. REFERENCE columns hold the referenced key as a scalar, so they
+        only need an import when that key is an enum.
+
+        Each file starts with a fingerprint of everything that went into it.
+        Files whose fingerprint is unchanged are left untouched, files for
+        namespaces that no longer exist are removed, and the remaining files
+        are written in parallel worker processes.
+        """
+        output_dir = Path(output_dir)
+        namespaces: Dict[Optional[str], List[TableSchema]] = {}
+        for table in tables:
+            namespaces.setdefault(table.namespace, []).append(table)
+        ordered = sorted(namespaces, key=lambda ns: ns or "")
+        self.enums.register_tables(
+            table for namespace in ordered for table in namespaces[namespace]
         )
-        if has_timestamp:
-            lines.append('import "google/protobuf/timestamp.proto";')
-            lines.append("")
 
+        enum_owners: Dict[str, Optional[str]] = {}
+        for namespace in ordered:
+            for table in namespaces[namespace]:
+                for col in table.columns:
+                    enum = self._column_enum(table.name, col)
+                    if enum is not None:
+                        enum_owners.setdefault(enum.name, namespace)
+
+        jobs: List[_ProtoFileJob] = []
+        expected = set()
+        for namespace in ordered:
+            namespace_tables = namespaces[namespace]
+            enum_types: Dict[str, str] = {}
+            imported_files = set()
+            for table in namespace_tables:
+                for col in table.columns:
+                    enum = self._column_enum(table.name, col)
+                    if enum is None:
+                        continue
+                    owner = enum_owners[enum.name]
+                    if owner != namespace:
+                        enum_types[enum.name] = (
+                            f".{self.package_for(owner)}.{proto_type_name(enum.name)}"
+                        )
+                        imported_files.add(self.file_for(owner))
+            imports = self.required_imports(namespace_tables) + sorted(imported_files)
+
+            digest = hashlib.sha256(
+                json.dumps(
+                    [OUTPUT_VERSION, self.package_for(namespace), imports, enum_types],
+                    sort_keys=True,
+                ).encode("utf-8")
+            )
+            for table in namespace_tables:
+                key = _output_key(table, self.resolved_columns, self.enums, enum_types)
+                digest.update(key.encode("utf-8"))
+            fingerprint = digest.hexdigest()
+
+            path = output_dir / self.file_for(namespace)
+            expected.add(path)
+            if _read_proto_fingerprint(path) == fingerprint:
+                continue
+            jobs.append(
+                _ProtoFileJob(
+                    path=path,
+                    package_name=self.package_for(namespace),
+                    fingerprint=fingerprint,
+                    tables=namespace_tables,
+                    imports=imports,
+                    enums=self.enums,
+                    enum_types=enum_types,
+                    resolved_columns=self._references_of(namespace_tables),
+                )
+            )
+
+        if output_dir.is_dir():
+            for stale in output_dir.glob("*.proto"):
+                if stale not in expected and _read_proto_fingerprint(stale):
+                    stale.unlink()
+
+        if len(jobs) <= 1 or max_workers == 1:
+            return [_write_proto_file(job) for job in jobs]
+        workers = min(max_workers or os.cpu_count() or 1, len(jobs))
+        with process_pool(workers) as executor:
+            return list(executor.map(_write_proto_file, jobs))
+
+    def _references_of(
+        self, tables: List[TableSchema]
+    ) -> Dict[Tuple[str, str], ResolvedColumn]:
+        """The resolved targets of the given tables' REFERENCE columns."""
+        references: Dict[Tuple[str, str], ResolvedColumn] = {}
         for table in tables:
-            # Handle Enums first
             for col in table.columns:
-                if col.data_type == DataType.ENUM:
-                    if not col.enum_values:
-                        raise ValueError(
-                            f"Column {col.name} is of type ENUM but has no enum_values defined"
-                        )
-
-                    enum_name = col.enum_name or f"{table.name}_{col.name}_enum"
-                    # Protobuf enum conventions typically UpperCamelCase
-                    # Handle snake_case to CamelCase conversion safely
-                    if "_" in enum_name:
-                        enum_name = "".join(
-                            part[:1].upper() + part[1:]
-                            for part in enum_name.split("_")
-                            if part
-                        )
-                    else:
-                        # Ensure first letter is uppercase, preserve rest
-                        enum_name = enum_name[:1].upper() + enum_name[1:]
-
-                    lines.append(f"enum {enum_name} {{")
-                    # Protobuf enums must start with 0.
-                    # Convention: ENUM_NAME_VALUE_NAME
-                    # We need to transform the enum name from CamelCase to UPPER_SNAKE_CASE for the prefix
-                    # This regex finds the boundary where a lower case letter is followed by an upper case letter
-                    # or numbers and inserts an underscore.
-                    s1 = re.sub("(.)([A-Z][a-z]+)", r"\1_\2", enum_name)
-                    prefix = re.sub("([a-z0-9])([A-Z])", r"\1_\2", s1).upper()
-
-                    # Convert values to upper snake case for the keys
-                    # e.g. "in_progress" -> "IN_PROGRESS"
-                    for idx, val in enumerate(col.enum_values):
-                        # Ensure safe identifier
-                        safe_val = val.upper().replace(" ", "_").replace("-", "_")
-                        lines.append(f"  {prefix}_{safe_val} = {idx};")
-
-                    lines.append("}")
-                    lines.append("")
-
-            # Generate Message
-            # Use UpperCamelCase for message name
-            msg_name = "".join(x.capitalize() for x in table.name.split("_"))
-            lines.append(f"message {msg_name} {{")
-
-            for idx, col in enumerate(table.columns, 1):
-                field_type = "string"  # Default fallback
-
-                if col.data_type == DataType.ENUM:
-                    enum_name = col.enum_name or f"{table.name}_{col.name}_enum"
-                    if "_" in enum_name:
-                        enum_name = "".join(
-                            part[:1].upper() + part[1:]
-                            for part in enum_name.split("_")
-                            if part
-                        )
-                    else:
-                        enum_name = enum_name[:1].upper() + enum_name[1:]
-                    field_type = enum_name
-
-                elif col.data_type == DataType.REFERENCE:
-                    # For references, we typically use the ID type of the referenced table
-                    # Defaulting to int32 as a safe bet for now, similar to SchemaGenerator
-                    field_type = "int32"
-                else:
-                    field_type = self.type_mapping.get(col.data_type, "string")
-
-                lines.append(f"  {field_type} {col.name} = {idx};")
-
+                target = _resolved_target(self.resolved_columns, table.name, col)
+                if col.data_type == DataType.REFERENCE and target is not None:
+                    references[(table.name, col.name)] = target
+        return references
+
+    def _scalar_type(self, col: ColumnSchema) -> str:
+        if col.data_type == DataType.INTEGER and col.width == 64:
+            return "int64"
+        # Proto has no 16-bit integers, SMALLINT stays int32
+        return self.type_mapping.get(col.data_type, "string")
+
+    def _column_enum(self, table_name: str, col: ColumnSchema) -> Optional[EnumSchema]:
+        """The enum a column holds, either directly or through a reference."""
+        if col.data_type == DataType.ENUM:
+            return self.enums.column_enum(table_name, col)
+        if col.data_type == DataType.REFERENCE:
+            target = _resolved_target(self.resolved_columns, table_name, col)
+            if target is not None and target.column.data_type == DataType.ENUM:
+                return self.enums.column_enum(target.table, target.column)
+        return None
+
+    def enum_fragment(self, enum: EnumSchema) -> str:
+        """Generates the definition of a single enum."""
+        key = (enum.name, tuple(enum.values))
+        fragment = self._enum_fragments.get(key)
+        if fragment is None:
+            lines = [f"enum {proto_type_name(enum.name)} {{"]
+            # Protobuf enums must start with 0.
+            # Convention: ENUM_NAME_VALUE_NAME, e.g. TASK_STATUS_IN_PROGRESS
+            for idx, val in enumerate(enum.values):
+                lines.append(f"  {proto_value_name(enum.name, val)} = {idx};")
             lines.append("}")
             lines.append("")
+            fragment = "\n".join(lines)
+            self._enum_fragments[key] = fragment
+        return fragment
+
+    def table_fragment(self, table: TableSchema) -> str:
+        """Generates the message for a single table."""
+        kind = f"proto-v{OUTPUT_VERSION}"
+        key = ""
+        if self.cache is not None:
+            key = _output_key(table, self.resolved_columns, self.enums, self.enum_types)
+            cached = self.cache.get(kind, key)
+            if cached is not None:
+                return cached
+
+        fragment = "\n".join(self._table_lines(table))
+        if self.cache is not None:
+            self.cache.put(kind, key, fragment)
+        return fragment
+
+    def _table_lines(self, table: TableSchema) -> List[str]:
+        # Use UpperCamelCase for message name
+        msg_name = "".join(x.capitalize() for x in table.name.split("_"))
+        lines = [f"message {msg_name} {{"]
+
+        for idx, col in enumerate(table.columns, 1):
+            field_type = "string"  # Default fallback
+
+            enum = self._column_enum(table.name, col)
+            if enum is not None:
+                field_type = self.enum_types.get(enum.name) or proto_type_name(
+                    enum.name
+                )
+            elif col.data_type == DataType.REFERENCE:
+                # References carry the key of the referenced row, typed like
+                # that key; int32 when it can't be resolved
+                target = _resolved_target(self.resolved_columns, table.name, col)
+                field_type = (
+                    self._scalar_type(target.column) if target is not None else "int32"
+                )
+            else:
+                field_type = self._scalar_type(col)
+
+            lines.append(f"  {field_type} {col.name} = {idx};")
+
+        lines.append("}")
+        lines.append("")
 
-        return "\n".join(lines)
+        return lines
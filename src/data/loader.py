@@ -0,0 +1,340 @@
+import csv
+import json
+import uuid
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from sqlalchemy import Table
+from sqlalchemy.engine import Connection, Engine
+
+from .generator import SchemaGenerator
+from .registry import SchemaRegistry
+from .schema import ColumnSchema, DataType, TableSchema
+from .storage import YAMLStorage
+
+DEFAULT_BATCH_SIZE = 1000
+
+Row = Mapping[str, Any]
+RowSource = Union[str, Path, Iterable[Row]]
+_Converter = Callable[[Any], Any]
+
+_TRUE_STRINGS = frozenset({"true", "t", "yes", "y", "1"})
+_FALSE_STRINGS = frozenset({"false", "f", "no", "n", "0"})
+_INTEGER_BOUNDS = {16: 2**15, 32: 2**31, 64: 2**63}
+
+
+class DataLoadError(ValueError):
+    """A row could not be coerced to its table's schema."""
+
+    def __init__(self, table: str, row: int, message: str):
+        super().__init__(f"{table} row {row}: {message}")
+        self.table = table
+        self.row = row
+
+
+def read_rows(file_path: Union[str, Path]) -> Iterator[Dict[str, Any]]:
+    """
+    Streams rows from a CSV, NDJSON (.ndjson/.jsonl) or YAML file.
+
+    CSV files need a header row; empty fields are read as None. YAML files
+    hold a list of mappings and are parsed in one go.
+    """
+    path = Path(file_path)
+    suffix = path.suffix.lower()
+    if suffix == ".csv":
+        with path.open(newline="", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                yield {k: (v if v != "" else None) for k, v in row.items()}
+    elif suffix in (".ndjson", ".jsonl"):
+        with path.open(encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+    elif suffix in (".yaml", ".yml"):
+        data = YAMLStorage().load(path, fast=True)
+        if not isinstance(data, list):
+            raise ValueError(f"{path}: expected a list of rows")
+        yield from data
+    else:
+        raise ValueError(f"Unsupported row file format: {path}")
+
+
+def _to_bool(value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, int) and value in (0, 1):
+        return bool(value)
+    if isinstance(value, str):
+        lowered = value.strip().lower()
+        if lowered in _TRUE_STRINGS:
+            return True
+        if lowered in _FALSE_STRINGS:
+            return False
+    raise ValueError(f"not a boolean: {value!r}")
+
+
+def _to_datetime(value: Any) -> datetime:
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, date):
+        return datetime(value.year, value.month, value.day)
+    if isinstance(value, str):
+        return datetime.fromisoformat(value)
+    raise ValueError(f"not a timestamp: {value!r}")
+
+
+def _to_uuid_bytes(value: Any) -> bytes:
+    if isinstance(value, uuid.UUID):
+        return value.bytes
+    if isinstance(value, bytes) and len(value) == 16:
+        return value
+    return uuid.UUID(str(value)).bytes
+
+
+def _to_json(value: Any) -> Any:
+    # Text (e.g. a CSV field) holds serialized JSON; anything else is the value
+    return json.loads(value) if isinstance(value, str) else value
+
+
+def _to_decimal(value: Any) -> Decimal:
+    if isinstance(value, float):
+        value = repr(value)
+    try:
+        return Decimal(value)
+    except InvalidOperation:
+        raise ValueError(f"not a decimal: {value!r}") from None
+
+
+# Converters for types that need no per-column settings
+_CONVERTERS: Dict[DataType, _Converter] = {
+    DataType.FLOAT: float,
+    DataType.BOOLEAN: _to_bool,
+    DataType.TIMESTAMP: _to_datetime,
+    DataType.JSON: _to_json,
+    DataType.DECIMAL: _to_decimal,
+    DataType.UUID: _to_uuid_bytes,
+}
+
+
+class DataLoader:
+    """
+    Bulk-inserts rows into the tables generated for a SchemaRegistry.
+
+    Rows are read in batches of ``batch_size``. Each batch is coerced column
+    by column with converters compiled once per table from its ColumnSchema,
+    then inserted with a single executemany, which MySQL drivers send as
+    multi-row INSERT statements. load_files inserts tables parents first so
+    foreign keys are satisfied.
+    """
+
+    def __init__(
+        self,
+        registry: SchemaRegistry,
+        engine: Engine,
+        generator: Optional[SchemaGenerator] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ):
+        self.registry = registry
+        self.engine = engine
+        self.generator = generator or SchemaGenerator(
+            dialect=engine.dialect,
+            resolved_columns=registry.resolve_all(strict=False),
+            enums=registry.enums(),
+        )
+        self.batch_size = batch_size
+        self._plans: Dict[str, List[Tuple[ColumnSchema, _Converter]]] = {}
+
+    def _schema(self, table_name: str) -> TableSchema:
+        schema = self.registry.get_schema(table_name)
+        if schema is None:
+            raise ValueError(f"Table '{table_name}' not found in registry")
+        return schema
+
+    def _converter(self, table_name: str, col: ColumnSchema) -> _Converter:
+        data_type = col.data_type
+        if data_type == DataType.REFERENCE:
+            try:
+                target = self.registry.resolve_target_column(table_name, col.name)
+            except ValueError:
+                # Unresolved references are generated as integer keys
+                return int
+            return self._converter(target.table, target.column)
+
+        if data_type == DataType.INTEGER:
+            bound = _INTEGER_BOUNDS[col.width or 32]
+
+            def to_int(value: Any) -> int:
+                if isinstance(value, bool) or (
+                    isinstance(value, float) and not value.is_integer()
+                ):
+                    raise ValueError(f"not an integer: {value!r}")
+                result = int(value)
+                if not -bound <= result < bound:
+                    raise ValueError(f"{result} out of range for {col.width or 32}-bit")
+                return result
+
+            return to_int
+        if data_type in (DataType.STRING, DataType.TEXT):
+            length = col.length
+
+            def to_str(value: Any) -> str:
+                result = value if isinstance(value, str) else str(value)
+                if length is not None and len(result) > length:
+                    raise ValueError(f"longer than {length} characters")
+                return result
+
+            return to_str
+        if data_type == DataType.ENUM:
+            enum = self.registry.enums().column_enum(table_name, col)
+            allowed = frozenset(enum.values)
+
+            def to_enum(value: Any) -> str:
+                if value not in allowed:
+                    raise ValueError(f"{value!r} is not one of {enum.values}")
+                return value
+
+            return to_enum
+        return _CONVERTERS[data_type]
+
+    def plan(self, table_name: str) -> List[Tuple[ColumnSchema, _Converter]]:
+        """Returns the compiled (column, converter) pairs for a table."""
+        plan = self._plans.get(table_name)
+        if plan is None:
+            schema = self._schema(table_name)
+            plan = [(col, self._converter(table_name, col)) for col in schema.columns]
+            self._plans[table_name] = plan
+        return plan
+
+    def coerce_batch(
+        self, table_name: str, rows: List[Row], first_row: int = 1
+    ) -> List[Dict[str, Any]]:
+        """
+        Validates and converts a batch of rows, one column at a time.
+        Row numbers in errors count from ``first_row``.
+        """
+        plan = self.plan(table_name)
+        known = {col.name for col, _ in plan}
+        for offset, row in enumerate(rows):
+            unknown = row.keys() - known
+            if unknown:
+                raise DataLoadError(
+                    table_name, first_row + offset, f"unknown columns {sorted(unknown)}"
+                )
+
+        coerced: List[Dict[str, Any]] = [{} for _ in rows]
+        for col, convert in plan:
+            name = col.name
+            values = [row.get(name) for row in rows]
+            present = [name in row for row in rows]
+            try:
+                converted = [None if v is None else convert(v) for v in values]
+            except (TypeError, ValueError):
+                # Re-run to find the offending row
+                for offset, value in enumerate(values):
+                    try:
+                        if value is not None:
+                            convert(value)
+                    except (TypeError, ValueError) as e:
+                        raise DataLoadError(
+                            table_name, first_row + offset, f"{name}: {e}"
+                        ) from e
+                raise
+            if not col.nullable and not col.primary_key and col.default is None:
+                for offset, value in enumerate(converted):
+                    if value is None:
+                        raise DataLoadError(
+                            table_name, first_row + offset, f"{name} is required"
+                        )
+            for target, value, is_present in zip(coerced, converted, present):
+                # Absent columns are left out so server defaults apply
+                if is_present:
+                    target[name] = value
+        return coerced
+
+    def _table(self, table_name: str) -> Table:
+        schema = self._schema(table_name)
+        return self.generator.create_table_from_schema(schema)
+
+    def _insert(
+        self, conn: Connection, table: Table, rows: List[Dict[str, Any]]
+    ) -> None:
+        # executemany needs the same keys in every row, so group rows by the
+        # columns they set, keeping the order in which each shape first appears
+        groups: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+        for row in rows:
+            groups.setdefault(tuple(row), []).append(row)
+        for group in groups.values():
+            conn.execute(table.insert(), group)
+
+    def load_rows(
+        self,
+        table_name: str,
+        rows: Iterable[Row],
+        conn: Optional[Connection] = None,
+    ) -> int:
+        """
+        Coerces and inserts rows into a table, returning the number inserted.
+        Runs in its own transaction unless a connection is given.
+        """
+        if conn is None:
+            with self.engine.begin() as own_conn:
+                return self.load_rows(table_name, rows, own_conn)
+
+        table = self._table(table_name)
+        count = 0
+        batch: List[Row] = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= self.batch_size:
+                self._insert(
+                    conn, table, self.coerce_batch(table_name, batch, count + 1)
+                )
+                count += len(batch)
+                batch = []
+        if batch:
+            self._insert(conn, table, self.coerce_batch(table_name, batch, count + 1))
+            count += len(batch)
+        return count
+
+    def load_file(
+        self,
+        table_name: str,
+        file_path: Union[str, Path],
+        conn: Optional[Connection] = None,
+    ) -> int:
+        """Loads a CSV, NDJSON or YAML file into a table."""
+        return self.load_rows(table_name, read_rows(file_path), conn)
+
+    def load_files(self, sources: Mapping[str, RowSource]) -> Dict[str, int]:
+        """
+        Loads several tables in one transaction, referenced tables first.
+        ``sources`` maps table names to a row file or an iterable of rows.
+        Returns the number of rows inserted per table.
+        """
+        for table_name in sources:
+            self._schema(table_name)
+
+        counts: Dict[str, int] = {}
+        with self.engine.begin() as conn:
+            for schema in self.registry.get_ordered_schemas():
+                source = sources.get(schema.name)
+                if source is None:
+                    continue
+                if isinstance(source, (str, Path)):
+                    counts[schema.name] = self.load_file(schema.name, source, conn)
+                else:
+                    counts[schema.name] = self.load_rows(schema.name, source, conn)
+        return counts
@@ -0,0 +1,203 @@
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+)
+
+from .registry import SchemaRegistry
+from .schema import ColumnSchema, DataSensitivity, DataType, TableSchema
+
+DEFAULT_BATCH_SIZE = 1000
+MASKED = "***"
+
+Row = Mapping[str, Any]
+_ColumnMask = Callable[[List[Any]], List[Any]]
+
+# Sensitivities that are masked unless the reader is cleared for them
+MASKED_SENSITIVITIES = frozenset(
+    {DataSensitivity.PII, DataSensitivity.CONFIDENTIAL, DataSensitivity.RESTRICTED}
+)
+
+# Least to most sensitive
+_SENSITIVITY_ORDER = list(DataSensitivity)
+
+
+def column_sensitivity(
+    schema: TableSchema,
+    col: ColumnSchema,
+    registry: Optional[SchemaRegistry] = None,
+) -> DataSensitivity:
+    """
+    Effective sensitivity of a column: its own, or else the table's. Given a
+    registry, a REFERENCE column is at least as sensitive as the column it
+    resolves to, whatever its own sensitivity says, so a key copied into
+    another table is masked like the key itself (hashed PII keys still join).
+    """
+    sensitivity = col.sensitivity if col.sensitivity is not None else schema.sensitivity
+    if registry is None or col.data_type != DataType.REFERENCE:
+        return sensitivity
+    try:
+        owner, target = registry.resolve_target_column(schema.name, col.name)
+    except ValueError:
+        return sensitivity
+    owner_schema = registry.get_schema(owner)
+    if owner_schema is None:
+        return sensitivity
+    return max(
+        sensitivity,
+        column_sensitivity(owner_schema, target),
+        key=_SENSITIVITY_ORDER.index,
+    )
+
+
+def _constant_mask(value: Any) -> _ColumnMask:
+    def mask(values: List[Any]) -> List[Any]:
+        return [None if v is None else value for v in values]
+
+    return mask
+
+
+def _hash_mask(key: bytes) -> _ColumnMask:
+    def mask(values: List[Any]) -> List[Any]:
+        # Columns repeat values (e.g. a customer on many orders); hash each once
+        digests: Dict[str, str] = {}
+        masked: List[Any] = []
+        for value in values:
+            if value is None:
+                masked.append(None)
+                continue
+            text = (
+                value
+                if isinstance(value, str)
+                else json.dumps(value, sort_keys=True, default=str)
+            )
+            digest = digests.get(text)
+            if digest is None:
+                digest = hashlib.blake2b(
+                    text.encode(), key=key, digest_size=16
+                ).hexdigest()
+                digests[text] = digest
+            masked.append(digest)
+        return masked
+
+    return mask
+
+
+@dataclass
+class MaskingPlan:
+    """The masks to apply to one table's rows, by column name."""
+
+    table: str
+    masks: List[Tuple[str, _ColumnMask]]
+
+    def apply(self, rows: Iterable[Row]) -> List[Dict[str, Any]]:
+        """Returns masked copies of a batch of rows, masking one column at a time."""
+        masked = [dict(row) for row in rows]
+        if not self.masks or not masked:
+            return masked
+        for name, mask in self.masks:
+            present = [row for row in masked if name in row]
+            for row, value in zip(present, mask([row[name] for row in present])):
+                row[name] = value
+        return masked
+
+
+class DataMasker:
+    """
+    Masks rows according to the sensitivity of their columns.
+
+    Each table's MaskingPlan is compiled once from the registry and then
+    applied to whole batches of rows, column by column:
+
+        pii: replaced by a keyed hash, so equal values still match
+        confidential: replaced by "***" (None for non-text columns)
+        restricted: replaced by None
+
+    Key columns are masked like any other column, and reference columns at
+    least like the key they refer to. Sensitivities in ``clearance`` are
+    returned unmasked. ``key`` keys the PII hash; pass the same key to get the
+    same hashes across exports.
+    """
+
+    def __init__(
+        self,
+        registry: SchemaRegistry,
+        key: Optional[bytes] = None,
+        clearance: Iterable[DataSensitivity] = (),
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ):
+        self.registry = registry
+        self.key = key if key is not None else os.urandom(32)
+        self.clearance = frozenset(clearance)
+        self.batch_size = batch_size
+        self._plans: Dict[str, MaskingPlan] = {}
+
+    def _column_mask(
+        self, schema: TableSchema, col: ColumnSchema
+    ) -> Optional[_ColumnMask]:
+        sensitivity = column_sensitivity(schema, col, self.registry)
+        if sensitivity not in MASKED_SENSITIVITIES or sensitivity in self.clearance:
+            return None
+        if sensitivity == DataSensitivity.PII:
+            return _hash_mask(self.key)
+        if sensitivity == DataSensitivity.CONFIDENTIAL and col.data_type in (
+            DataType.STRING,
+            DataType.TEXT,
+        ):
+            return _constant_mask(MASKED)
+        return _constant_mask(None)
+
+    def plan(self, table_name: str) -> MaskingPlan:
+        """Returns the compiled masking plan for a table."""
+        plan = self._plans.get(table_name)
+        if plan is None:
+            schema = self.registry.get_schema(table_name)
+            if schema is None:
+                raise ValueError(f"Table '{table_name}' not found in registry")
+            masks = []
+            for col in schema.columns:
+                mask = self._column_mask(schema, col)
+                if mask is not None:
+                    masks.append((col.name, mask))
+            plan = MaskingPlan(table=table_name, masks=masks)
+            self._plans[table_name] = plan
+        return plan
+
+    def invalidate(self, table_name: Optional[str] = None) -> None:
+        """
+        Drops compiled plans after schemas change (all plans if no table
+        given). Plans of tables referencing a changed key are kept, so drop
+        all plans when a key's sensitivity changes.
+        """
+        if table_name is None:
+            self._plans.clear()
+        else:
+            self._plans.pop(table_name, None)
+
+    def mask_batch(self, table_name: str, rows: Iterable[Row]) -> List[Dict[str, Any]]:
+        """Masks a batch of rows from a table."""
+        return self.plan(table_name).apply(rows)
+
+    def mask_rows(
+        self, table_name: str, rows: Iterable[Row]
+    ) -> Iterator[Dict[str, Any]]:
+        """Streams masked rows, masking ``batch_size`` rows at a time."""
+        plan = self.plan(table_name)
+        batch: List[Row] = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= self.batch_size:
+                yield from plan.apply(batch)
+                batch = []
+        if batch:
+            yield from plan.apply(batch)
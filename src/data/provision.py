@@ -0,0 +1,69 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+from sqlalchemy.engine import Engine
+
+from .generator import SchemaGenerator
+from .registry import SchemaRegistry
+
+
+def _execute_table(engine: Engine, statements: List[str]) -> None:
+    """Run one table's statements in their own transaction on a pooled connection."""
+    with engine.begin() as conn:
+        for statement in statements:
+            conn.exec_driver_sql(statement.rstrip(";"))
+
+
+def apply_ddl_levels(
+    engine: Engine,
+    levels: List[Dict[str, List[str]]],
+    max_workers: Optional[int] = None,
+) -> None:
+    """
+    Applies DDL produced by SchemaGenerator.generate_ddl_levels.
+
+    Levels run one after another; the tables inside a level are created
+    concurrently, each on its own connection from the engine's pool. Size
+    the pool (pool_size/max_overflow) to at least ``max_workers``. If any
+    table in a level fails, the remaining tables of that level still finish
+    and the first error is raised before the next level starts.
+    """
+    for level in levels:
+        if not level:
+            continue
+        workers = min(max_workers or len(level), len(level))
+        if workers == 1:
+            for statements in level.values():
+                _execute_table(engine, statements)
+            continue
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_execute_table, engine, statements)
+                for statements in level.values()
+            ]
+        # Leaving the executor waits for every table of the level
+        for future in futures:
+            future.result()
+
+
+def provision(
+    registry: SchemaRegistry,
+    engine: Engine,
+    generator: Optional[SchemaGenerator] = None,
+    max_workers: Optional[int] = None,
+) -> List[Dict[str, List[str]]]:
+    """
+    Creates every registered table, one dependency level at a time.
+    Returns the applied DDL grouped by level.
+    """
+    generator = generator or SchemaGenerator(
+        dialect=engine.dialect,
+        resolved_columns=registry.resolve_all(strict=False),
+        enums=registry.enums(),
+    )
+    levels = generator.generate_ddl_levels(
+        registry.dependency_levels(), max_workers=max_workers
+    )
+    apply_ddl_levels(engine, levels, max_workers=max_workers)
+    return levels
@@ -1,28 +1,268 @@
-from typing import Dict, Optional, List
+import heapq
+import os
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, Mapping, Optional, List, Set, Tuple
 from pathlib import Path
-from .schema import TableSchema, DataType
+from .schema import ColumnSchema, ResolvedColumn, TableSchema, DataType
 from .storage import YAMLStorage
+from .cache import FileStamp, SchemaCache, file_digest
+from .enums import EnumRegistry
+from .generator import SchemaGenerator
+from .pool import process_pool
+
+# Directories with at least this many schema files are parsed in a process pool
+# unless the caller explicitly asks for the serial path.
+PARALLEL_LOAD_THRESHOLD = 256
+
+# Per-process storage used by pool workers, created on first use.
+_worker_storage: Optional[YAMLStorage] = None
+
+
+class SchemaLoadError(Exception):
+    """Raised when one or more schema files fail to load in parallel mode."""
+
+    def __init__(self, errors: Dict[Path, str]):
+        self.errors = errors
+        details = "; ".join(f"{path}: {message}" for path, message in errors.items())
+        super().__init__(f"Failed to load {len(errors)} schema file(s): {details}")
+
+
+@dataclass
+class _SourceFile:
+    """File state a group of registered tables was loaded from."""
+
+    mtime_ns: int
+    size: int
+    digest: Optional[str]
+    tables: List[str]
+
+
+@dataclass
+class ReloadResult:
+    """Outcome of an incremental SchemaRegistry.reload_directory call."""
+
+    added: List[Path] = field(default_factory=list)
+    changed: List[Path] = field(default_factory=list)
+    removed: List[Path] = field(default_factory=list)
+    tables: Set[str] = field(default_factory=set)
+    errors: Dict[Path, str] = field(default_factory=dict)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.changed or self.removed)
+
+
+def _schemas_from_data(data: Any) -> List[TableSchema]:
+    """Validate parsed YAML content into TableSchema objects."""
+    # Ensure we handle both single schema dicts and lists of schemas
+    if isinstance(data, list):
+        return [TableSchema(**item) for item in data]
+    if isinstance(data, dict):
+        return [TableSchema(**data)]
+    return []
+
+
+def _parse_schema_file(
+    file_path: Path,
+) -> Tuple[Optional[List[TableSchema]], Optional[str]]:
+    """
+    Process-pool worker: parse and validate a single schema file.
+    Errors are returned as strings so every failure can be reported together.
+    """
+    global _worker_storage
+    if _worker_storage is None:
+        _worker_storage = YAMLStorage()
+    try:
+        return _schemas_from_data(_worker_storage.load(file_path, fast=True)), None
+    except Exception as e:
+        return None, f"{type(e).__name__}: {e}"
+
+
+class _ResolvedColumns(Mapping[Tuple[str, str], ResolvedColumn]):
+    """
+    Read-only view of SchemaRegistry.resolve_target_column, for generators
+    that only need a few lookups. Unresolvable columns are missing.
+    """
+
+    def __init__(self, registry: "SchemaRegistry"):
+        self._registry = registry
+
+    def __getitem__(self, key: Tuple[str, str]) -> ResolvedColumn:
+        if key not in self._registry._columns:
+            raise KeyError(key)
+        try:
+            return self._registry.resolve_target_column(*key)
+        except ValueError:
+            raise KeyError(key) from None
+
+    def __iter__(self) -> Iterator[Tuple[str, str]]:
+        return iter(self._registry._columns)
+
+    def __len__(self) -> int:
+        return len(self._registry._columns)
 
 
 class SchemaRegistry:
     """
     Central registry for all table schemas.
     Handles registration, retrieval, and dependency resolution for schema definitions.
+
+    The registry can be shared between threads: changes and reads of more
+    than a single table take one lock, so a reload by a SchemaWatcher is seen
+    either entirely or not at all.
     """
 
     def __init__(self):
         self._schemas: Dict[str, TableSchema] = {}
+        self._columns: Dict[Tuple[str, str], ColumnSchema] = {}
+        # Foreign key graph: table -> tables it references, and the reverse.
+        # Edges to tables that are not registered (yet) are kept as well.
+        self._dependencies: Dict[str, Set[str]] = {}
+        self._dependents: Dict[str, Set[str]] = {}
         self._storage = YAMLStorage()
+        self._sources: Dict[Path, _SourceFile] = {}
+        self._failed_sources: Dict[Path, Tuple[int, int]] = {}
+        self._lock = threading.RLock()
+        # Derived state, invalidated per table by _invalidate()
+        self._ordered_cache: Optional[List[TableSchema]] = None
+        self._levels_cache: Optional[List[List[TableSchema]]] = None
+        self._enums_cache: Optional[EnumRegistry] = None
+        self._resolved: Dict[str, Dict[str, ResolvedColumn]] = {}
+        self._validation_cache: Dict[str, List[str]] = {}
+        self._ddl_cache: Dict[str, str] = {}
+        self._generator = SchemaGenerator(resolved_columns=_ResolvedColumns(self))
 
     def register(self, schema: TableSchema) -> None:
         """Register a new table schema."""
-        if schema.name in self._schemas:
-            raise ValueError(f"Schema for table '{schema.name}' already exists")
-        self._schemas[schema.name] = schema
+        with self._lock:
+            if schema.name in self._schemas:
+                raise ValueError(f"Schema for table '{schema.name}' already exists")
+            self._schemas[schema.name] = schema
+            dependencies: Set[str] = set()
+            for col in schema.columns:
+                self._columns.setdefault((schema.name, col.name), col)
+                # Self-references don't constrain creation order, the table can be
+                # created first and the constraint resolved against itself.
+                if (
+                    col.data_type == DataType.REFERENCE
+                    and col.reference_table
+                    and col.reference_table != schema.name
+                ):
+                    dependencies.add(col.reference_table)
+            self._dependencies[schema.name] = dependencies
+            for dep in dependencies:
+                self._dependents.setdefault(dep, set()).add(schema.name)
+            self._invalidate([schema.name])
+
+    def unregister(self, name: str) -> None:
+        """Remove a table schema from the registry."""
+        with self._lock:
+            if name not in self._schemas:
+                raise ValueError(f"Schema for table '{name}' does not exist")
+            self._invalidate([name])
+            schema = self._schemas.pop(name)
+            for col in schema.columns:
+                self._columns.pop((name, col.name), None)
+            for dep in self._dependencies.pop(name):
+                dependents = self._dependents[dep]
+                dependents.discard(name)
+                if not dependents:
+                    del self._dependents[dep]
 
     def clear(self) -> None:
         """Clear all registered schemas."""
-        self._schemas.clear()
+        with self._lock:
+            self._schemas.clear()
+            self._columns.clear()
+            self._dependencies.clear()
+            self._dependents.clear()
+            self._sources.clear()
+            self._failed_sources.clear()
+            self._ordered_cache = None
+            self._levels_cache = None
+            self._enums_cache = None
+            self._resolved.clear()
+            self._validation_cache.clear()
+            self._ddl_cache.clear()
+            self._generator = SchemaGenerator(resolved_columns=_ResolvedColumns(self))
+
+    def _invalidate(self, names: Iterable[str]) -> None:
+        """
+        Drop derived state for the given tables and every table that references
+        them, directly or through a chain of references.
+        """
+        self._ordered_cache = None
+        self._levels_cache = None
+        self._enums_cache = None
+        if not (self._resolved or self._validation_cache or self._ddl_cache):
+            # Nothing derived yet (e.g. during a bulk load), skip the graph walk
+            return
+
+        names = list(names)
+        enum_names = {
+            col.enum_name
+            for name in names
+            if name in self._schemas
+            for col in self._schemas[name].columns
+            if col.data_type == DataType.ENUM and col.enum_name
+        }
+        if enum_names:
+            # Tables sharing an enum may rely on this table's definition of it
+            names.extend(
+                schema.name
+                for schema in self._schemas.values()
+                if any(col.enum_name in enum_names for col in schema.columns)
+            )
+
+        for name in self._with_dependents(names):
+            self._resolved.pop(name, None)
+            self._validation_cache.pop(name, None)
+            self._ddl_cache.pop(name, None)
+            table = self._generator.metadata.tables.get(name)
+            if table is not None:
+                self._generator.metadata.remove(table)
+
+    def _with_dependents(self, names: Iterable[str]) -> Set[str]:
+        """Return the given tables plus all tables that transitively reference them."""
+        affected: Set[str] = set()
+        stack = list(names)
+        while stack:
+            name = stack.pop()
+            if name in affected:
+                continue
+            affected.add(name)
+            stack.extend(self._dependents.get(name, ()))
+        return affected
+
+    def dependencies_of(self, table_name: str) -> List[str]:
+        """Names of the tables a table references (excluding itself), sorted."""
+        with self._lock:
+            if table_name not in self._schemas:
+                raise ValueError(f"Table '{table_name}' not found in registry")
+            return sorted(self._dependencies[table_name])
+
+    def dependents_of(self, table_name: str) -> List[str]:
+        """Names of the registered tables that reference a table, sorted."""
+        with self._lock:
+            return sorted(self._dependents.get(table_name, ()))
+
+    def _record_source(
+        self,
+        file_path: Path,
+        schemas: List[TableSchema],
+        stamp: Optional[FileStamp] = None,
+    ) -> None:
+        """Remember which tables came from a file so reloads can diff against it."""
+        stat = file_path.stat()
+        digest = None
+        if stamp is not None and (stamp.mtime_ns, stamp.size) == (
+            stat.st_mtime_ns,
+            stat.st_size,
+        ):
+            digest = stamp.digest
+        self._sources[file_path] = _SourceFile(
+            stat.st_mtime_ns, stat.st_size, digest, [s.name for s in schemas]
+        )
 
     def get_schema(self, name: str) -> Optional[TableSchema]:
         """Retrieve a schema by table name."""
@@ -30,147 +270,525 @@ class SchemaRegistry:
 
     def list_schemas(self) -> List[TableSchema]:
         """List all registered schemas."""
-        return list(self._schemas.values())
+        with self._lock:
+            return list(self._schemas.values())
 
-    def load_from_directory(self, directory: Path | str) -> None:
+    def get_column(self, table_name: str, column_name: str) -> Optional[ColumnSchema]:
+        """Retrieve a column by table and column name."""
+        return self._columns.get((table_name, column_name))
+
+    def load_from_directory(
+        self,
+        directory: Path | str,
+        parallel: Optional[bool] = None,
+        max_workers: Optional[int] = None,
+        cache: Optional[SchemaCache] = None,
+    ) -> None:
         """
         Load all YAML schema definitions from a directory.
         Expects files to be valid YAML matching the TableSchema structure.
+
+        When ``parallel`` is True, file parsing and TableSchema validation are
+        fanned out over a process pool and every failing file is reported
+        together in a single SchemaLoadError. Left as None, the parallel path
+        is only used for directories with at least PARALLEL_LOAD_THRESHOLD files.
+        Files are always registered in sorted path order, each file's tables
+        together or not at all.
+
+        If a SchemaCache is given, unchanged files are served from it and only
+        new or edited files are parsed; the cache is saved before returning.
+        """
+        with self._lock:
+            directory = Path(directory)
+            if not directory.exists():
+                raise FileNotFoundError(f"Directory not found: {directory}")
+
+            # Support both .yaml and .yml extensions
+            files = sorted([*directory.glob("*.yaml"), *directory.glob("*.yml")])
+
+            cached: Dict[Path, List[TableSchema]] = {}
+            stamps: Dict[Path, FileStamp] = {}
+            if cache is not None:
+                cache.prune(directory, files)
+                for file_path in files:
+                    schemas, stamp = cache.lookup(file_path)
+                    if schemas is not None:
+                        cached[file_path] = schemas
+                    elif stamp is not None:
+                        stamps[file_path] = stamp
+            pending = [f for f in files if f not in cached]
+
+            if parallel is None:
+                parallel = len(pending) >= PARALLEL_LOAD_THRESHOLD
+
+            try:
+                if parallel:
+                    self._load_files_parallel(files, cached, stamps, cache, max_workers)
+                    return
+
+                for file_path in files:
+                    try:
+                        schemas = cached.get(file_path)
+                        if schemas is None:
+                            data = self._storage.load(file_path, fast=True)
+                            schemas = _schemas_from_data(data)
+                            if cache is not None:
+                                cache.store(file_path, stamps[file_path], schemas)
+                        self._register_file(schemas)
+                        self._record_source(file_path, schemas, stamps.get(file_path))
+                    except Exception as e:
+                        # We log/print here but might want to aggregate errors in the future
+                        print(f"Failed to load schema from {file_path}: {e}")
+                        raise e
+            finally:
+                if cache is not None:
+                    cache.save()
+
+    def _load_files_parallel(
+        self,
+        files: List[Path],
+        cached: Dict[Path, List[TableSchema]],
+        stamps: Dict[Path, FileStamp],
+        cache: Optional[SchemaCache],
+        max_workers: Optional[int] = None,
+    ) -> None:
+        """Parse uncached files in a process pool, then register in file order."""
+        pending = [f for f in files if f not in cached]
+        errors: Dict[Path, str] = {}
+        parsed: Dict[Path, List[TableSchema]] = {}
+
+        if pending:
+            workers = min(max_workers or os.cpu_count() or 1, len(pending))
+            chunksize = max(1, len(pending) // (workers * 4))
+            with process_pool(workers) as executor:
+                # map() yields results in submission order, keeping the merge deterministic
+                results = executor.map(_parse_schema_file, pending, chunksize=chunksize)
+                for file_path, (schemas, error) in zip(pending, results):
+                    if error is not None:
+                        errors[file_path] = error
+                        continue
+                    parsed[file_path] = schemas or []
+                    if cache is not None:
+                        cache.store(file_path, stamps[file_path], parsed[file_path])
+
+        for file_path in files:
+            if file_path in errors:
+                continue
+            schemas = cached.get(file_path) or parsed.get(file_path, [])
+            try:
+                self._register_file(schemas)
+            except ValueError as e:
+                errors[file_path] = str(e)
+                continue
+            self._record_source(file_path, schemas, stamps.get(file_path))
+
+        if errors:
+            raise SchemaLoadError(dict(sorted(errors.items())))
+
+    def _register_file(self, schemas: List[TableSchema]) -> None:
+        """
+        Registers the tables of one file, or none of them: every name is
+        checked for a clash before the first table is registered.
+        """
+        names: Set[str] = set()
+        for schema in schemas:
+            if schema.name in self._schemas or schema.name in names:
+                raise ValueError(f"Schema for table '{schema.name}' already exists")
+            names.add(schema.name)
+        for schema in schemas:
+            self.register(schema)
+
+    def reload_directory(self, directory: Path | str) -> ReloadResult:
+        """
+        Incrementally re-sync the registry with a schema directory.
+
+        Only files added, changed or removed since they were last loaded are
+        parsed, and only derived state (topological order, validation results
+        and generated DDL) of the affected tables and their dependents is
+        invalidated. Errors are collected per file in the result rather than
+        raised; a changed file that fails to parse, or that defines a table
+        another file already defines, keeps its previous tables and is retried
+        once it changes again.
         """
         directory = Path(directory)
         if not directory.exists():
             raise FileNotFoundError(f"Directory not found: {directory}")
 
-        # Support both .yaml and .yml extensions
-        files = list(directory.glob("*.yaml")) + list(directory.glob("*.yml"))
+        with self._lock:
+            result = ReloadResult()
+            files = sorted([*directory.glob("*.yaml"), *directory.glob("*.yml")])
+            present = set(files)
+            result.removed = sorted(
+                p for p in self._sources if p.parent == directory and p not in present
+            )
+
+            to_parse: Dict[Path, FileStamp] = {}
+            for file_path in files:
+                try:
+                    stat = file_path.stat()
+                except FileNotFoundError:
+                    # Deleted since the glob; picked up as removed next time
+                    continue
+                state = (stat.st_mtime_ns, stat.st_size)
+                source = self._sources.get(file_path)
+                if source is not None and (source.mtime_ns, source.size) == state:
+                    continue
+                if self._failed_sources.get(file_path) == state:
+                    continue
+                digest = file_digest(file_path)
+                if source is not None and source.digest == digest:
+                    # Touched but not edited
+                    source.mtime_ns, source.size = state
+                    continue
+                to_parse[file_path] = FileStamp(*state, digest)
+                if source is None:
+                    result.added.append(file_path)
+                else:
+                    result.changed.append(file_path)
 
-        for file_path in files:
-            try:
-                data = self._storage.load(file_path)
-                # Ensure we handle both single schema dicts and lists of schemas
-                if isinstance(data, list):
-                    for item in data:
-                        self.register(TableSchema(**item))
-                elif isinstance(data, dict):
-                    self.register(TableSchema(**data))
-            except Exception as e:
-                # We log/print here but might want to aggregate errors in the future
-                print(f"Failed to load schema from {file_path}: {e}")
-                raise e
+            parsed: Dict[Path, List[TableSchema]] = {}
+            for file_path, stamp in to_parse.items():
+                try:
+                    data = self._storage.load(file_path, fast=True)
+                    parsed[file_path] = _schemas_from_data(data)
+                except Exception as e:
+                    result.errors[file_path] = f"{type(e).__name__}: {e}"
+
+            # Check for table name collisions before touching the registry,
+            # so a rejected file keeps its previous tables
+            for file_path, error in self._collisions(parsed, result.removed).items():
+                del parsed[file_path]
+                result.errors[file_path] = error
+            for file_path in result.errors:
+                stamp = to_parse[file_path]
+                self._failed_sources[file_path] = (stamp.mtime_ns, stamp.size)
+
+            # Drop old definitions first so tables can move between files
+            for file_path in [*result.removed, *parsed]:
+                self._failed_sources.pop(file_path, None)
+                source = self._sources.pop(file_path, None)
+                if source is None:
+                    continue
+                for name in source.tables:
+                    if name in self._schemas:
+                        self.unregister(name)
+                        result.tables.add(name)
+
+            for file_path, schemas in parsed.items():
+                for schema in schemas:
+                    self.register(schema)
+                stamp = to_parse[file_path]
+                names = [schema.name for schema in schemas]
+                self._sources[file_path] = _SourceFile(
+                    stamp.mtime_ns, stamp.size, stamp.digest, names
+                )
+                result.tables.update(names)
+
+            return result
+
+    def _collisions(
+        self, parsed: Dict[Path, List[TableSchema]], removed: List[Path]
+    ) -> Dict[Path, str]:
+        """
+        Files among ``parsed`` whose tables would clash with another table once
+        the reload is applied, with the error for each. A rejected file that
+        was loaded before keeps its previous tables, which may reject other
+        files in turn, so the check then starts over.
+        """
+        rejected: Dict[Path, str] = {}
+        while True:
+            taken = set(self._schemas)
+            for file_path in [*removed, *parsed]:
+                source = self._sources.get(file_path)
+                if source is not None and file_path not in rejected:
+                    taken.difference_update(source.tables)
+
+            restart = False
+            for file_path, schemas in parsed.items():
+                if file_path in rejected:
+                    continue
+                names: Set[str] = set()
+                for schema in schemas:
+                    if schema.name in taken or schema.name in names:
+                        rejected[file_path] = (
+                            f"Schema for table '{schema.name}' already exists"
+                        )
+                        break
+                    names.add(schema.name)
+                else:
+                    taken.update(names)
+                    continue
+                if file_path in self._sources:
+                    restart = True
+                    break
+            if not restart:
+                return rejected
 
     def resolve_target_datatype(self, table_name: str, column_name: str) -> DataType:
         """
         Resolves the actual physical DataType of a column.
-        If the column is a REFERENCE, it recursively looks up the target.
+        If the column is a REFERENCE, the reference chain is followed to the
+        first non-reference column.
         """
-        schema = self.get_schema(table_name)
-        if not schema:
-            raise ValueError(f"Table '{table_name}' not found in registry")
+        return self.resolve_target_column(table_name, column_name).column.data_type
 
-        # Find the column
-        target_col = next((c for c in schema.columns if c.name == column_name), None)
-        if not target_col:
-            raise ValueError(
-                f"Column '{column_name}' not found in table '{table_name}'"
-            )
+    def resolve_target_column(
+        self, table_name: str, column_name: str
+    ) -> ResolvedColumn:
+        """
+        Resolves the column that defines the physical type of a column, along
+        with the table that owns it (the last table on the reference chain).
 
-        # If it's a primitive, return it
-        if target_col.data_type != DataType.REFERENCE:
-            return target_col.data_type
+        Reference chains are walked iteratively and every column on the chain
+        is memoized, so each (table, column) pair is resolved at most once until
+        one of the tables involved changes. Raises ValueError for unknown
+        tables or columns and for reference cycles of any length.
+        """
+        with self._lock:
+            key = (table_name, column_name)
+            path: List[Tuple[str, str]] = []
+            on_path: Set[Tuple[str, str]] = set()
 
-        # If it's a reference, recurse
-        if not target_col.reference_table:
-            raise ValueError(
-                f"Column '{table_name}.{column_name}' is a REFERENCE but lacks reference_table"
-            )
+            while True:
+                table, column = key
+                resolved = self._resolved.get(table, {}).get(column)
+                if resolved is not None:
+                    break
 
-        ref_col_name = target_col.reference_column or "id"
+                if key in on_path:
+                    chain = " -> ".join(f"{t}.{c}" for t, c in [*path, key])
+                    raise ValueError(
+                        f"Circular reference detected on '{table}.{column}' ({chain})"
+                    )
 
-        # Prevent infinite recursion (basic check)
-        if target_col.reference_table == table_name:
-            raise ValueError(
-                f"Circular reference detected on '{table_name}.{column_name}'"
-            )
+                if table not in self._schemas:
+                    raise ValueError(f"Table '{table}' not found in registry")
+
+                target_col = self._columns.get(key)
+                if not target_col:
+                    raise ValueError(f"Column '{column}' not found in table '{table}'")
+
+                # If it's a primitive, the chain ends here
+                if target_col.data_type != DataType.REFERENCE:
+                    resolved = ResolvedColumn(table, target_col)
+                    path.append(key)
+                    break
+
+                if not target_col.reference_table:
+                    raise ValueError(
+                        f"Column '{table}.{column}' is a REFERENCE but lacks reference_table"
+                    )
+
+                path.append(key)
+                on_path.add(key)
+                key = (target_col.reference_table, target_col.reference_column or "id")
+
+            for table, column in path:
+                self._resolved.setdefault(table, {})[column] = resolved
+            return resolved
+
+    def resolve_all(self, strict: bool = True) -> Dict[Tuple[str, str], ResolvedColumn]:
+        """
+        Resolves every column in the registry in a single pass.
 
-        return self.resolve_target_datatype(target_col.reference_table, ref_col_name)
+        Returns a mapping of (table, column) to the column defining its physical
+        type and its table. Non-reference columns map to themselves. With ``strict`` set to
+        False, columns whose reference chain cannot be resolved are left out
+        instead of raising ValueError.
+        """
+        with self._lock:
+            resolved: Dict[Tuple[str, str], ResolvedColumn] = {}
+            for key in self._columns:
+                try:
+                    resolved[key] = self.resolve_target_column(*key)
+                except ValueError:
+                    if strict:
+                        raise
+            return resolved
+
+    def enums(self) -> EnumRegistry:
+        """
+        Returns the shared enum definitions of all registered tables.
+        Raises ValueError if an enum name is used with conflicting values.
+        """
+        with self._lock:
+            if self._enums_cache is None:
+                self._enums_cache = EnumRegistry.from_tables(self._schemas.values())
+            return self._enums_cache
 
     def validate(self) -> List[str]:
         """
         Validates the integrity of the registry.
         Returns a list of error messages (empty if valid).
+        Results are cached per table until the table or one it references changes.
         """
+        with self._lock:
+            errors = []
+            for table_name, schema in self._schemas.items():
+                table_errors = self._validation_cache.get(table_name)
+                if table_errors is None:
+                    table_errors = self._validate_schema(schema)
+                    self._validation_cache[table_name] = table_errors
+                errors.extend(table_errors)
+            try:
+                self.enums()
+            except ValueError as e:
+                errors.append(str(e))
+            return errors
+
+    def _validate_schema(self, schema: TableSchema) -> List[str]:
+        """Validate the references of a single table."""
         errors = []
-        for table_name, schema in self._schemas.items():
-            for col in schema.columns:
-                if col.data_type == DataType.REFERENCE:
-                    if not col.reference_table:
-                        errors.append(
-                            f"{table_name}.{col.name}: Missing reference_table"
-                        )
-                        continue
+        table_name = schema.name
+        for col in schema.columns:
+            if col.data_type == DataType.REFERENCE:
+                if not col.reference_table:
+                    errors.append(f"{table_name}.{col.name}: Missing reference_table")
+                    continue
 
-                    target_schema = self.get_schema(col.reference_table)
-                    if not target_schema:
-                        errors.append(
-                            f"{table_name}.{col.name}: References unknown table '{col.reference_table}'"
-                        )
-                        continue
+                if col.reference_table not in self._schemas:
+                    errors.append(
+                        f"{table_name}.{col.name}: References unknown table '{col.reference_table}'"
+                    )
+                    continue
 
-                    target_col_name = col.reference_column or "id"
-                    target_col = next(
-                        (c for c in target_schema.columns if c.name == target_col_name),
-                        None,
+                if self._schemas[col.reference_table].partition is not None:
+                    errors.append(
+                        f"{table_name}.{col.name}: References partitioned table "
+                        f"'{col.reference_table}'; MySQL does not support foreign "
+                        "keys to partitioned tables"
                     )
+                    continue
 
-                    if not target_col:
-                        errors.append(
-                            f"{table_name}.{col.name}: References unknown column '{target_col_name}' in '{col.reference_table}'"
-                        )
+                target_col_name = col.reference_column or "id"
+                target_col = self._columns.get((col.reference_table, target_col_name))
+
+                if not target_col:
+                    errors.append(
+                        f"{table_name}.{col.name}: References unknown column '{target_col_name}' in '{col.reference_table}'"
+                    )
         return errors
 
     def get_ordered_schemas(self) -> List[TableSchema]:
         """
         Returns schemas topologically sorted based on foreign key dependencies.
         Raises ValueError if a cycle is detected.
+        The order is cached until a table is registered or removed.
         """
-        visited = set()
-        temp_marked = set()
-        order = []
+        with self._lock:
+            if self._ordered_cache is None:
+                self._ordered_cache = self._sort_schemas()
+            return list(self._ordered_cache)
 
-        def visit(name: str):
-            if name in temp_marked:
-                raise ValueError(
-                    f"Circular dependency detected involving table '{name}'"
-                )
-            if name in visited:
-                return
+    def _sort_schemas(self) -> List[TableSchema]:
+        """
+        Kahn's algorithm over the foreign key graph. Independent tables are
+        emitted in name order so the result is deterministic.
+        """
+        # Only care about dependencies we know about
+        in_degree = {
+            name: sum(1 for dep in deps if dep in self._schemas)
+            for name, deps in self._dependencies.items()
+        }
+        ready = [name for name, degree in in_degree.items() if degree == 0]
+        heapq.heapify(ready)
 
-            temp_marked.add(name)
-            schema = self._schemas[name]
+        order: List[TableSchema] = []
+        while ready:
+            name = heapq.heappop(ready)
+            order.append(self._schemas[name])
+            for dependent in self._dependents.get(name, ()):
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    heapq.heappush(ready, dependent)
 
-            # Find dependencies (tables referenced by this table)
-            dependencies = set()
-            for col in schema.columns:
-                if col.data_type == DataType.REFERENCE and col.reference_table:
-                    # Self-references don't constrain creation order (usually handled by alter,
-                    # but here we just ignore for topological sort as we can create the table then add constraint.
-                    # However, strictly speaking, for CREATE TABLE, we need the parent first.)
-                    # If it's a self-reference, we don't treat it as a topological dependency
-                    # that must precede this table, because that's impossible.
-                    if col.reference_table != name:
-                        dependencies.add(col.reference_table)
+        if len(order) < len(self._schemas):
+            cycle = self._find_cycle({n for n, d in in_degree.items() if d > 0})
+            raise ValueError(
+                f"Circular dependency detected involving table '{cycle[0]}' "
+                f"({' -> '.join(cycle)})"
+            )
+        return order
 
-            for dep in dependencies:
-                if dep in self._schemas:  # Only care about dependencies we know about
-                    visit(dep)
+    def dependency_levels(self) -> List[List[TableSchema]]:
+        """
+        Groups schemas into foreign key dependency levels.
+        Level 0 holds tables without dependencies, and every table only
+        depends on tables in earlier levels, so all tables of a level can be
+        created concurrently. Tables within a level are sorted by name.
+        Raises ValueError if a cycle is detected.
+        """
+        with self._lock:
+            if self._levels_cache is None:
+                in_degree = {
+                    name: sum(1 for dep in deps if dep in self._schemas)
+                    for name, deps in self._dependencies.items()
+                }
+                current = sorted(
+                    name for name, degree in in_degree.items() if not degree
+                )
+                levels: List[List[TableSchema]] = []
+                placed = 0
+                while current:
+                    levels.append([self._schemas[name] for name in current])
+                    placed += len(current)
+                    following = []
+                    for name in current:
+                        for dependent in self._dependents.get(name, ()):
+                            in_degree[dependent] -= 1
+                            if in_degree[dependent] == 0:
+                                following.append(dependent)
+                    current = sorted(following)
 
-            temp_marked.remove(name)
-            visited.add(name)
-            order.append(schema)
+                if placed < len(self._schemas):
+                    cycle = self._find_cycle({n for n, d in in_degree.items() if d > 0})
+                    raise ValueError(
+                        f"Circular dependency detected involving table '{cycle[0]}' "
+                        f"({' -> '.join(cycle)})"
+                    )
+                self._levels_cache = levels
+            return [list(level) for level in self._levels_cache]
 
-        # Sort keys to ensure deterministic order for independent nodes
-        for name in sorted(self._schemas.keys()):
-            if name not in visited:
-                visit(name)
+    def _find_cycle(self, remaining: Set[str]) -> List[str]:
+        """
+        Return one dependency cycle among tables left over by the topological
+        sort. Every leftover table depends on another leftover table, so
+        following dependencies from any of them must revisit a table.
+        """
+        seen: Dict[str, int] = {}
+        path: List[str] = []
+        name = min(remaining)
+        while name not in seen:
+            seen[name] = len(path)
+            path.append(name)
+            name = min(d for d in self._dependencies[name] if d in remaining)
+        return path[seen[name] :] + [name]
 
-        return order
+    def get_table_ddl(self, name: str) -> str:
+        """
+        Returns the CREATE TABLE statement for a registered table.
+        The statement is cached until the table or one it references changes.
+        """
+        with self._lock:
+            ddl = self._ddl_cache.get(name)
+            if ddl is None:
+                schema = self.get_schema(name)
+                if not schema:
+                    raise ValueError(f"Table '{name}' not found in registry")
+                self._generator.enums = self.enums()
+                # Foreign keys are resolved against tables already in the metadata
+                for col in schema.columns:
+                    if col.data_type == DataType.REFERENCE and col.reference_table:
+                        target = self.get_schema(col.reference_table)
+                        if target is not None:
+                            self._generator.create_table_from_schema(target)
+                ddl = self._generator.generate_ddl([schema])
+                self._ddl_cache[name] = ddl
+            return ddl
+
+    def generate_ddl(self) -> str:
+        """Generates SQL DDL for all tables in dependency order, reusing cached statements."""
+        with self._lock:
+            return "\n\n".join(
+                self.get_table_ddl(schema.name) for schema in self.get_ordered_schemas()
+            )
@@ -0,0 +1,242 @@
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy import Table, delete, select, tuple_
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import SQLAlchemyError
+
+from .generator import SchemaGenerator
+from .registry import SchemaRegistry
+from .schema import DataType, PartitionType, RetentionPolicy, TableSchema
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+class RetentionError(Exception):
+    """
+    Raised by RetentionEngine.purge when one or more tables could not be
+    purged. The other tables were purged; ``deleted`` holds their counts.
+    """
+
+    def __init__(self, errors: Dict[str, str], deleted: Dict[str, int]):
+        self.errors = errors
+        self.deleted = deleted
+        details = "; ".join(f"{table}: {message}" for table, message in errors.items())
+        super().__init__(f"Failed to purge {len(errors)} table(s): {details}")
+
+
+def retention_column(schema: TableSchema) -> Optional[str]:
+    """
+    The indexed TIMESTAMP column used to date a table's rows.
+
+    Uses ``retention_column`` when set, otherwise a TIMESTAMP column the table
+    is range partitioned on, otherwise the first TIMESTAMP column that leads
+    the primary key or a declared index.
+    """
+    if schema.retention_column:
+        return schema.retention_column
+
+    timestamps = {
+        col.name for col in schema.columns if col.data_type == DataType.TIMESTAMP
+    }
+    partition = schema.partition
+    if (
+        partition is not None
+        and partition.type == PartitionType.RANGE
+        and partition.columns[0] in timestamps
+    ):
+        return partition.columns[0]
+
+    leading = [col.name for col in schema.columns if col.primary_key][:1]
+    leading.extend(index.columns[0] for index in schema.indexes)
+    for name in leading:
+        if name in timestamps:
+            return name
+    return None
+
+
+class TokenBucket:
+    """
+    Rate limiter allowing ``rate`` units per second with bursts of up to
+    ``capacity`` units. The clock and sleep function are injectable for tests.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.capacity
+        self._updated = clock()
+
+    def acquire(self, amount: float) -> None:
+        """Block until ``amount`` units are available, then take them."""
+        now = self._clock()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+        self._tokens -= amount
+        if self._tokens < 0:
+            # Sleep off the debt; requests larger than the capacity still pass
+            self._sleep(-self._tokens / self.rate)
+
+
+class RetentionEngine:
+    """
+    Deletes rows that have outlived their table's retention policy.
+
+    Expired rows are removed in batches of at most ``batch_size``: the primary
+    keys of the oldest expired rows are selected through the indexed
+    retention column, then deleted by key, each batch in its own short
+    transaction so hot tables are never locked for long. ``rows_per_second``
+    caps the overall delete rate.
+
+    Policies:
+        30_days: rows older than 30 days are deleted.
+        fiscal_year: rows from before the start of the current fiscal year
+            (beginning in ``fiscal_year_start_month``) are deleted.
+    """
+
+    def __init__(
+        self,
+        registry: SchemaRegistry,
+        engine: Engine,
+        generator: Optional[SchemaGenerator] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        rows_per_second: Optional[float] = None,
+        fiscal_year_start_month: int = 1,
+        now: Callable[[], datetime] = datetime.now,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        if not 1 <= fiscal_year_start_month <= 12:
+            raise ValueError("fiscal_year_start_month must be between 1 and 12")
+        self.registry = registry
+        self.engine = engine
+        self.generator = generator or SchemaGenerator(
+            dialect=engine.dialect,
+            resolved_columns=registry.resolve_all(strict=False),
+            enums=registry.enums(),
+        )
+        self.batch_size = batch_size
+        self.fiscal_year_start_month = fiscal_year_start_month
+        self._now = now
+        self._throttle = (
+            TokenBucket(
+                rows_per_second,
+                capacity=max(rows_per_second, batch_size),
+                clock=clock,
+                sleep=sleep,
+            )
+            if rows_per_second
+            else None
+        )
+
+    def cutoff(
+        self, policy: RetentionPolicy, now: Optional[datetime] = None
+    ) -> Optional[datetime]:
+        """Rows dated before the returned time are expired; None keeps everything."""
+        now = now or self._now()
+        if policy == RetentionPolicy.THIRTY_DAYS:
+            return now - timedelta(days=30)
+        if policy == RetentionPolicy.FISCAL_YEAR:
+            start_year = now.year
+            if now.month < self.fiscal_year_start_month:
+                start_year -= 1
+            return datetime(start_year, self.fiscal_year_start_month, 1)
+        return None
+
+    def _table(self, schema: TableSchema) -> Table:
+        for col in schema.columns:
+            if col.data_type == DataType.REFERENCE and col.reference_table:
+                target = self.registry.get_schema(col.reference_table)
+                if target is not None:
+                    self.generator.create_table_from_schema(target)
+        return self.generator.create_table_from_schema(schema)
+
+    def purge_table(self, table_name: str, now: Optional[datetime] = None) -> int:
+        """Deletes a table's expired rows and returns how many were deleted."""
+        schema = self.registry.get_schema(table_name)
+        if schema is None:
+            raise ValueError(f"Table '{table_name}' not found in registry")
+        cutoff = self.cutoff(schema.retention, now)
+        if cutoff is None:
+            return 0
+
+        column_name = retention_column(schema)
+        if column_name is None:
+            raise ValueError(
+                f"Table '{table_name}' has no indexed TIMESTAMP column to apply "
+                f"its retention policy; set retention_column"
+            )
+        table = self._table(schema)
+        pk_columns = list(table.primary_key.columns)
+        if not pk_columns:
+            raise ValueError(f"Table '{table_name}' needs a primary key to be purged")
+
+        dated = table.c[column_name]
+        key = pk_columns[0] if len(pk_columns) == 1 else tuple_(*pk_columns)
+        find_expired = (
+            select(*pk_columns)
+            .where(dated < cutoff)
+            .order_by(dated)
+            .limit(self.batch_size)
+        )
+
+        deleted = 0
+        while True:
+            with self.engine.connect() as conn:
+                keys = conn.execute(find_expired).all()
+            if not keys:
+                break
+            # Wait outside any transaction so throttling never holds locks
+            if self._throttle is not None:
+                self._throttle.acquire(len(keys))
+            values = [k[0] for k in keys] if len(pk_columns) == 1 else keys
+            with self.engine.begin() as conn:
+                # Re-check the cutoff in case a row was updated meanwhile
+                result = conn.execute(
+                    delete(table).where(key.in_(values)).where(dated < cutoff)
+                )
+            deleted += result.rowcount
+            if len(keys) < self.batch_size:
+                break
+        return deleted
+
+    def purge(self, now: Optional[datetime] = None) -> Dict[str, int]:
+        """
+        Purges every table with a retention policy, referencing tables before
+        the tables they reference. Returns the rows deleted per table.
+
+        A table that fails, for example because rows of a table kept
+        indefinitely still reference its expired rows, does not stop the
+        others: every table is attempted and the failures are then raised
+        together in a RetentionError. Batches already deleted from a failing
+        table stay deleted.
+        """
+        now = now or self._now()
+        schemas: List[TableSchema] = [
+            schema
+            for schema in reversed(self.registry.get_ordered_schemas())
+            if schema.retention != RetentionPolicy.INDEFINITE
+        ]
+        deleted: Dict[str, int] = {}
+        errors: Dict[str, str] = {}
+        for schema in schemas:
+            try:
+                deleted[schema.name] = self.purge_table(schema.name, now)
+            except (ValueError, SQLAlchemyError) as e:
+                errors[schema.name] = f"{type(e).__name__}: {e}"
+        if errors:
+            raise RetentionError(errors, deleted)
+        return deleted
@@ -1,6 +1,8 @@
+import hashlib
 from enum import Enum
-from typing import List, Optional
-from pydantic import BaseModel, Field
+from functools import cached_property
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional, Self, Tuple
+from pydantic import BaseModel, Field, model_validator
 
 
 class DataType(str, Enum):
@@ -12,6 +14,9 @@ class DataType(str, Enum):
     JSON = "json"
     ENUM = "enum"
     REFERENCE = "reference"
+    TEXT = "text"
+    DECIMAL = "decimal"
+    UUID = "uuid"
 
 
 class DataCategory(str, Enum):
@@ -33,6 +38,27 @@ class RetentionPolicy(str, Enum):
     FISCAL_YEAR = "fiscal_year"
 
 
+class PartitionType(str, Enum):
+    RANGE = "range"
+    HASH = "hash"
+    KEY = "key"
+
+
+# Column types MySQL accepts in RANGE COLUMNS partitioning
+RANGE_COLUMN_TYPES = frozenset(
+    {
+        DataType.INTEGER,
+        DataType.BOOLEAN,
+        DataType.STRING,
+        DataType.TIMESTAMP,
+        DataType.UUID,
+    }
+)
+
+# Column types MySQL cannot hash with KEY partitioning
+KEY_UNSUPPORTED_TYPES = frozenset({DataType.TEXT, DataType.JSON})
+
+
 class TableUIHints(BaseModel):
     display_name: Optional[str] = Field(
         default=None, description="Human-readable name for the table"
@@ -56,6 +82,91 @@ class EnumSchema(BaseModel):
     )
 
 
+class IndexSchema(BaseModel):
+    name: Optional[str] = Field(
+        default=None,
+        description="Name of the index (derived from the table and columns if omitted)",
+    )
+    columns: List[str] = Field(
+        min_length=1, description="Indexed columns, in key order"
+    )
+    unique: bool = Field(default=False, description="Whether this is a unique index")
+    include: List[str] = Field(
+        default_factory=list,
+        description="Extra columns stored in the index so queries can be answered "
+        "from the index alone (appended to the key in MySQL, so not allowed on "
+        "unique indexes)",
+    )
+
+    @model_validator(mode="after")
+    def _check_include(self) -> "IndexSchema":
+        # MySQL has no INCLUDE clause: covered columns would become part of
+        # the unique key and weaken it
+        if self.unique and self.include:
+            raise ValueError(
+                "A unique index cannot include extra columns; declare a separate "
+                "non-unique covering index instead"
+            )
+        return self
+
+
+class PartitionSchema(BaseModel):
+    type: PartitionType = Field(description="Partitioning method")
+    columns: List[str] = Field(min_length=1, description="Partitioning columns")
+    boundaries: List[str] = Field(
+        default_factory=list,
+        description="RANGE only: ascending upper bounds (exclusive) of each "
+        "partition; a final partition takes everything above the last bound",
+    )
+    count: Optional[int] = Field(
+        default=None, ge=1, description="HASH/KEY only: number of partitions"
+    )
+
+    @model_validator(mode="after")
+    def _check_method_options(self) -> "PartitionSchema":
+        if self.type == PartitionType.RANGE:
+            if not self.boundaries:
+                raise ValueError("RANGE partitioning requires boundaries")
+            if self.count is not None:
+                raise ValueError("RANGE partitioning does not take a count")
+        else:
+            if self.count is None:
+                raise ValueError(
+                    f"{self.type.value.upper()} partitioning requires a count"
+                )
+            if self.boundaries:
+                raise ValueError(
+                    f"{self.type.value.upper()} partitioning does not take boundaries"
+                )
+        if self.type != PartitionType.KEY and len(self.columns) != 1:
+            raise ValueError(
+                f"{self.type.value.upper()} partitioning takes a single column"
+            )
+        return self
+
+    def check_column_type(self, column: str, data_type: DataType) -> None:
+        """
+        Raises ValueError if MySQL cannot partition by a column of this type.
+        HASH needs an integer expression; RANGE COLUMNS takes integer, string,
+        date-time and binary columns. KEY hashes any type but TEXT and JSON.
+        """
+        if self.type == PartitionType.HASH and data_type != DataType.INTEGER:
+            raise ValueError(
+                f"HASH partitioning requires an INTEGER column, '{column}' is "
+                f"{data_type.value.upper()}; use KEY partitioning instead"
+            )
+        if self.type == PartitionType.RANGE and data_type not in RANGE_COLUMN_TYPES:
+            raise ValueError(
+                f"RANGE partitioning does not support {data_type.value.upper()} "
+                f"column '{column}'"
+            )
+        if self.type == PartitionType.KEY and data_type in KEY_UNSUPPORTED_TYPES:
+            raise ValueError(
+                f"KEY partitioning does not support {data_type.value.upper()} "
+                f"column '{column}'"
+            )
+
+
 class ColumnSchema(BaseModel):
     name: str = Field(description="The name of the column")
     data_type: DataType = Field(description="The data type of the column")
@@ -81,6 +192,67 @@ class ColumnSchema(BaseModel):
     reference_column: Optional[str] = Field(
         default="id", description="Name of the column referenced in the target table"
     )
+    length: Optional[int] = Field(
+        default=None, ge=1, description="Maximum length of a STRING column"
+    )
+    fixed_length: bool = Field(
+        default=False,
+        description="Whether a STRING column always holds exactly `length` characters",
+    )
+    precision: Optional[int] = Field(
+        default=None,
+        ge=1,
+        le=65,
+        description="Total digits of a DECIMAL column (required for DECIMAL)",
+    )
+    scale: Optional[int] = Field(
+        default=None,
+        ge=0,
+        description="Digits after the decimal point of a DECIMAL column",
+    )
+    width: Optional[int] = Field(
+        default=None, description="Bit width of an INTEGER column (16, 32 or 64)"
+    )
+    sensitivity: Optional[DataSensitivity] = Field(
+        default=None,
+        description="Sensitivity of this column; defaults to the table's sensitivity",
+    )
+
+    @model_validator(mode="after")
+    def _check_type_options(self) -> "ColumnSchema":
+        if self.length is not None and self.data_type != DataType.STRING:
+            raise ValueError(f"Column {self.name}: length only applies to STRING")
+        if self.fixed_length and self.length is None:
+            raise ValueError(f"Column {self.name}: fixed_length requires a length")
+        if (
+            self.precision is not None or self.scale is not None
+        ) and self.data_type != DataType.DECIMAL:
+            raise ValueError(
+                f"Column {self.name}: precision and scale only apply to DECIMAL"
+            )
+        if self.data_type == DataType.DECIMAL and self.precision is None:
+            # A bare DECIMAL is DECIMAL(10, 0) in MySQL and rounds away every
+            # fractional digit
+            raise ValueError(f"Column {self.name}: DECIMAL requires a precision")
+        if self.scale is not None and (
+            self.precision is None or self.scale > self.precision
+        ):
+            raise ValueError(
+                f"Column {self.name}: scale requires a precision of at least the scale"
+            )
+        if self.width is not None:
+            if self.data_type != DataType.INTEGER:
+                raise ValueError(f"Column {self.name}: width only applies to INTEGER")
+            if self.width not in (16, 32, 64):
+                raise ValueError(f"Column {self.name}: width must be 16, 32 or 64")
+        return self
+
+
+class ResolvedColumn(NamedTuple):
+    """The column a reference chain ends at, with the table that owns it."""
+
+    table: str
+    column: ColumnSchema
 
 
 class TableSchema(BaseModel):
@@ -106,6 +278,10 @@ class TableSchema(BaseModel):
     retention: RetentionPolicy = Field(
         default=RetentionPolicy.INDEFINITE, description="Data retention policy"
     )
+    retention_column: Optional[str] = Field(
+        default=None,
+        description="TIMESTAMP column that dates each row for the retention policy",
+    )
     ui_hints: Optional[TableUIHints] = Field(
         default=None, description="UI rendering hints for the table"
     )
@@ -113,3 +289,140 @@ class TableSchema(BaseModel):
         default_factory=list,
         description="List of column groups that must be unique together",
     )
+    indexes: List[IndexSchema] = Field(
+        default_factory=list, description="Secondary indexes on the table"
+    )
+    partition: Optional[PartitionSchema] = Field(
+        default=None, description="How the table is partitioned"
+    )
+
+    @model_validator(mode="after")
+    def _check_retention_column(self) -> "TableSchema":
+        if self.retention_column is not None:
+            col = next(
+                (c for c in self.columns if c.name == self.retention_column), None
+            )
+            if col is None or col.data_type != DataType.TIMESTAMP:
+                raise ValueError(
+                    f"retention_column of {self.name} must name a TIMESTAMP column"
+                )
+        return self
+
+    @model_validator(mode="after")
+    def _check_indexes_and_partition(self) -> "TableSchema":
+        names = {col.name for col in self.columns}
+        for index in self.indexes:
+            for col_name in [*index.columns, *index.include]:
+                if col_name not in names:
+                    raise ValueError(
+                        f"Index on {self.name} refers to unknown column '{col_name}'"
+                    )
+            overlap = set(index.columns) & set(index.include)
+            if overlap:
+                raise ValueError(
+                    f"Index on {self.name} includes key columns: {sorted(overlap)}"
+                )
+
+        if self.partition is not None:
+            # MySQL does not support foreign keys on partitioned tables (see
+            # SchemaRegistry.validate for references to them)
+            references = [
+                col.name for col in self.columns if col.data_type == DataType.REFERENCE
+            ]
+            if references:
+                raise ValueError(
+                    f"Partitioned table {self.name} cannot have REFERENCE columns "
+                    f"{references}: MySQL does not support foreign keys on "
+                    "partitioned tables"
+                )
+            columns = {col.name: col for col in self.columns}
+            for col_name in self.partition.columns:
+                col = columns.get(col_name)
+                if col is None:
+                    raise ValueError(
+                        f"Partition of {self.name} refers to unknown column '{col_name}'"
+                    )
+                try:
+                    self.partition.check_column_type(col_name, col.data_type)
+                except ValueError as e:
+                    raise ValueError(f"Partition of {self.name}: {e}") from None
+            # MySQL requires every unique key to contain the partitioning columns
+            unique_keys = [
+                [col.name for col in self.columns if col.primary_key],
+                *([col.name] for col in self.columns if col.unique),
+                *self.composite_unique_constraints,
+                *(index.columns for index in self.indexes if index.unique),
+            ]
+            for key in unique_keys:
+                missing = [c for c in self.partition.columns if c not in key]
+                if key and missing:
+                    raise ValueError(
+                        f"Unique key ({', '.join(key)}) of {self.name} must include "
+                        f"partitioning columns {missing}"
+                    )
+        return self
+
+    @cached_property
+    def column_index(self) -> Dict[str, ColumnSchema]:
+        """
+        Name to column lookup, built on first access.
+        Rebuilt after ``columns`` is reassigned; call invalidate_column_index()
+        after mutating the column list in place.
+        """
+        index: Dict[str, ColumnSchema] = {}
+        for col in self.columns:
+            # First definition wins, matching a linear scan
+            index.setdefault(col.name, col)
+        return index
+
+    def get_column(self, name: str) -> Optional[ColumnSchema]:
+        """Retrieve a column by name."""
+        return self.column_index.get(name)
+
+    def fingerprint(
+        self, resolved: Optional[Mapping[Tuple[str, str], ResolvedColumn]] = None
+    ) -> str:
+        """
+        Stable SHA-256 fingerprint of the table definition.
+
+        ``resolved`` is the mapping returned by SchemaRegistry.resolve_all. When
+        given, the definition (and owning table) of the column each REFERENCE
+        column resolves to is folded in, so a change to a referenced type
+        changes the fingerprint of every table that depends on it.
+        """
+        digest = hashlib.sha256(self.model_dump_json().encode("utf-8"))
+        if resolved is not None:
+            for col in self.columns:
+                if col.data_type != DataType.REFERENCE:
+                    continue
+                target = resolved.get((self.name, col.name))
+                digest.update(b"\0")
+                if target is not None:
+                    digest.update(target.table.encode("utf-8") + b"\0")
+                    digest.update(target.column.model_dump_json().encode("utf-8"))
+        return digest.hexdigest()
+
+    def invalidate_column_index(self) -> None:
+        """Drop the cached column index."""
+        vars(self).pop("column_index", None)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name == "columns":
+            self.invalidate_column_index()
+
+    def model_copy(
+        self, *, update: Optional[Mapping[str, Any]] = None, deep: bool = False
+    ) -> Self:
+        # ``update`` bypasses __setattr__; the copy builds its own index
+        copy = super().model_copy(update=update, deep=deep)
+        copy.invalidate_column_index()
+        return copy
+
+    def __getstate__(self) -> Dict[Any, Any]:
+        # Pickles carry the fields only, the index is rebuilt on demand
+        state = super().__getstate__()
+        state["__dict__"] = {
+            k: v for k, v in state["__dict__"].items() if k != "column_index"
+        }
+        return state
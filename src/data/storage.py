@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import Any, Union
+from typing import Any, Optional, Union
 
 from ruamel.yaml import YAML, YAMLError
 
@@ -7,19 +7,27 @@ from ruamel.yaml import YAML, YAMLError
 class YAMLStorage:
     """
     Handles YAML file operations with comment preservation and YAML 1.2 support.
+
+    Round-trip loading keeps comments and quoting so edited data can be saved
+    back unchanged. Read-only callers can pass ``fast=True`` to ``load`` to use
+    the safe loader instead, which is backed by libyaml when ruamel.yaml.clib
+    is installed.
     """
 
     def __init__(self) -> None:
         self._yaml = YAML()
         self._yaml.preserve_quotes = True
         self._yaml.indent(mapping=2, sequence=4, offset=2)
+        self._safe_yaml: Optional[YAML] = None
 
-    def load(self, file_path: Union[str, Path]) -> Any:
+    def load(self, file_path: Union[str, Path], fast: bool = False) -> Any:
         """
         Load data from a YAML file.
 
         Args:
             file_path: Path to the YAML file.
+            fast: Use the C-accelerated safe loader. The result is made of plain
+                dicts and lists and cannot be saved back with comments intact.
 
         Returns:
             The parsed data structure.
@@ -32,9 +40,16 @@ class YAMLStorage:
         if not path.exists():
             raise FileNotFoundError(f"File not found: {path}")
 
+        yaml = self._yaml
+        if fast:
+            if self._safe_yaml is None:
+                # pure=False picks the libyaml-backed CParser when available
+                self._safe_yaml = YAML(typ="safe", pure=False)
+            yaml = self._safe_yaml
+
         with path.open("r", encoding="utf-8") as f:
             try:
-                return self._yaml.load(f)
+                return yaml.load(f)
             except YAMLError as e:
                 raise YAMLError(f"Failed to parse YAML file {path}: {e}") from e
 
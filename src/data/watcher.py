@@ -0,0 +1,115 @@
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from .registry import ReloadResult, SchemaRegistry
+
+try:
+    # Optional: event-driven watching on Linux
+    from inotify_simple import INotify, flags  # type: ignore
+except ImportError:
+    INotify = None
+    flags = None
+
+logger = logging.getLogger(__name__)
+
+
+class SchemaWatcher:
+    """
+    Background thread that keeps a SchemaRegistry in sync with a schema directory.
+
+    Uses inotify (via the optional inotify_simple package) when available and
+    falls back to polling every ``interval`` seconds. Each detected change runs
+    SchemaRegistry.reload_directory, so only edited files are re-parsed.
+    """
+
+    def __init__(
+        self,
+        registry: SchemaRegistry,
+        directory: Path | str,
+        interval: float = 0.5,
+        on_reload: Optional[Callable[[ReloadResult], None]] = None,
+        use_inotify: Optional[bool] = None,
+    ):
+        self.registry = registry
+        self.directory = Path(directory)
+        self.interval = interval
+        self.on_reload = on_reload
+        if use_inotify is None:
+            use_inotify = INotify is not None
+        elif use_inotify and INotify is None:
+            raise RuntimeError("inotify watching requires the inotify_simple package")
+        self.use_inotify = use_inotify
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start watching in a daemon thread."""
+        if self.running:
+            return
+        self._stop_event.clear()
+        target = self._watch_inotify if self.use_inotify else self._watch_polling
+        self._thread = threading.Thread(
+            target=target, name="schema-watcher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop watching and wait for the thread to exit."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def __enter__(self) -> "SchemaWatcher":
+        self.start()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+    def check(self) -> ReloadResult:
+        """Run a single reload and notify the callback if anything changed."""
+        result = self.registry.reload_directory(self.directory)
+        for file_path, error in result.errors.items():
+            logger.warning("Failed to reload schema from %s: %s", file_path, error)
+        if result and self.on_reload is not None:
+            self.on_reload(result)
+        return result
+
+    def _safe_check(self) -> None:
+        try:
+            self.check()
+        except Exception:
+            # Keep the watcher alive; the next change triggers another attempt
+            logger.exception("Schema reload failed for %s", self.directory)
+
+    def _watch_polling(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            self._safe_check()
+
+    def _watch_inotify(self) -> None:
+        assert INotify is not None and flags is not None
+        mask = (
+            flags.CREATE
+            | flags.MODIFY
+            | flags.CLOSE_WRITE
+            | flags.DELETE
+            | flags.MOVED_FROM
+            | flags.MOVED_TO
+        )
+        with INotify() as inotify:
+            inotify.add_watch(str(self.directory), mask)
+            timeout_ms = int(self.interval * 1000)
+            while not self._stop_event.is_set():
+                if not inotify.read(timeout=timeout_ms):
+                    continue
+                # Coalesce the burst of events an editor save produces
+                while inotify.read(timeout=50):
+                    pass
+                self._safe_check()
@@ -9,9 +9,18 @@ from src.models.workflow.node import (
     CompletionNode,
 )
 from src.models.workflow.edge import WorkflowEdge
+from src.models.workflow.graph import WorkflowGraph
 from src.models.workflow.enums import WorkflowNodeType
 from src.models.workflow.properties import ProcessProps, TriggerProps, EmptyProps
-from src.models.workflow.validation import validate_workflow
+from src.models.workflow.validation import (
+    validate_connectivity,
+    validate_structure,
+    validate_workflow,
+)
+from src.models.workflow.incremental import (
+    IncrementalWorkflowValidator,
+    ValidationDelta,
+)
 
 __all__ = [
     "WorkflowDefinition",
@@ -23,9 +32,14 @@ __all__ = [
     "JoinNode",
     "CompletionNode",
     "WorkflowEdge",
+    "WorkflowGraph",
     "WorkflowNodeType",
     "ProcessProps",
     "TriggerProps",
     "EmptyProps",
     "validate_workflow",
+    "validate_connectivity",
+    "validate_structure",
+    "IncrementalWorkflowValidator",
+    "ValidationDelta",
 ]
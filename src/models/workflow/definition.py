@@ -1,8 +1,10 @@
-from typing import List, Optional
+from functools import cached_property
+from typing import Any, Dict, List, Mapping, Optional, Self
 from uuid import UUID
 from pydantic import BaseModel, Field
 from src.models.workflow.node import WorkflowNode
 from src.models.workflow.edge import WorkflowEdge
+from src.models.workflow.graph import WorkflowGraph
 
 
 class WorkflowDefinition(BaseModel):
@@ -14,3 +16,35 @@ class WorkflowDefinition(BaseModel):
     )
     nodes: List[WorkflowNode] = Field(..., description="List of workflow nodes")
     edges: List[WorkflowEdge] = Field(..., description="List of workflow connections")
+
+    @cached_property
+    def graph(self) -> WorkflowGraph:
+        """
+        Adjacency index of the workflow, built on first access.
+        Rebuilt after ``nodes`` or ``edges`` is reassigned; call
+        invalidate_graph() after mutating either list in place.
+        """
+        return WorkflowGraph(self.nodes, self.edges)
+
+    def invalidate_graph(self) -> None:
+        """Drop the cached graph index."""
+        vars(self).pop("graph", None)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in ("nodes", "edges"):
+            self.invalidate_graph()
+
+    def model_copy(
+        self, *, update: Optional[Mapping[str, Any]] = None, deep: bool = False
+    ) -> Self:
+        # ``update`` bypasses __setattr__; the copy builds its own graph
+        copy = super().model_copy(update=update, deep=deep)
+        copy.invalidate_graph()
+        return copy
+
+    def __getstate__(self) -> Dict[Any, Any]:
+        # Pickles carry the fields only, the graph is rebuilt on demand
+        state = super().__getstate__()
+        state["__dict__"] = {k: v for k, v in state["__dict__"].items() if k != "graph"}
+        return state
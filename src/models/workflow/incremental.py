@@ -0,0 +1,519 @@
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from typing import Callable, Collection, Dict, Iterable, List, Optional, Set, Tuple
+from src.models.workflow.definition import WorkflowDefinition
+from src.models.workflow.edge import WorkflowEdge
+from src.models.workflow.enums import WorkflowNodeType
+from src.models.workflow.graph import strongly_connected_components
+from src.models.workflow.node import WorkflowNode
+from src.models.workflow.validation import (
+    NO_TRIGGER_ERROR,
+    cycle_error,
+    edge_error,
+    islands_error,
+    validate_structure,
+)
+
+# (source_id, target_id) of an edge
+_EdgeKey = Tuple[str, str]
+# Position of a strongly connected component in the maintained topological
+# order. Splitting a component extends its key, so the parts still sort
+# between the component's neighbours.
+_OrderKey = Tuple[int, ...]
+
+
+@dataclass
+class ValidationDelta:
+    """Errors that appeared and disappeared with an edit."""
+
+    added: Set[str] = field(default_factory=set)
+    removed: Set[str] = field(default_factory=set)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed)
+
+
+class IncrementalWorkflowValidator:
+    """
+    Keeps the validation state of a workflow up to date as it is edited.
+
+    The full validation runs once, when the validator is created. Each edit
+    made through the validator is applied to the WorkflowDefinition and then
+    only re-examines the part of the graph it can affect:
+
+        adding an edge: the nodes it newly reaches, and the nodes between
+            its ends in the topological order
+        removing an edge: the nodes downstream of it, and the cycle it
+            belonged to
+        adding or removing a node: its own edges
+
+    Cycles are found with a topological order of the strongly connected
+    components, kept up to date in the manner of Pearce and Kelly: an edge
+    that agrees with the order cannot close a cycle, and one that does not
+    is checked and repaired within the span of the order it crosses.
+
+    Edges and nodes are located through position indexes, so removing one
+    moves the last edge (or node) of the definition into its slot rather
+    than shifting the rest.
+
+    Each edit returns a ValidationDelta; ``errors`` always matches what
+    validate_connectivity would report. The structural rules depend on
+    dominators, which an edit can change anywhere, so structure_errors()
+    runs them in full when asked for.
+    """
+
+    def __init__(self, workflow: WorkflowDefinition):
+        self.workflow = workflow
+        graph = workflow.graph
+        ids = graph.node_ids
+
+        self._order: Dict[str, int] = dict(graph.positions)
+        self._succ: Dict[str, List[str]] = {
+            node_id: [ids[i] for i in graph.successor_indexes[pos]]
+            for node_id, pos in graph.positions.items()
+        }
+        self._pred: Dict[str, List[str]] = {
+            node_id: [ids[i] for i in graph.predecessor_indexes[pos]]
+            for node_id, pos in graph.positions.items()
+        }
+        self._self_loops: Counter[str] = Counter(
+            edge.source_id
+            for edge in workflow.edges
+            if edge.source_id == edge.target_id and edge.source_id in self._order
+        )
+        self._triggers: Set[str] = set(graph.triggers)
+        self._had_trigger = bool(self._triggers)
+
+        # Net count of each error added (+) or removed (-) by an edit
+        self._changes: Counter[str] = Counter()
+
+        self._edge_positions: Dict[_EdgeKey, List[int]] = {}
+        for i, edge in enumerate(workflow.edges):
+            key = (edge.source_id, edge.target_id)
+            self._edge_positions.setdefault(key, []).append(i)
+        # Keys of edges with a missing end, indexed by both of their ends
+        self._dangling: Set[_EdgeKey] = set()
+        self._dangling_at: Dict[str, Set[_EdgeKey]] = {}
+        self._edge_errors: Counter[str] = Counter()
+        for key in self._edge_positions:
+            if key[0] not in self._order or key[1] not in self._order:
+                self._add_dangling(key)
+
+        visited = graph.reachable_indexes()
+        self._reached: Set[str] = {ids[i] for i, seen in enumerate(visited) if seen}
+        self._unreachable: Set[str] = set(self._order) - self._reached
+        self._islands_message = self._islands_error()
+
+        self._component: Dict[str, int] = {}
+        self._components: Dict[int, Set[str]] = {}
+        self._next_component = 0
+        self._key: Dict[str, _OrderKey] = {}
+        components = strongly_connected_components(graph.successor_indexes)
+        for rank, members in enumerate(reversed(components)):
+            for i in members:
+                self._key[ids[i]] = (rank,)
+            if len(members) > 1 or ids[members[0]] in self._self_loops:
+                self._add_component({ids[i] for i in members})
+        self._next_key = len(components)
+
+    # Error reporting
+
+    @property
+    def errors(self) -> List[str]:
+        """Current errors, in the order validate_connectivity reports them."""
+        edges = self.workflow.edges
+        dangling = sorted(
+            position for key in self._dangling for position in self._edge_positions[key]
+        )
+        errors = [self._edge_error(edges[position]) for position in dangling]
+        if not self._triggers:
+            errors.append(NO_TRIGGER_ERROR)
+        if self._islands_message:
+            errors.append(self._islands_message)
+        cycles = [self._sorted(members) for members in self._components.values()]
+        cycles.sort(key=lambda members: self._order[members[0]])
+        errors.extend(cycle_error(members) for members in cycles)
+        return errors
+
+    def structure_errors(self) -> List[str]:
+        """Runs validate_structure on the workflow in its current state."""
+        return validate_structure(self.workflow)
+
+    def _sorted(self, node_ids: Iterable[str]) -> List[str]:
+        return sorted(node_ids, key=self._order.__getitem__)
+
+    def _edge_error(self, edge: WorkflowEdge) -> str:
+        return edge_error(edge, edge.source_id in self._order)
+
+    def _islands_error(self) -> Optional[str]:
+        if not self._unreachable:
+            return None
+        return islands_error(self._sorted(self._unreachable))
+
+    def _begin(self) -> None:
+        self._changes.clear()
+        self._had_trigger = bool(self._triggers)
+
+    def _finish(self, unreachable_changed: bool) -> ValidationDelta:
+        delta = ValidationDelta()
+        for message, change in self._changes.items():
+            if change > 0:
+                delta.added.add(message)
+            elif change < 0:
+                delta.removed.add(message)
+        if self._had_trigger and not self._triggers:
+            delta.added.add(NO_TRIGGER_ERROR)
+        elif self._triggers and not self._had_trigger:
+            delta.removed.add(NO_TRIGGER_ERROR)
+        if unreachable_changed:
+            message = self._islands_error()
+            if message != self._islands_message:
+                if self._islands_message:
+                    delta.removed.add(self._islands_message)
+                if message:
+                    delta.added.add(message)
+                self._islands_message = message
+        return delta
+
+    # Edge bookkeeping
+
+    def _count_edge_error(self, key: _EdgeKey, sign: int) -> None:
+        # Every edge with this key reports the same error
+        positions = self._edge_positions[key]
+        message = self._edge_error(self.workflow.edges[positions[0]])
+        before = self._edge_errors[message]
+        after = before + sign * len(positions)
+        if after:
+            self._edge_errors[message] = after
+        else:
+            del self._edge_errors[message]
+        if not before:
+            self._changes[message] += 1
+        elif not after:
+            self._changes[message] -= 1
+
+    def _add_dangling(self, key: _EdgeKey) -> None:
+        self._dangling.add(key)
+        for node_id in key:
+            self._dangling_at.setdefault(node_id, set()).add(key)
+        self._count_edge_error(key, 1)
+
+    def _remove_dangling(self, key: _EdgeKey) -> None:
+        self._count_edge_error(key, -1)
+        self._dangling.discard(key)
+        for node_id in key:
+            waiting = self._dangling_at.get(node_id)
+            if waiting is not None:
+                waiting.discard(key)
+                if not waiting:
+                    del self._dangling_at[node_id]
+
+    def _append_edge(self, edge: WorkflowEdge) -> None:
+        key = (edge.source_id, edge.target_id)
+        self._edge_positions.setdefault(key, []).append(len(self.workflow.edges))
+        self.workflow.edges.append(edge)
+
+    def _pop_edge(self, key: _EdgeKey) -> None:
+        # Removes the first edge with this key, moving the last edge into its slot
+        positions = self._edge_positions[key]
+        position = min(positions)
+        positions.remove(position)
+        if not positions:
+            del self._edge_positions[key]
+        edges = self.workflow.edges
+        last = edges.pop()
+        if position < len(edges):
+            edges[position] = last
+            moved = self._edge_positions[(last.source_id, last.target_id)]
+            moved[moved.index(len(edges))] = position
+
+    # Cycle bookkeeping
+
+    def _add_component(self, members: Set[str]) -> None:
+        component = self._next_component
+        self._next_component += 1
+        self._components[component] = members
+        for member in members:
+            self._component[member] = component
+        self._changes[cycle_error(self._sorted(members))] += 1
+
+    def _remove_component(self, component: int) -> Set[str]:
+        members = self._components.pop(component)
+        for member in members:
+            del self._component[member]
+        self._changes[cycle_error(self._sorted(members))] -= 1
+        return members
+
+    def _members(self, node_id: str) -> Collection[str]:
+        component = self._component.get(node_id)
+        return (node_id,) if component is None else self._components[component]
+
+    def _split_component(self, component: int) -> None:
+        # Recompute the strongly connected components within the old one and
+        # order them below its key
+        members = self._sorted(self._remove_component(component))
+        positions = {node_id: i for i, node_id in enumerate(members)}
+        successors = [
+            [positions[t] for t in self._succ[node_id] if t in positions]
+            for node_id in members
+        ]
+        found = strongly_connected_components(successors)
+        key = self._key[members[0]]
+        for rank, part in enumerate(reversed(found)):
+            part_key = key if len(found) == 1 else (*key, rank)
+            for i in part:
+                self._key[members[i]] = part_key
+            if len(part) > 1 or self._self_loops[members[part[0]]]:
+                self._add_component({members[i] for i in part})
+
+    def _region(
+        self,
+        start: str,
+        neighbors: Dict[str, List[str]],
+        within: Callable[[_OrderKey], bool],
+    ) -> Dict[_OrderKey, Collection[str]]:
+        """
+        Components reachable from the one holding ``start`` along
+        ``neighbors``, without passing through any whose key is not
+        ``within`` bounds. Returns their members by key.
+        """
+        region = {self._key[start]: self._members(start)}
+        stack = [self._key[start]]
+        while stack:
+            for node_id in region[stack.pop()]:
+                for neighbor in neighbors[node_id]:
+                    key = self._key[neighbor]
+                    if key not in region and within(key):
+                        region[key] = self._members(neighbor)
+                        stack.append(key)
+        return region
+
+    def _reorder(self, source: str, target: str) -> None:
+        """
+        Restores the topological order after adding an edge from ``source``
+        to ``target`` that goes against it, merging the components on any
+        cycle the edge closes.
+        """
+        upper, lower = self._key[source], self._key[target]
+        # Only components between the two keys can lie on a path from target
+        # back to source
+        forward = self._region(target, self._succ, lambda key: key <= upper)
+        backward = self._region(source, self._pred, lambda key: key >= lower)
+        cycle = forward.keys() & backward.keys()
+
+        # Everything that reaches source moves before everything target
+        # reaches, reusing the keys the region already held
+        keys = sorted(forward.keys() | backward.keys())
+        before = sorted(backward.keys() - cycle)
+        after = sorted(forward.keys() - cycle)
+        for key, old in zip(keys, before):
+            for member in backward[old]:
+                self._key[member] = key
+        for key, old in zip(keys[len(keys) - len(after) :], after):
+            for member in forward[old]:
+                self._key[member] = key
+        if not cycle:
+            return
+
+        merged: Set[str] = set()
+        for old in cycle:
+            merged.update(forward[old])
+        for component in {self._component.get(n) for n in merged} - {None}:
+            assert component is not None
+            self._remove_component(component)
+        cycle_key = keys[len(before)]
+        for member in merged:
+            self._key[member] = cycle_key
+        self._add_component(merged)
+
+    # Reachability bookkeeping
+
+    def _reach_from(self, start: str) -> None:
+        # Mark everything newly reachable from ``start``
+        self._reached.add(start)
+        self._unreachable.discard(start)
+        queue = deque([start])
+        while queue:
+            for neighbor in self._succ[queue.popleft()]:
+                if neighbor not in self._reached:
+                    self._reached.add(neighbor)
+                    self._unreachable.discard(neighbor)
+                    queue.append(neighbor)
+
+    def _recheck_reach(self, start: str) -> bool:
+        """
+        Re-derives reachability below ``start`` after one of its incoming
+        paths was cut. Returns whether any node became unreachable.
+        """
+        # Only nodes downstream of start can have lost their path
+        region = {start}
+        queue = deque([start])
+        while queue:
+            for neighbor in self._succ[queue.popleft()]:
+                if neighbor in self._reached and neighbor not in region:
+                    region.add(neighbor)
+                    queue.append(neighbor)
+
+        # Re-enter the region wherever a path from outside still leads in
+        reached: Set[str] = set()
+        for node_id in region:
+            if node_id in self._triggers or any(
+                p in self._reached and p not in region for p in self._pred[node_id]
+            ):
+                reached.add(node_id)
+        queue = deque(reached)
+        while queue:
+            for neighbor in self._succ[queue.popleft()]:
+                if neighbor in region and neighbor not in reached:
+                    reached.add(neighbor)
+                    queue.append(neighbor)
+
+        lost = region - reached
+        self._reached -= lost
+        self._unreachable |= lost
+        return bool(lost)
+
+    def _link(self, source: str, target: str) -> bool:
+        self._succ[source].append(target)
+        self._pred[target].append(source)
+
+        if source == target:
+            self._self_loops[source] += 1
+            if source not in self._component:
+                self._add_component({source})
+        elif self._key[source] > self._key[target]:
+            self._reorder(source, target)
+
+        if source in self._reached and target not in self._reached:
+            self._reach_from(target)
+            return True
+        return False
+
+    def _unlink(self, source: str, target: str) -> bool:
+        self._succ[source].remove(target)
+        self._pred[target].remove(source)
+
+        if source == target:
+            self._self_loops[source] -= 1
+            component = self._component[source]
+            if not self._self_loops[source] and len(self._components[component]) == 1:
+                self._remove_component(component)
+            return False
+
+        if target in self._succ[source]:
+            # A parallel edge still connects the two nodes
+            return False
+        component = self._component.get(source)
+        if component is not None and component == self._component.get(target):
+            self._split_component(component)
+        if target in self._reached and target not in self._triggers:
+            return self._recheck_reach(target)
+        return False
+
+    # Edits
+
+    def add_node(self, node: WorkflowNode) -> ValidationDelta:
+        """Adds a node to the workflow."""
+        if node.id in self._order:
+            raise ValueError(f"Node {node.id} already exists")
+        self._begin()
+        # Edges waiting for this node report a different error, or connect
+        waiting = self._dangling_at.get(node.id, set()).copy()
+        for key in waiting:
+            self._remove_dangling(key)
+
+        self.workflow.nodes.append(node)
+        self.workflow.invalidate_graph()
+        self._order[node.id] = len(self.workflow.nodes) - 1
+        self._key[node.id] = (self._next_key,)
+        self._next_key += 1
+        self._succ[node.id] = []
+        self._pred[node.id] = []
+        self._unreachable.add(node.id)
+        if node.type == WorkflowNodeType.TRIGGER:
+            self._triggers.add(node.id)
+            self._reach_from(node.id)
+
+        for key in waiting:
+            source, target = key
+            if source in self._order and target in self._order:
+                for _ in self._edge_positions[key]:
+                    self._link(source, target)
+            else:
+                self._add_dangling(key)
+        return self._finish(True)
+
+    def remove_node(self, node_id: str) -> ValidationDelta:
+        """Removes a node and every edge to or from it."""
+        if node_id not in self._order:
+            raise ValueError(f"Node {node_id} does not exist")
+        self._begin()
+        keys = {(node_id, t) for t in self._succ[node_id]}
+        keys.update((p, node_id) for p in self._pred[node_id])
+        for key in keys:
+            for _ in range(len(self._edge_positions[key])):
+                self._pop_edge(key)
+                self._unlink(*key)
+        for key in self._dangling_at.get(node_id, set()).copy():
+            self._remove_dangling(key)
+            for _ in range(len(self._edge_positions[key])):
+                self._pop_edge(key)
+
+        nodes = self.workflow.nodes
+        position = self._order.pop(node_id)
+        last = nodes.pop()
+        if position < len(nodes):
+            nodes[position] = last
+            self._move_node(last.id, position)
+        self.workflow.invalidate_graph()
+
+        self._triggers.discard(node_id)
+        self._reached.discard(node_id)
+        self._unreachable.discard(node_id)
+        del self._succ[node_id], self._pred[node_id], self._key[node_id]
+        return self._finish(True)
+
+    def _move_node(self, node_id: str, position: int) -> None:
+        # A cycle's error lists its members in declaration order
+        component = self._component.get(node_id)
+        if component is None:
+            self._order[node_id] = position
+            return
+        members = self._remove_component(component)
+        self._order[node_id] = position
+        self._add_component(members)
+
+    def add_edge(self, edge: WorkflowEdge) -> ValidationDelta:
+        """Adds an edge to the workflow."""
+        self._begin()
+        key = (edge.source_id, edge.target_id)
+        if key in self._dangling:
+            self._remove_dangling(key)
+        self._append_edge(edge)
+        self.workflow.invalidate_graph()
+
+        changed = False
+        if edge.source_id in self._order and edge.target_id in self._order:
+            changed = self._link(edge.source_id, edge.target_id)
+        else:
+            self._add_dangling(key)
+        return self._finish(changed)
+
+    def remove_edge(self, source_id: str, target_id: str) -> ValidationDelta:
+        """Removes the first edge from ``source_id`` to ``target_id``."""
+        key = (source_id, target_id)
+        if key not in self._edge_positions:
+            raise ValueError(f"No edge from {source_id} to {target_id}")
+        self._begin()
+        dangling = key in self._dangling
+        if dangling:
+            self._remove_dangling(key)
+        self._pop_edge(key)
+        self.workflow.invalidate_graph()
+
+        changed = False
+        if not dangling:
+            changed = self._unlink(source_id, target_id)
+        elif key in self._edge_positions:
+            self._add_dangling(key)
+        return self._finish(changed)
@@ -1,78 +1,127 @@
-from typing import List, Set, Dict
+from typing import Iterable, List
 from src.models.workflow.definition import WorkflowDefinition
+from src.models.workflow.edge import WorkflowEdge
 from src.models.workflow.enums import WorkflowNodeType
+from src.models.workflow.graph import cycle_components
 
+NO_TRIGGER_ERROR = "Workflow must have at least one Trigger node"
+NO_COMPLETION_ERROR = "Workflow must have at least one Completion node"
 
-def validate_workflow(workflow: WorkflowDefinition) -> List[str]:
-    errors = []
 
-    # Check for missing use_case_id (Warning/Optional check)
-    if not workflow.use_case_id:
-        # Not strictly an error based on spec, but good to warn if intended to be validated
-        pass
+def edge_error(edge: WorkflowEdge, source_exists: bool) -> str:
+    """Error for an edge whose source (or, failing that, target) does not exist."""
+    if not source_exists:
+        return f"Edge source {edge.source_id} does not exist"
+    return f"Edge target {edge.target_id} does not exist"
+
 
-    # Build adjacency list for graph traversal
-    adj_list: Dict[str, List[str]] = {node.id: [] for node in workflow.nodes}
-    node_ids = set(adj_list.keys())
+def islands_error(node_ids: Iterable[str]) -> str:
+    return f"Unreachable nodes found (Islands): {', '.join(node_ids)}"
+
+
+def cycle_error(node_ids: Iterable[str]) -> str:
+    return f"Cycle detected involving nodes: {', '.join(node_ids)}"
+
+
+def validate_connectivity(workflow: WorkflowDefinition) -> List[str]:
+    """Checks edges, triggers, reachability from the triggers and cycles."""
+    errors = []
+    graph = workflow.graph
 
     # Verify edges connect existing nodes
-    for edge in workflow.edges:
-        if edge.source_id not in node_ids:
-            errors.append(f"Edge source {edge.source_id} does not exist")
-            continue
-        if edge.target_id not in node_ids:
-            errors.append(f"Edge target {edge.target_id} does not exist")
-            continue
-        adj_list[edge.source_id].append(edge.target_id)
+    for edge in graph.dangling_edges:
+        errors.append(edge_error(edge, edge.source_id in graph))
 
     # 1. Connectivity Check (Islands)
-    # Start BFS from all Trigger nodes
-    visited: Set[str] = set()
-    queue: List[str] = []
-
-    triggers = [n for n in workflow.nodes if n.type == WorkflowNodeType.TRIGGER]
-    if not triggers:
-        errors.append("Workflow must have at least one Trigger node")
-
-    for trigger in triggers:
-        if trigger.id not in visited:
-            queue.append(trigger.id)
-            visited.add(trigger.id)
-
-    while queue:
-        current = queue.pop(0)
-        for neighbor in adj_list.get(current, []):
-            if neighbor not in visited:
-                visited.add(neighbor)
-                queue.append(neighbor)
-
-    # Check for unreachable nodes
-    unreachable = node_ids - visited
+    # Breadth-first search from all Trigger nodes
+    if not graph.trigger_indexes:
+        errors.append(NO_TRIGGER_ERROR)
+
+    # Check for unreachable nodes, reported in declaration order
+    node_ids = graph.node_ids
+    visited = graph.reachable_indexes()
+    unreachable = [node_ids[i] for i, seen in enumerate(visited) if not seen]
     if unreachable:
-        errors.append(f"Unreachable nodes found (Islands): {', '.join(unreachable)}")
-
-    # 2. Cycle Detection (DFS)
-    recursion_stack: Set[str] = set()
-    cycle_visited: Set[str] = set()
+        errors.append(islands_error(unreachable))
 
-    def has_cycle(node_id: str) -> bool:
-        cycle_visited.add(node_id)
-        recursion_stack.add(node_id)
+    # 2. Cycle Detection (strongly connected components)
+    # Every cycle is reported, members and cycles in declaration order
+    cycles = sorted(
+        sorted(members)
+        for members in cycle_components(graph.successor_indexes, graph.self_loops)
+    )
+    for members in cycles:
+        errors.append(cycle_error(node_ids[i] for i in members))
 
-        for neighbor in adj_list.get(node_id, []):
-            if neighbor not in cycle_visited:
-                if has_cycle(neighbor):
-                    return True
-            elif neighbor in recursion_stack:
-                return True
+    return errors
 
-        recursion_stack.remove(node_id)
-        return False
 
-    for node_id in node_ids:
-        if node_id not in cycle_visited:
-            if has_cycle(node_id):
-                errors.append(f"Cycle detected involving node {node_id}")
-                break
+def validate_structure(workflow: WorkflowDefinition) -> List[str]:
+    """
+    Checks that every path ends in a Completion node, that Decision nodes
+    only have conditioned outgoing edges, and that Branch and Join nodes
+    pair up: a Branch's arms must first meet again at a Join (its immediate
+    post-dominator), and that Join's immediate dominator must be the Branch.
+    All checks share one dominator and one post-dominator computation.
+    """
+    errors = []
+    graph = workflow.graph
+    flow = graph.flow
+    node_ids = graph.node_ids
+    nodes = graph.nodes
+
+    # 3. Completion: every reachable node must be able to finish
+    if not flow.completion_indexes:
+        errors.append(NO_COMPLETION_ERROR)
+    else:
+        stuck = [
+            node_ids[i]
+            for i, (reached, completes) in enumerate(zip(flow.reached, flow.completes))
+            if reached and not completes
+        ]
+        if stuck:
+            errors.append(f"Nodes cannot reach a Completion node: {', '.join(stuck)}")
+
+    for i, node in enumerate(nodes):
+        # 4. Decisions choose between conditioned edges
+        if node.type == WorkflowNodeType.DECISION:
+            out_edges = graph.out_edges[i]
+            if not out_edges:
+                errors.append(f"Decision node {node.id} has no outgoing edges")
+            unconditioned = [
+                e.target_id
+                for e in out_edges
+                if not (e.condition and e.condition.strip())
+            ]
+            if unconditioned:
+                errors.append(
+                    f"Decision node {node.id} has outgoing edges without a "
+                    f"condition: {', '.join(unconditioned)}"
+                )
+
+        # 5. Branch/Join pairing, for nodes on a path from trigger to completion
+        if not (flow.reached[i] and flow.completes[i]):
+            continue
+        if node.type == WorkflowNodeType.BRANCH:
+            join = flow.ipdom[i]
+            if join == flow.virtual or nodes[join].type != WorkflowNodeType.JOIN:
+                errors.append(f"Branch node {node.id} has no matching Join node")
+        elif node.type == WorkflowNodeType.JOIN:
+            branch = flow.idom[i]
+            if (
+                branch == flow.virtual
+                or nodes[branch].type != WorkflowNodeType.BRANCH
+                or flow.ipdom[branch] != i
+            ):
+                errors.append(f"Join node {node.id} has no matching Branch node")
 
     return errors
+
+
+def validate_workflow(workflow: WorkflowDefinition) -> List[str]:
+    # Check for missing use_case_id (Warning/Optional check)
+    if not workflow.use_case_id:
+        # Not strictly an error based on spec, but good to warn if intended to be validated
+        pass
+
+    return validate_connectivity(workflow) + validate_structure(workflow)
@@ -0,0 +1,318 @@
+"""
+Benchmarks of the registry, the generators and workflow validation over
+synthetic inputs (see src/scripts/synthetic.py) at several scales.
+
+    python -m src.scripts.benchmark --scales 10 100 1000 --save baseline.json
+    python -m src.scripts.benchmark --baseline baseline.json --threshold 0.2
+
+Each benchmark records its best time over ``--repeats`` runs and its peak
+traced memory. With ``--baseline``, the run fails (exit status 1) when a
+time or peak exceeds the baseline by more than the threshold.
+"""
+
+import argparse
+import gc
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from src.data.generator import ProtobufGenerator
+from src.data.registry import SchemaRegistry
+from src.data.schema import TableSchema
+from src.models.workflow.definition import WorkflowDefinition
+from src.models.workflow.validation import validate_workflow
+from src.scripts.synthetic import (
+    SchemaSpec,
+    WorkflowSpec,
+    generate_tables,
+    generate_workflow,
+    write_schema_directory,
+)
+
+DEFAULT_SCALES = [10, 100, 1000, 10000]
+DEFAULT_REPEATS = 3
+DEFAULT_THRESHOLD = 0.2
+
+# Differences below these floors are noise, whatever the ratio
+MIN_SECONDS = 0.005
+MIN_PEAK_BYTES = 256 * 1024
+
+BASELINE_VERSION = 1
+
+
+@dataclass
+class Measurement:
+    """Result of one benchmark at one scale."""
+
+    name: str
+    scale: int
+    seconds: float
+    peak_bytes: int
+    error: Optional[str] = None
+
+    @property
+    def key(self) -> str:
+        return f"{self.name}[{self.scale}]"
+
+
+@dataclass
+class Regression:
+    """A metric that got worse than its baseline by more than the threshold."""
+
+    key: str
+    metric: str
+    baseline: float
+    current: float
+
+    def __str__(self) -> str:
+        change = (self.current / self.baseline - 1) if self.baseline else float("inf")
+        return (
+            f"{self.key} {self.metric}: {self.baseline:.6g} -> "
+            f"{self.current:.6g} (+{change:.0%})"
+        )
+
+
+def measure(
+    setup: Callable[[], Any], run: Callable[[Any], Any], repeats: int
+) -> Tuple[float, int]:
+    """
+    Returns the best wall time of ``run`` over ``repeats`` runs and its peak
+    traced memory, measured in one extra run so tracing does not skew the
+    timings. ``setup`` builds a fresh input for every run and is not measured.
+    """
+    best = float("inf")
+    for _ in range(repeats):
+        state = setup()
+        gc.collect()
+        start = time.perf_counter()
+        run(state)
+        best = min(best, time.perf_counter() - start)
+
+    state = setup()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        run(state)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return best, peak
+
+
+class BenchmarkSuite:
+    """
+    Runs the benchmarks at each scale, where the scale is the number of
+    tables or workflow nodes. Inputs are generated once per scale from
+    ``seed``; schema directories are written under ``workdir`` and reused
+    if they already exist there.
+
+    load_from_directory switches to a process pool for large directories;
+    memory used by the workers is not traced.
+    """
+
+    def __init__(
+        self,
+        scales: Iterable[int] = DEFAULT_SCALES,
+        repeats: int = DEFAULT_REPEATS,
+        workdir: Optional[Path | str] = None,
+        seed: int = 0,
+    ):
+        self.scales = list(scales)
+        self.repeats = repeats
+        self.seed = seed
+        self._tempdir: Optional[tempfile.TemporaryDirectory] = None
+        if workdir is None:
+            self._tempdir = tempfile.TemporaryDirectory(prefix="benchmark-")
+            self.workdir = Path(self._tempdir.name)
+        else:
+            self.workdir = Path(workdir)
+        self._tables: Dict[int, List[TableSchema]] = {}
+        self._workflows: Dict[int, WorkflowDefinition] = {}
+
+        self.benchmarks: Dict[
+            str, Tuple[Callable[[int], Any], Callable[[Any], Any]]
+        ] = {
+            "load_from_directory": (
+                self._schema_directory,
+                lambda directory: SchemaRegistry().load_from_directory(directory),
+            ),
+            "get_ordered_schemas": (
+                self._registry,
+                lambda registry: registry.get_ordered_schemas(),
+            ),
+            "generate_ddl": (self._registry, lambda registry: registry.generate_ddl()),
+            "generate_proto": (self._proto_input, self._generate_proto),
+            "validate_workflow": (self._workflow, validate_workflow),
+        }
+
+    def close(self) -> None:
+        if self._tempdir is not None:
+            self._tempdir.cleanup()
+            self._tempdir = None
+
+    def _schema_spec(self, scale: int) -> SchemaSpec:
+        return SchemaSpec(tables=scale, tables_per_file=10, seed=self.seed)
+
+    def _tables_for(self, scale: int) -> List[TableSchema]:
+        tables = self._tables.get(scale)
+        if tables is None:
+            tables = generate_tables(self._schema_spec(scale))
+            self._tables[scale] = tables
+        return tables
+
+    def _schema_directory(self, scale: int) -> Path:
+        directory = self.workdir / f"schemas-{scale}-seed{self.seed}"
+        if not directory.exists():
+            partial = directory.with_name(directory.name + ".partial")
+            write_schema_directory(self._schema_spec(scale), partial)
+            partial.rename(directory)
+        return directory
+
+    def _registry(self, scale: int) -> SchemaRegistry:
+        registry = SchemaRegistry()
+        for table in self._tables_for(scale):
+            registry.register(table)
+        return registry
+
+    def _proto_input(self, scale: int) -> Tuple[ProtobufGenerator, List[TableSchema]]:
+        registry = self._registry(scale)
+        generator = ProtobufGenerator(
+            resolved_columns=registry.resolve_all(strict=False)
+        )
+        return generator, registry.get_ordered_schemas()
+
+    @staticmethod
+    def _generate_proto(state: Tuple[ProtobufGenerator, List[TableSchema]]) -> str:
+        generator, tables = state
+        return generator.generate_proto(tables)
+
+    def _workflow(self, scale: int) -> WorkflowDefinition:
+        workflow = self._workflows.get(scale)
+        if workflow is None:
+            workflow = generate_workflow(WorkflowSpec(nodes=scale, seed=self.seed))
+            self._workflows[scale] = workflow
+        # A fresh copy, so every run builds the graph index again
+        return workflow.model_copy()
+
+    def run(self, names: Optional[Iterable[str]] = None) -> List[Measurement]:
+        """Runs the named benchmarks (all by default) at every scale."""
+        selected = list(names) if names else list(self.benchmarks)
+        unknown = [n for n in selected if n not in self.benchmarks]
+        if unknown:
+            raise ValueError(f"Unknown benchmarks: {', '.join(unknown)}")
+
+        results = []
+        for name in selected:
+            setup, run = self.benchmarks[name]
+            for scale in self.scales:
+                try:
+                    seconds, peak = measure(lambda: setup(scale), run, self.repeats)
+                    results.append(Measurement(name, scale, seconds, peak))
+                except Exception as e:
+                    results.append(
+                        Measurement(name, scale, 0.0, 0, f"{type(e).__name__}: {e}")
+                    )
+        return results
+
+
+def save_baseline(measurements: Iterable[Measurement], file_path: Path | str) -> None:
+    """Writes measurements to a JSON baseline file."""
+    data = {
+        "version": BASELINE_VERSION,
+        "python": sys.version.split()[0],
+        "results": {m.key: asdict(m) for m in measurements if m.error is None},
+    }
+    Path(file_path).write_text(json.dumps(data, indent=2, sort_keys=True))
+
+
+def load_baseline(file_path: Path | str) -> Dict[str, Measurement]:
+    """Reads a JSON baseline file written by save_baseline."""
+    data = json.loads(Path(file_path).read_text())
+    if data.get("version") != BASELINE_VERSION:
+        raise ValueError(f"Unsupported baseline version: {data.get('version')}")
+    return {key: Measurement(**value) for key, value in data["results"].items()}
+
+
+def compare(
+    measurements: Iterable[Measurement],
+    baseline: Dict[str, Measurement],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> List[Regression]:
+    """
+    Returns the measurements whose time or peak memory exceeds the baseline
+    by more than ``threshold`` (0.2 = 20%). Benchmarks that failed are
+    reported as regressions; those missing from the baseline are skipped.
+    """
+    regressions = []
+    for m in measurements:
+        base = baseline.get(m.key)
+        if base is None:
+            continue
+        if m.error is not None:
+            regressions.append(Regression(m.key, f"error ({m.error})", 0, 0))
+            continue
+        for metric, floor in (("seconds", MIN_SECONDS), ("peak_bytes", MIN_PEAK_BYTES)):
+            before = getattr(base, metric)
+            after = getattr(m, metric)
+            if after > before * (1 + threshold) and after - before > floor:
+                regressions.append(Regression(m.key, metric, before, after))
+    return regressions
+
+
+def format_results(measurements: Iterable[Measurement]) -> str:
+    """Formats measurements as an aligned text table."""
+    lines = [f"{'benchmark':<32} {'seconds':>12} {'peak MiB':>10}"]
+    for m in measurements:
+        if m.error is not None:
+            lines.append(f"{m.key:<32} {'failed':>12}  {m.error}")
+        else:
+            lines.append(
+                f"{m.key:<32} {m.seconds:>12.6f} {m.peak_bytes / 2**20:>10.2f}"
+            )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark the registry, generators and workflow validation"
+    )
+    parser.add_argument("--scales", type=int, nargs="+", default=DEFAULT_SCALES)
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS)
+    parser.add_argument("--only", nargs="+", help="Benchmarks to run")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workdir", type=Path, help="Reuse generated inputs here")
+    parser.add_argument("--baseline", type=Path, help="Baseline to compare with")
+    parser.add_argument("--save", type=Path, help="Write the results as a baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args(argv)
+
+    suite = BenchmarkSuite(args.scales, args.repeats, args.workdir, args.seed)
+    try:
+        results = suite.run(args.only)
+    finally:
+        suite.close()
+    print(format_results(results))
+
+    if args.save:
+        save_baseline(results, args.save)
+        print(f"\nSaved baseline to {args.save}")
+
+    failed = [m for m in results if m.error is not None]
+    if args.baseline:
+        regressions = compare(results, load_baseline(args.baseline), args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) over {args.threshold:.0%}:")
+            for regression in regressions:
+                print(f" - {regression}")
+            return 1
+        print(f"\nNo regressions over {args.threshold:.0%}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
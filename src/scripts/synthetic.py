@@ -0,0 +1,352 @@
+"""
+Seeded generators of large schema directories and workflows for scale tests.
+
+    python -m src.scripts.synthetic schema out/schemas --tables 10000
+    python -m src.scripts.synthetic workflow out/workflow.json --nodes 10000
+
+The same spec and seed always produce the same output.
+"""
+
+import argparse
+import random
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from src.data.schema import ColumnSchema, DataType, TableSchema
+from src.data.storage import YAMLStorage
+from src.models.workflow.definition import WorkflowDefinition
+from src.models.workflow.edge import WorkflowEdge
+from src.models.workflow.enums import WorkflowNodeType
+from src.models.workflow.node import (
+    BranchNode,
+    CompletionNode,
+    DecisionNode,
+    JoinNode,
+    ProcessNode,
+    TriggerNode,
+    WorkflowNode,
+)
+from src.models.workflow.properties import EmptyProps, ProcessProps, TriggerProps
+
+# Data column types cycled through by generated tables
+_DATA_TYPES = [
+    DataType.STRING,
+    DataType.INTEGER,
+    DataType.TIMESTAMP,
+    DataType.BOOLEAN,
+    DataType.DECIMAL,
+    DataType.ENUM,
+    DataType.FLOAT,
+    DataType.TEXT,
+    DataType.JSON,
+]
+
+
+@dataclass
+class SchemaSpec:
+    """
+    Shape of a synthetic schema directory.
+
+    Attributes:
+        tables: Number of tables.
+        columns: Data columns per table, besides the id and foreign keys.
+        fan_out: Maximum foreign keys per table.
+        depth: Number of dependency levels; every table past the first level
+            references at least one table on the level above it.
+        enum_pool: Number of shared, named enums.
+        enum_reuse: Probability that an ENUM column uses a shared enum rather
+            than its own.
+        namespaces: Number of namespaces tables are spread over.
+        tables_per_file: Tables written to each YAML file.
+        seed: Random seed.
+    """
+
+    tables: int = 100
+    columns: int = 6
+    fan_out: int = 2
+    depth: int = 5
+    enum_pool: int = 10
+    enum_reuse: float = 0.5
+    namespaces: int = 4
+    tables_per_file: int = 1
+    seed: int = 0
+
+
+@dataclass
+class WorkflowSpec:
+    """
+    Shape of a synthetic workflow.
+
+    Attributes:
+        nodes: Total number of nodes, including the trigger and completion.
+        branch_density: Probability that a block is a parallel Branch/Join.
+        decision_density: Probability that a block is a Decision whose
+            conditioned paths merge again.
+        max_width: Maximum parallel arms or decision paths per block.
+        max_nesting: Maximum nesting of branch and decision blocks.
+        seed: Random seed.
+    """
+
+    nodes: int = 100
+    branch_density: float = 0.1
+    decision_density: float = 0.1
+    max_width: int = 3
+    max_nesting: int = 3
+    seed: int = 0
+
+
+def _enum_values(index: int) -> List[str]:
+    return [f"value_{i}" for i in range(3 + index % 5)]
+
+
+def _data_column(rng: random.Random, spec: SchemaSpec, index: int) -> ColumnSchema:
+    data_type = _DATA_TYPES[
+        (index + rng.randrange(len(_DATA_TYPES))) % len(_DATA_TYPES)
+    ]
+    name = f"{data_type.value}_{index}"
+    if data_type == DataType.STRING:
+        return ColumnSchema(
+            name=name, data_type=data_type, length=rng.choice([32, 255])
+        )
+    if data_type == DataType.DECIMAL:
+        return ColumnSchema(name=name, data_type=data_type, precision=12, scale=2)
+    if data_type == DataType.ENUM:
+        if spec.enum_pool and rng.random() < spec.enum_reuse:
+            shared = rng.randrange(spec.enum_pool)
+            return ColumnSchema(
+                name=name,
+                data_type=data_type,
+                enum_name=f"shared_enum_{shared}",
+                enum_values=_enum_values(shared),
+            )
+        return ColumnSchema(
+            name=name, data_type=data_type, enum_values=_enum_values(index)
+        )
+    return ColumnSchema(name=name, data_type=data_type, nullable=rng.random() < 0.8)
+
+
+def generate_tables(spec: SchemaSpec) -> List[TableSchema]:
+    """Generates the tables of a synthetic schema, referenced tables first."""
+    rng = random.Random(spec.seed)
+    depth = max(1, min(spec.depth, spec.tables))
+    levels: List[List[str]] = [[] for _ in range(depth)]
+    # Tables of every level above the current one, extended as levels finish
+    earlier: List[str] = []
+    finished = 0
+    tables: List[TableSchema] = []
+
+    for i in range(spec.tables):
+        name = f"table_{i:05d}"
+        level = i * depth // spec.tables
+        columns = [
+            ColumnSchema(name="id", data_type=DataType.INTEGER, primary_key=True)
+        ]
+
+        while finished < level:
+            earlier.extend(levels[finished])
+            finished += 1
+
+        if level > 0 and spec.fan_out > 0:
+            # One parent on the level above fixes this table's level
+            targets = [rng.choice(levels[level - 1])]
+            extra = rng.randint(0, spec.fan_out - 1)
+            for target in rng.sample(earlier, min(extra, len(earlier))):
+                if target not in targets:
+                    targets.append(target)
+            for target in targets:
+                columns.append(
+                    ColumnSchema(
+                        name=f"{target}_id",
+                        data_type=DataType.REFERENCE,
+                        reference_table=target,
+                        nullable=False,
+                    )
+                )
+
+        columns.extend(_data_column(rng, spec, c) for c in range(spec.columns))
+        tables.append(
+            TableSchema(
+                name=name,
+                columns=columns,
+                namespace=f"ns_{i % spec.namespaces}" if spec.namespaces else None,
+            )
+        )
+        levels[level].append(name)
+    return tables
+
+
+def write_schema_directory(spec: SchemaSpec, directory: Path | str) -> List[Path]:
+    """Writes a synthetic schema as YAML files into a directory."""
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    storage = YAMLStorage()
+    tables = generate_tables(spec)
+    per_file = max(1, spec.tables_per_file)
+
+    paths = []
+    for start in range(0, len(tables), per_file):
+        chunk = tables[start : start + per_file]
+        path = directory / f"{chunk[0].name}.yaml"
+        storage.save(
+            [t.model_dump(mode="json", exclude_defaults=True) for t in chunk], path
+        )
+        paths.append(path)
+    return paths
+
+
+class _WorkflowBuilder:
+    def __init__(self, spec: WorkflowSpec):
+        self.spec = spec
+        self.rng = random.Random(spec.seed)
+        self.nodes: List[WorkflowNode] = []
+        self.edges: List[WorkflowEdge] = []
+
+    def _node(self, node_type: WorkflowNodeType) -> str:
+        node_id = f"node-{len(self.nodes) + 1}"
+        label = f"{node_type.value.title()} {len(self.nodes) + 1}"
+        if node_type == WorkflowNodeType.TRIGGER:
+            node = TriggerNode(
+                id=node_id,
+                label=label,
+                type=node_type,
+                properties=TriggerProps(event_type="synthetic"),
+            )
+        elif node_type == WorkflowNodeType.PROCESS:
+            node = ProcessNode(
+                id=node_id,
+                label=label,
+                type=node_type,
+                properties=ProcessProps(description=label),
+            )
+        else:
+            node_class = {
+                WorkflowNodeType.DECISION: DecisionNode,
+                WorkflowNodeType.BRANCH: BranchNode,
+                WorkflowNodeType.JOIN: JoinNode,
+                WorkflowNodeType.COMPLETION: CompletionNode,
+            }[node_type]
+            node = node_class(
+                id=node_id, label=label, type=node_type, properties=EmptyProps()
+            )
+        self.nodes.append(node)
+        return node_id
+
+    def _edge(self, source: str, target: str, condition: Optional[str] = None) -> None:
+        self.edges.append(
+            WorkflowEdge(source_id=source, target_id=target, condition=condition)
+        )
+
+    def _split(self, total: int, parts: int) -> List[int]:
+        # At least one node per part, the rest spread at random
+        sizes = [1] * parts
+        for _ in range(total - parts):
+            sizes[self.rng.randrange(parts)] += 1
+        return sizes
+
+    def _arms(self, sizes: List[int], nesting: int) -> List[Tuple[str, str]]:
+        return [self.body(size, nesting + 1) for size in sizes]
+
+    def body(self, budget: int, nesting: int = 0) -> Tuple[str, str]:
+        """Builds a sequence of exactly ``budget`` nodes; returns its first and last."""
+        spec = self.spec
+        first: Optional[str] = None
+        last: Optional[str] = None
+        remaining = budget
+        while remaining > 0:
+            # Branch and decision blocks need two nodes of their own and two arms
+            nested = nesting < spec.max_nesting and remaining >= 4
+            roll = self.rng.random()
+            if nested and roll < spec.branch_density + spec.decision_density:
+                width = self.rng.randint(2, max(2, min(spec.max_width, remaining - 2)))
+                inner = self.rng.randint(width, remaining - 2)
+                if roll < spec.branch_density:
+                    entry = self._node(WorkflowNodeType.BRANCH)
+                    arms = self._arms(self._split(inner, width), nesting)
+                    exit_ = self._node(WorkflowNodeType.JOIN)
+                    for arm_first, arm_last in arms:
+                        self._edge(entry, arm_first)
+                        self._edge(arm_last, exit_)
+                else:
+                    entry = self._node(WorkflowNodeType.DECISION)
+                    arms = self._arms(self._split(inner, width), nesting)
+                    exit_ = self._node(WorkflowNodeType.PROCESS)
+                    for i, (arm_first, arm_last) in enumerate(arms):
+                        self._edge(entry, arm_first, condition=f"case_{i}")
+                        self._edge(arm_last, exit_)
+                used = inner + 2
+            else:
+                entry = exit_ = self._node(WorkflowNodeType.PROCESS)
+                used = 1
+
+            if last is None:
+                first = entry
+            else:
+                self._edge(last, entry)
+            last = exit_
+            remaining -= used
+        assert first is not None and last is not None
+        return first, last
+
+
+def generate_workflow(spec: WorkflowSpec) -> WorkflowDefinition:
+    """
+    Generates a well-formed workflow: one trigger, nested Branch/Join and
+    Decision blocks whose paths rejoin, and one completion that every path
+    reaches.
+    """
+    if spec.nodes < 3:
+        raise ValueError("A synthetic workflow needs at least 3 nodes")
+    builder = _WorkflowBuilder(spec)
+    trigger = builder._node(WorkflowNodeType.TRIGGER)
+    first, last = builder.body(spec.nodes - 2)
+    completion = builder._node(WorkflowNodeType.COMPLETION)
+    builder._edge(trigger, first)
+    builder._edge(last, completion)
+
+    return WorkflowDefinition(
+        id=uuid.UUID(int=random.Random(spec.seed).getrandbits(128)),
+        name=f"Synthetic workflow ({spec.nodes} nodes, seed {spec.seed})",
+        nodes=builder.nodes,
+        edges=builder.edges,
+    )
+
+
+def write_workflow(spec: WorkflowSpec, file_path: Path | str) -> Path:
+    """Writes a synthetic workflow to a JSON file."""
+    path = Path(file_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(generate_workflow(spec).model_dump_json(), encoding="utf-8")
+    return path
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Generate seeded synthetic schemas and workflows"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    schema = commands.add_parser("schema", help="Write a schema directory")
+    schema.add_argument("output", type=Path)
+    workflow = commands.add_parser("workflow", help="Write a workflow JSON file")
+    workflow.add_argument("output", type=Path)
+    for command, spec_class in ((schema, SchemaSpec), (workflow, WorkflowSpec)):
+        for name, default in vars(spec_class()).items():
+            command.add_argument(
+                f"--{name.replace('_', '-')}", type=type(default), default=default
+            )
+
+    args = vars(parser.parse_args(argv))
+    command = args.pop("command")
+    output = args.pop("output")
+    if command == "schema":
+        paths = write_schema_directory(SchemaSpec(**args), output)
+        print(f"Wrote {len(paths)} schema files to {output}")
+    else:
+        write_workflow(WorkflowSpec(**args), output)
+        print(f"Wrote workflow to {output}")
+
+
+if __name__ == "__main__":
+    main()
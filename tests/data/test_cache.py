@@ -0,0 +1,78 @@
+import pytest
+from src.data.cache import SchemaCache
+from src.data.registry import SchemaRegistry
+from src.data.storage import YAMLStorage
+
+
+def _write_table(path, name, extra_column=None):
+    columns = [{"name": "id", "data_type": "integer", "primary_key": True}]
+    if extra_column:
+        columns.append({"name": extra_column, "data_type": "string"})
+    YAMLStorage().save({"name": name, "columns": columns}, path)
+
+
+@pytest.fixture
+def schema_dir(tmp_path):
+    directory = tmp_path / "schemas"
+    _write_table(directory / "users.yaml", "users")
+    _write_table(directory / "posts.yaml", "posts")
+    return directory
+
+
+def test_unchanged_files_served_from_cache(schema_dir, tmp_path, monkeypatch):
+    cache_path = tmp_path / "cache" / "schemas.pickle"
+    SchemaRegistry().load_from_directory(schema_dir, cache=SchemaCache(cache_path))
+    assert cache_path.exists()
+
+    def fail_load(self, file_path, **kwargs):
+        raise AssertionError(f"{file_path} should not be re-parsed")
+
+    monkeypatch.setattr(YAMLStorage, "load", fail_load)
+
+    registry = SchemaRegistry()
+    registry.load_from_directory(schema_dir, cache=SchemaCache(cache_path))
+    assert [s.name for s in registry.list_schemas()] == ["posts", "users"]
+
+
+def test_only_edited_files_reparsed(schema_dir, tmp_path, monkeypatch):
+    cache_path = tmp_path / "schemas.pickle"
+    SchemaRegistry().load_from_directory(schema_dir, cache=SchemaCache(cache_path))
+
+    _write_table(schema_dir / "users.yaml", "users", extra_column="email")
+
+    parsed = []
+    original_load = YAMLStorage.load
+
+    def tracking_load(self, file_path, **kwargs):
+        parsed.append(file_path.name)
+        return original_load(self, file_path, **kwargs)
+
+    monkeypatch.setattr(YAMLStorage, "load", tracking_load)
+
+    registry = SchemaRegistry()
+    registry.load_from_directory(schema_dir, cache=SchemaCache(cache_path))
+    assert parsed == ["users.yaml"]
+    users = registry.get_schema("users")
+    assert users is not None
+    assert [c.name for c in users.columns] == ["id", "email"]
+
+
+def test_removed_files_pruned(schema_dir, tmp_path):
+    cache = SchemaCache(tmp_path / "schemas.pickle")
+    SchemaRegistry().load_from_directory(schema_dir, cache=cache)
+    assert len(cache) == 2
+
+    (schema_dir / "posts.yaml").unlink()
+    registry = SchemaRegistry()
+    registry.load_from_directory(schema_dir, cache=cache)
+    assert len(cache) == 1
+    assert registry.get_schema("posts") is None
+
+
+def test_corrupt_cache_file_is_ignored(schema_dir, tmp_path):
+    cache_path = tmp_path / "schemas.pickle"
+    cache_path.write_bytes(b"not a pickle")
+
+    registry = SchemaRegistry()
+    registry.load_from_directory(schema_dir, cache=SchemaCache(cache_path))
+    assert registry.get_schema("users") is not None
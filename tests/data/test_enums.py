@@ -0,0 +1,88 @@
+from typing import Optional
+
+import pytest
+
+from src.data.enums import EnumRegistry, proto_type_name, proto_value_name
+from src.data.generator import ProtobufGenerator, SchemaGenerator
+from src.data.registry import SchemaRegistry
+from src.data.schema import ColumnSchema, DataType, EnumSchema, TableSchema
+
+
+def _table(name, values=("open", "closed"), enum_name: Optional[str] = "ticket_status"):
+    return TableSchema(
+        name=name,
+        columns=[
+            ColumnSchema(name="id", data_type=DataType.INTEGER, primary_key=True),
+            ColumnSchema(
+                name="status",
+                data_type=DataType.ENUM,
+                enum_name=enum_name,
+                enum_values=list(values) if values else None,
+            ),
+        ],
+    )
+
+
+def test_identical_enums_interned():
+    enums = EnumRegistry.from_tables([_table("bugs"), _table("tasks")])
+    assert len(enums) == 1
+    assert enums.get("ticket_status") == EnumSchema(
+        name="ticket_status", values=["open", "closed"]
+    )
+
+
+def test_unnamed_enums_stay_per_column():
+    enums = EnumRegistry.from_tables(
+        [_table("bugs", enum_name=None), _table("tasks", enum_name=None)]
+    )
+    assert "bugs_status_enum" in enums
+    assert "tasks_status_enum" in enums
+
+
+def test_conflicting_values_rejected():
+    with pytest.raises(ValueError, match="conflicting values"):
+        EnumRegistry.from_tables([_table("bugs"), _table("tasks", ("new",))])
+
+
+def test_column_may_reference_enum_by_name():
+    enums = EnumRegistry.from_tables([_table("tasks", values=None), _table("bugs")])
+    assert enums.column_enum("tasks", _table("tasks", values=None).columns[1]) == (
+        enums.get("ticket_status")
+    )
+
+    with pytest.raises(ValueError, match="has no enum_values defined"):
+        EnumRegistry.from_tables([_table("tasks", values=None)])
+
+
+def test_proto_names():
+    assert proto_type_name("ticket_status") == "TicketStatus"
+    assert proto_type_name("HTTPCode") == "HTTPCode"
+    assert proto_value_name("TaskStatus", "in progress") == "TASK_STATUS_IN_PROGRESS"
+
+
+def test_proto_defines_shared_enum_once():
+    proto = ProtobufGenerator().generate_proto(
+        [_table("bugs"), _table("tasks", values=None)]
+    )
+    assert proto.count("enum TicketStatus {") == 1
+    assert proto.index("enum TicketStatus {") < proto.index("message Bugs {")
+    assert "  TicketStatus status = 2;" in proto.split("message Tasks {")[1]
+
+
+def test_ddl_shares_enum_type():
+    generator = SchemaGenerator()
+    ddl = generator.generate_ddl([_table("bugs"), _table("tasks", values=None)])
+    assert ddl.count("ENUM('open','closed')") == 2
+    bugs = generator.metadata.tables["bugs"].c.status.type
+    assert generator.metadata.tables["tasks"].c.status.type is bugs
+
+
+def test_registry_reports_enum_conflicts():
+    registry = SchemaRegistry()
+    registry.register(_table("bugs"))
+    registry.register(_table("tasks", ("new",)))
+    assert any("conflicting values" in e for e in registry.validate())
+
+    registry.unregister("tasks")
+    assert registry.validate() == []
+    assert registry.enums().get("ticket_status") is not None
@@ -0,0 +1,246 @@
+import json
+import uuid
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import create_engine, event, text
+
+from src.data.loader import DataLoader, DataLoadError, read_rows
+from src.data.provision import provision
+from src.data.registry import SchemaRegistry
+from src.data.schema import ColumnSchema, DataType, TableSchema
+from src.data.storage import YAMLStorage
+
+
+@pytest.fixture
+def registry():
+    registry = SchemaRegistry()
+    registry.register(
+        TableSchema(
+            name="users",
+            columns=[
+                ColumnSchema(name="id", data_type=DataType.INTEGER, primary_key=True),
+                ColumnSchema(
+                    name="handle", data_type=DataType.STRING, length=8, nullable=False
+                ),
+                ColumnSchema(name="active", data_type=DataType.BOOLEAN),
+                ColumnSchema(name="joined_at", data_type=DataType.TIMESTAMP),
+                ColumnSchema(name="external_id", data_type=DataType.UUID),
+            ],
+        )
+    )
+    registry.register(
+        TableSchema(
+            name="orders",
+            columns=[
+                ColumnSchema(name="id", data_type=DataType.INTEGER, primary_key=True),
+                ColumnSchema(
+                    name="user_id",
+                    data_type=DataType.REFERENCE,
+                    reference_table="users",
+                ),
+                ColumnSchema(
+                    name="total", data_type=DataType.DECIMAL, precision=10, scale=2
+                ),
+                ColumnSchema(
+                    name="status",
+                    data_type=DataType.ENUM,
+                    enum_values=["open", "paid"],
+                ),
+                ColumnSchema(name="meta", data_type=DataType.JSON),
+            ],
+        )
+    )
+    return registry
+
+
+@pytest.fixture
+def engine(registry):
+    engine = create_engine("sqlite://")
+
+    @event.listens_for(engine, "connect")
+    def enable_foreign_keys(dbapi_conn, _):
+        dbapi_conn.execute("PRAGMA foreign_keys=ON")
+
+    provision(registry, engine)
+    return engine
+
+
+def test_read_rows_formats(tmp_path):
+    csv_path = tmp_path / "rows.csv"
+    csv_path.write_text("id,handle\n1,ann\n2,\n")
+    assert list(read_rows(csv_path)) == [
+        {"id": "1", "handle": "ann"},
+        {"id": "2", "handle": None},
+    ]
+
+    ndjson_path = tmp_path / "rows.ndjson"
+    ndjson_path.write_text('{"id": 1}\n\n{"id": 2}\n')
+    assert list(read_rows(ndjson_path)) == [{"id": 1}, {"id": 2}]
+
+    yaml_path = tmp_path / "rows.yaml"
+    YAMLStorage().save([{"id": 1}], yaml_path)
+    assert list(read_rows(yaml_path)) == [{"id": 1}]
+
+    with pytest.raises(ValueError, match="Unsupported"):
+        list(read_rows(tmp_path / "rows.txt"))
+
+
+def test_coerce_batch_column_wise(registry, engine):
+    loader = DataLoader(registry, engine)
+    external_id = uuid.uuid4()
+    rows = loader.coerce_batch(
+        "users",
+        [
+            {
+                "id": "1",
+                "handle": "ann",
+                "active": "yes",
+                "joined_at": "2025-03-01T12:00:00",
+                "external_id": str(external_id),
+            },
+            {"id": 2, "handle": "bob"},
+        ],
+    )
+    assert rows == [
+        {
+            "id": 1,
+            "handle": "ann",
+            "active": True,
+            "joined_at": datetime(2025, 3, 1, 12),
+            "external_id": external_id.bytes,
+        },
+        {"id": 2, "handle": "bob"},
+    ]
+
+
+@pytest.mark.parametrize(
+    "row, message",
+    [
+        ({"id": 1, "handle": "far too long"}, "handle: longer than 8"),
+        ({"id": 1}, "handle is required"),
+        ({"id": "x", "handle": "a"}, "id: invalid literal"),
+        ({"id": 2**40, "handle": "a"}, "out of range"),
+        ({"id": 1, "handle": "a", "nick": "b"}, "unknown columns"),
+    ],
+)
+def test_invalid_rows_reported(registry, engine, row, message):
+    loader = DataLoader(registry, engine)
+    with pytest.raises(DataLoadError, match=message) as excinfo:
+        loader.coerce_batch("users", [{"id": 5, "handle": "ok"}, row], first_row=10)
+    assert excinfo.value.row == 11
+
+
+def test_load_files_in_dependency_order(registry, engine, tmp_path):
+    users = tmp_path / "users.csv"
+    users.write_text("id,handle,active\n1,ann,true\n2,bob,false\n")
+    orders = tmp_path / "orders.ndjson"
+    orders.write_text(
+        "\n".join(
+            json.dumps(
+                {
+                    "id": i,
+                    "user_id": 1 + i % 2,
+                    "total": "19.99",
+                    "status": "paid",
+                    "meta": {"n": i},
+                }
+            )
+            for i in range(1, 51)
+        )
+    )
+
+    loader = DataLoader(registry, engine, batch_size=16)
+    # Parents are loaded first even though orders is listed first
+    counts = loader.load_files({"orders": orders, "users": users})
+    assert counts == {"users": 2, "orders": 50}
+
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT COUNT(*) FROM orders")).scalar() == 50
+        total = conn.execute(text("SELECT SUM(total) FROM orders")).scalar()
+    assert Decimal(str(total)).quantize(Decimal("0.01")) == Decimal("999.50")
+
+
+def test_failed_load_rolls_back(registry, engine):
+    loader = DataLoader(registry, engine)
+    with pytest.raises(DataLoadError, match="not one of"):
+        loader.load_files(
+            {
+                "users": [{"id": 1, "handle": "ann"}],
+                "orders": [{"id": 1, "user_id": 1, "status": "lost"}],
+            }
+        )
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT COUNT(*) FROM users")).scalar() == 0
+
+
+def test_multi_hop_enum_reference():
+    # shipments.order_status -> holds.order_status -> orders.status
+    def reference(table, column):
+        return ColumnSchema(
+            name="order_status",
+            data_type=DataType.REFERENCE,
+            reference_table=table,
+            reference_column=column,
+            primary_key=True,
+        )
+
+    registry = SchemaRegistry()
+    registry.register(
+        TableSchema(
+            name="orders",
+            columns=[
+                ColumnSchema(
+                    name="status",
+                    data_type=DataType.ENUM,
+                    enum_values=["open", "paid"],
+                    primary_key=True,
+                ),
+            ],
+        )
+    )
+    registry.register(
+        TableSchema(name="holds", columns=[reference("orders", "status")])
+    )
+    registry.register(
+        TableSchema(name="shipments", columns=[reference("holds", "order_status")])
+    )
+
+    loader = DataLoader(registry, create_engine("sqlite://"))
+    rows = loader.coerce_batch("shipments", [{"order_status": "paid"}])
+    assert rows == [{"order_status": "paid"}]
+    with pytest.raises(DataLoadError, match="not one of"):
+        loader.coerce_batch("shipments", [{"order_status": "lost"}])
+    # No enum is registered for the intermediate table
+    assert [enum.name for enum in registry.enums().list_enums()] == [
+        "orders_status_enum"
+    ]
+
+
+def test_shared_enum_referenced_by_name():
+    registry = SchemaRegistry()
+    for name, values in (("bugs", None), ("tasks", ["open", "done"])):
+        registry.register(
+            TableSchema(
+                name=name,
+                columns=[
+                    ColumnSchema(
+                        name="id", data_type=DataType.INTEGER, primary_key=True
+                    ),
+                    ColumnSchema(
+                        name="status",
+                        data_type=DataType.ENUM,
+                        enum_name="work_status",
+                        enum_values=values,
+                    ),
+                ],
+            )
+        )
+    engine = create_engine("sqlite://")
+    provision(registry, engine, max_workers=1)
+
+    loader = DataLoader(registry, engine)
+    assert loader.load_rows("bugs", [{"id": 1, "status": "done"}]) == 1
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT status FROM bugs")).scalar() == "done"
@@ -0,0 +1,197 @@
+import pytest
+
+from src.data.masking import MASKED, DataMasker, column_sensitivity
+from src.data.registry import SchemaRegistry
+from src.data.schema import ColumnSchema, DataSensitivity, DataType, TableSchema
+
+KEY = b"test-key"
+
+
+@pytest.fixture
+def registry():
+    registry = SchemaRegistry()
+    registry.register(
+        TableSchema(
+            name="customers",
+            sensitivity=DataSensitivity.PII,
+            columns=[
+                ColumnSchema(name="id", data_type=DataType.INTEGER, primary_key=True),
+                ColumnSchema(name="email", data_type=DataType.STRING),
+                ColumnSchema(
+                    name="country",
+                    data_type=DataType.STRING,
+                    sensitivity=DataSensitivity.PUBLIC,
+                ),
+                ColumnSchema(
+                    name="notes",
+                    data_type=DataType.TEXT,
+                    sensitivity=DataSensitivity.CONFIDENTIAL,
+                ),
+                ColumnSchema(
+                    name="credit_limit",
+                    data_type=DataType.DECIMAL,
+                    precision=12,
+                    scale=2,
+                    sensitivity=DataSensitivity.CONFIDENTIAL,
+                ),
+                ColumnSchema(
+                    name="ssn",
+                    data_type=DataType.STRING,
+                    sensitivity=DataSensitivity.RESTRICTED,
+                ),
+            ],
+        )
+    )
+    registry.register(
+        TableSchema(
+            name="orders",
+            columns=[
+                ColumnSchema(name="id", data_type=DataType.INTEGER, primary_key=True),
+                ColumnSchema(
+                    name="customer_id",
+                    data_type=DataType.REFERENCE,
+                    reference_table="customers",
+                ),
+            ],
+        )
+    )
+    return registry
+
+
+ROWS = [
+    {
+        "id": 1,
+        "email": "ann@example.com",
+        "country": "NZ",
+        "notes": "vip",
+        "credit_limit": 500,
+        "ssn": "123",
+    },
+    {"id": 2, "email": "bob@example.com", "country": "FR", "notes": None},
+    {"id": 3, "email": "ann@example.com"},
+]
+
+
+def test_column_sensitivity_inherits_table(registry):
+    schema = registry.get_schema("customers")
+    assert schema is not None
+    by_name = {col.name: column_sensitivity(schema, col) for col in schema.columns}
+    assert by_name["id"] == DataSensitivity.PII
+    assert by_name["email"] == DataSensitivity.PII
+    assert by_name["country"] == DataSensitivity.PUBLIC
+
+
+def test_mask_batch(registry):
+    masked = DataMasker(registry, key=KEY).mask_batch("customers", ROWS)
+
+    first, second, third = masked
+    assert first["id"] not in (None, 1)
+    assert first["country"] == "NZ"
+    assert first["notes"] == MASKED
+    assert first["credit_limit"] is None
+    assert first["ssn"] is None
+    assert first["email"] != "ann@example.com"
+    # Equal values hash equally; absent and null fields are left alone
+    assert third["email"] == first["email"] != second["email"]
+    assert second["notes"] is None
+    assert "ssn" not in second
+    # The input rows are not modified
+    assert ROWS[0]["email"] == "ann@example.com"
+
+
+def test_hash_is_keyed(registry):
+    ours = DataMasker(registry, key=KEY).mask_batch("customers", ROWS[:1])
+    again = DataMasker(registry, key=KEY).mask_batch("customers", ROWS[:1])
+    other = DataMasker(registry, key=b"other").mask_batch("customers", ROWS[:1])
+    assert ours[0]["email"] == again[0]["email"] != other[0]["email"]
+
+
+def test_clearance_and_unmasked_tables(registry):
+    masker = DataMasker(
+        registry,
+        key=KEY,
+        clearance=[DataSensitivity.PII, DataSensitivity.CONFIDENTIAL],
+    )
+    row = masker.mask_batch("customers", ROWS[:1])[0]
+    assert row["email"] == "ann@example.com"
+    assert row["notes"] == "vip"
+    assert row["ssn"] is None
+
+    assert masker.plan("orders").masks == []
+    orders = [{"id": 1, "customer_id": 1}]
+    assert masker.mask_batch("orders", orders) == orders
+
+
+def test_mask_rows_streams_batches(registry):
+    masker = DataMasker(registry, key=KEY, batch_size=2)
+    rows = ({"country": str(i), "email": f"user{i % 3}@example.com"} for i in range(7))
+    masked = list(masker.mask_rows("customers", rows))
+    assert [row["country"] for row in masked] == [str(i) for i in range(7)]
+    assert masked[0]["email"] == masked[3]["email"] == masked[6]["email"]
+
+
+def test_plans_are_cached(registry):
+    masker = DataMasker(registry, key=KEY)
+    plan = masker.plan("customers")
+    assert masker.plan("customers") is plan
+    masker.invalidate("customers")
+    assert masker.plan("customers") is not plan
+
+    with pytest.raises(ValueError, match="not found"):
+        masker.plan("missing")
+
+
+def test_keys_and_references_are_masked():
+    registry = SchemaRegistry()
+    registry.register(
+        TableSchema(
+            name="people",
+            sensitivity=DataSensitivity.PII,
+            columns=[
+                ColumnSchema(name="email", data_type=DataType.STRING, primary_key=True),
+                ColumnSchema(name="name", data_type=DataType.STRING),
+            ],
+        )
+    )
+    registry.register(
+        TableSchema(
+            name="visits",
+            columns=[
+                ColumnSchema(name="id", data_type=DataType.INTEGER, primary_key=True),
+                ColumnSchema(
+                    name="person_email",
+                    data_type=DataType.REFERENCE,
+                    reference_table="people",
+                    reference_column="email",
+                ),
+            ],
+        )
+    )
+    visits = registry.get_schema("visits")
+    assert visits is not None
+    assert column_sensitivity(visits, visits.columns[1]) == DataSensitivity.INTERNAL
+    assert (
+        column_sensitivity(visits, visits.columns[1], registry) == DataSensitivity.PII
+    )
+
+    # Marking the reference public does not unmask the key it copies
+    public = visits.model_copy(
+        update={
+            "columns": [
+                visits.columns[0],
+                visits.columns[1].model_copy(
+                    update={"sensitivity": DataSensitivity.PUBLIC}
+                ),
+            ]
+        }
+    )
+    assert column_sensitivity(public, public.columns[1], registry) == (
+        DataSensitivity.PII
+    )
+
+    masker = DataMasker(registry, key=KEY)
+    person = masker.mask_batch("people", [{"email": "ann@example.com"}])[0]
+    visit = masker.mask_batch("visits", [{"id": 7, "person_email": "ann@example.com"}])
+    assert person["email"] != "ann@example.com"
+    # The hashed key still joins, and non-sensitive columns are left alone
+    assert visit == [{"id": 7, "person_email": person["email"]}]
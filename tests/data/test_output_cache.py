@@ -0,0 +1,149 @@
+from sqlalchemy.schema import CreateTable
+
+from src.data.cache import OutputCache
+from src.data.generator import ProtobufGenerator, SchemaGenerator
+from src.data.registry import SchemaRegistry
+from src.data.schema import ColumnSchema, DataType, TableSchema
+
+
+def _users(id_type=DataType.INTEGER):
+    return TableSchema(
+        name="users",
+        columns=[ColumnSchema(name="id", data_type=id_type, primary_key=True)],
+    )
+
+
+def _posts():
+    return TableSchema(
+        name="posts",
+        columns=[
+            ColumnSchema(name="id", data_type=DataType.INTEGER, primary_key=True),
+            ColumnSchema(
+                name="author_id",
+                data_type=DataType.REFERENCE,
+                reference_table="users",
+            ),
+        ],
+    )
+
+
+def _resolved(*tables):
+    registry = SchemaRegistry()
+    for table in tables:
+        registry.register(table)
+    return registry.resolve_all(strict=False)
+
+
+def test_fingerprint_is_stable_and_content_based():
+    assert _users().fingerprint() == _users().fingerprint()
+    assert _users().fingerprint() != _users(DataType.STRING).fingerprint()
+
+    renamed = _users()
+    renamed.description = "People"
+    assert renamed.fingerprint() != _users().fingerprint()
+
+
+def test_fingerprint_includes_referenced_columns():
+    posts = _posts()
+    before = posts.fingerprint(_resolved(_users(), posts))
+    after = posts.fingerprint(_resolved(_users(DataType.STRING), posts))
+    assert before != after
+    assert posts.fingerprint() != before
+
+
+def test_lru_evicts_least_recently_used():
+    cache = OutputCache(max_entries=2)
+    cache.put("ddl", "a", "A")
+    cache.put("ddl", "b", "B")
+    assert cache.get("ddl", "a") == "A"
+    cache.put("ddl", "c", "C")
+
+    assert len(cache) == 2
+    assert cache.get("ddl", "b") is None
+    assert cache.get("ddl", "a") == "A"
+    assert cache.get("proto", "a") is None
+
+
+def test_entries_persist_on_disk(tmp_path):
+    OutputCache(tmp_path).put("ddl", "abc", "CREATE TABLE x;")
+
+    cache = OutputCache(tmp_path)
+    assert cache.get("ddl", "abc") == "CREATE TABLE x;"
+    assert (cache.hits, cache.misses) == (1, 0)
+
+
+def test_ddl_only_recompiled_for_changed_tables(tmp_path, monkeypatch):
+    tables = [_users(), _posts()]
+    expected = SchemaGenerator().generate_ddl(tables)
+    SchemaGenerator(cache=OutputCache(tmp_path)).generate_ddl(tables)
+
+    compiled = []
+    original = CreateTable.compile
+
+    def tracking_compile(self, *args, **kwargs):
+        compiled.append(self.element.name)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(CreateTable, "compile", tracking_compile)
+
+    cache = OutputCache(tmp_path)
+    assert SchemaGenerator(cache=cache).generate_ddl(tables) == expected
+    assert compiled == []
+
+    posts = _posts()
+    posts.columns.append(ColumnSchema(name="title", data_type=DataType.STRING))
+    ddl = SchemaGenerator(cache=cache).generate_ddl([_users(), posts])
+    assert compiled == ["posts"]
+    assert "title" in ddl
+
+
+def test_proto_fragments_cached():
+    tables = [_users(), _posts()]
+    expected = ProtobufGenerator().generate_proto(tables)
+
+    cache = OutputCache()
+    ProtobufGenerator(cache=cache).generate_proto(tables)
+    assert cache.misses == 2
+
+    assert ProtobufGenerator(cache=cache).generate_proto(tables) == expected
+    assert cache.hits == 2
+
+
+def test_reference_to_shared_enum_recompiled_when_enum_changes():
+    def tables(values):
+        def status(**extra):
+            return ColumnSchema(
+                name="st", data_type=DataType.ENUM, enum_name="state", **extra
+            )
+
+        return [
+            TableSchema(name="a", columns=[status(enum_values=values)]),
+            TableSchema(name="b", columns=[status(primary_key=True)]),
+            TableSchema(
+                name="c",
+                columns=[
+                    ColumnSchema(
+                        name="b_st",
+                        data_type=DataType.REFERENCE,
+                        reference_table="b",
+                        reference_column="st",
+                    )
+                ],
+            ),
+        ]
+
+    cache = OutputCache()
+
+    def ddl(values):
+        registry = SchemaRegistry()
+        for table in tables(values):
+            registry.register(table)
+        generator = SchemaGenerator(
+            cache=cache,
+            resolved_columns=registry.resolve_all(strict=False),
+            enums=registry.enums(),
+        )
+        return generator.generate_ddl(registry.get_ordered_schemas())
+
+    assert "b_st ENUM('x','y')" in ddl(["x", "y"])
+    assert "b_st ENUM('x','y','z')" in ddl(["x", "y", "z"])
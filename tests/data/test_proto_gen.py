@@ -1,3 +1,5 @@
+import io
+
 from src.data.schema import TableSchema, ColumnSchema, DataType
 from src.data.generator import ProtobufGenerator
 
@@ -110,3 +112,35 @@ def test_generate_proto_complex_types():
     assert "string metadata = 2;" in proto_output
     # REFERENCE should be mapped to int32 (default assumption)
     assert "int32 parent_id = 3;" in proto_output
+
+
+def _numbered_tables(count):
+    for i in range(count):
+        yield TableSchema(
+            name=f"table_{i}",
+            columns=[
+                ColumnSchema(name="id", data_type=DataType.INTEGER, primary_key=True),
+                ColumnSchema(name="created_at", data_type=DataType.TIMESTAMP),
+            ],
+        )
+
+
+def test_write_proto_matches_generate_proto():
+    tables = list(_numbered_tables(3))
+    sink = io.StringIO()
+    ProtobufGenerator().write_proto(tables, sink)
+    assert sink.getvalue() == ProtobufGenerator().generate_proto(tables)
+
+
+def test_iter_proto_consumes_tables_lazily():
+    generator = ProtobufGenerator()
+    imports = generator.required_imports(_numbered_tables(1))
+    assert imports == ["google/protobuf/timestamp.proto"]
+
+    tables = _numbered_tables(1000)
+    fragments = generator.iter_proto(tables, imports=imports)
+    assert next(fragments).startswith('syntax = "proto3";')
+    assert next(fragments) == '\nimport "google/protobuf/timestamp.proto";\n'
+    assert "message Table0 {" in next(fragments)
+    # Only the first table has been pulled from the source
+    assert next(tables).name == "table_1"
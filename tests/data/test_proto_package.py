@@ -0,0 +1,76 @@
+from src.data.generator import ProtobufGenerator
+from src.data.schema import ColumnSchema, DataType, TableSchema
+
+
+def _table(name, namespace=None, extra=None):
+    columns = [ColumnSchema(name="id", data_type=DataType.INTEGER, primary_key=True)]
+    columns.append(
+        ColumnSchema(
+            name="status",
+            data_type=DataType.ENUM,
+            enum_name="record_status",
+            enum_values=["active", "archived"],
+        )
+    )
+    if extra:
+        columns.append(ColumnSchema(name=extra, data_type=DataType.TIMESTAMP))
+    return TableSchema(name=name, namespace=namespace, columns=columns)
+
+
+def _catalog():
+    return [
+        _table("users", "accounts"),
+        _table("invoices", "billing", extra="issued_at"),
+        _table("settings"),
+    ]
+
+
+def test_one_file_per_namespace(tmp_path):
+    written = ProtobufGenerator().write_package(_catalog(), tmp_path, max_workers=2)
+    assert sorted(p.name for p in written) == [
+        "accounts.proto",
+        "billing.proto",
+        "systemcatalyst.proto",
+    ]
+
+    billing = (tmp_path / "billing.proto").read_text()
+    assert "package systemcatalyst.billing;" in billing
+    assert 'import "google/protobuf/timestamp.proto";' in billing
+    assert "message Invoices {" in billing
+
+
+def test_shared_enum_defined_once_and_imported(tmp_path):
+    ProtobufGenerator().write_package(_catalog(), tmp_path)
+
+    # The root namespace sorts first and owns the enum
+    root = (tmp_path / "systemcatalyst.proto").read_text()
+    assert "enum RecordStatus {" in root
+
+    accounts = (tmp_path / "accounts.proto").read_text()
+    assert "enum RecordStatus" not in accounts
+    assert 'import "systemcatalyst.proto";' in accounts
+    assert "  .systemcatalyst.RecordStatus status = 2;" in accounts
+
+
+def test_unchanged_namespaces_not_rewritten(tmp_path):
+    generator = ProtobufGenerator()
+    generator.write_package(_catalog(), tmp_path)
+    assert generator.write_package(_catalog(), tmp_path) == []
+
+    catalog = _catalog()
+    catalog[0].columns.append(ColumnSchema(name="email", data_type=DataType.STRING))
+    written = generator.write_package(catalog, tmp_path)
+    assert [p.name for p in written] == ["accounts.proto"]
+    assert "string email = 3;" in (tmp_path / "accounts.proto").read_text()
+
+
+def test_removed_namespace_file_deleted(tmp_path):
+    (tmp_path / "handwritten.proto").write_text('syntax = "proto3";\n')
+    generator = ProtobufGenerator()
+    generator.write_package(_catalog(), tmp_path)
+
+    generator.write_package(_catalog()[:2], tmp_path)
+    assert not (tmp_path / "systemcatalyst.proto").exists()
+    assert (tmp_path / "handwritten.proto").exists()
+    # The enum moved to the first remaining namespace
+    assert "enum RecordStatus {" in (tmp_path / "accounts.proto").read_text()
@@ -0,0 +1,128 @@
+import pytest
+from sqlalchemy import create_engine, inspect
+from sqlalchemy.dialects import sqlite
+from src.data.schema import TableSchema, ColumnSchema, DataType
+from src.data.registry import SchemaRegistry
+from src.data.generator import SchemaGenerator
+from src.data.provision import apply_ddl_levels, provision
+
+
+@pytest.fixture
+def registry():
+    registry = SchemaRegistry()
+    registry.register(
+        TableSchema(
+            name="users",
+            columns=[
+                ColumnSchema(name="id", data_type=DataType.INTEGER, primary_key=True)
+            ],
+        )
+    )
+    for name in ("posts", "albums", "events"):
+        registry.register(
+            TableSchema(
+                name=name,
+                columns=[
+                    ColumnSchema(
+                        name="id", data_type=DataType.INTEGER, primary_key=True
+                    ),
+                    ColumnSchema(
+                        name="user_id",
+                        data_type=DataType.REFERENCE,
+                        reference_table="users",
+                    ),
+                ],
+            )
+        )
+    return registry
+
+
+def test_generate_ddl_levels(registry):
+    generator = SchemaGenerator()
+    levels = generator.generate_ddl_levels(registry.dependency_levels(), max_workers=4)
+
+    assert [list(level) for level in levels] == [
+        ["users"],
+        ["albums", "events", "posts"],
+    ]
+    assert levels[1]["posts"][0].startswith("CREATE TABLE posts")
+    assert "REFERENCES users (id)" in levels[1]["posts"][0]
+
+
+def test_provision_creates_tables(registry, tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'db.sqlite'}")
+
+    levels = provision(registry, engine, max_workers=3)
+
+    assert sum(len(level) for level in levels) == 4
+    assert set(inspect(engine).get_table_names()) == {
+        "users",
+        "posts",
+        "albums",
+        "events",
+    }
+
+
+def test_apply_ddl_levels_raises_after_level(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'db.sqlite'}")
+    levels = [
+        {"a": ["CREATE TABLE a (id INTEGER);"], "bad": ["CREATE TABLE ("]},
+        {"b": ["CREATE TABLE b (id INTEGER);"]},
+    ]
+
+    with pytest.raises(Exception):
+        apply_ddl_levels(engine, levels, max_workers=2)
+
+    # The rest of the failing level completed, the next level never started
+    assert inspect(engine).get_table_names() == ["a"]
+
+
+def test_generator_uses_given_dialect():
+    generator = SchemaGenerator(dialect=sqlite.dialect())
+    ddl = generator.generate_ddl(
+        [
+            TableSchema(
+                name="notes",
+                description="Notes",
+                columns=[ColumnSchema(name="id", data_type=DataType.INTEGER)],
+            )
+        ]
+    )
+    # SQLite has no table comments
+    assert "COMMENT" not in ddl
+
+
+def test_provision_shared_enum_referenced_by_name(tmp_path):
+    registry = SchemaRegistry()
+    # "bugs" sorts before "tasks", the table that defines the enum
+    registry.register(
+        TableSchema(
+            name="bugs",
+            columns=[
+                ColumnSchema(name="id", data_type=DataType.INTEGER, primary_key=True),
+                ColumnSchema(
+                    name="status", data_type=DataType.ENUM, enum_name="work_status"
+                ),
+            ],
+        )
+    )
+    registry.register(
+        TableSchema(
+            name="tasks",
+            columns=[
+                ColumnSchema(name="id", data_type=DataType.INTEGER, primary_key=True),
+                ColumnSchema(
+                    name="status",
+                    data_type=DataType.ENUM,
+                    enum_name="work_status",
+                    enum_values=["open", "done"],
+                ),
+            ],
+        )
+    )
+    assert registry.validate() == []
+    engine = create_engine(f"sqlite:///{tmp_path / 'db.sqlite'}")
+
+    provision(registry, engine, max_workers=1)
+
+    assert set(inspect(engine).get_table_names()) == {"bugs", "tasks"}
@@ -1,6 +1,6 @@
 import pytest
 from src.data.schema import TableSchema, ColumnSchema, DataType
-from src.data.registry import SchemaRegistry
+from src.data.registry import SchemaRegistry, SchemaLoadError
 from src.data.storage import YAMLStorage
 
 
@@ -125,3 +125,153 @@ def test_load_from_directory(registry, tmp_path, user_schema):
     assert loaded is not None
     assert loaded.name == "users"
     assert len(loaded.columns) == 2
+
+
+def _write_table(storage, path, name):
+    storage.save(
+        {
+            "name": name,
+            "columns": [{"name": "id", "data_type": "integer", "primary_key": True}],
+        },
+        path,
+    )
+
+
+def test_load_from_directory_parallel(registry, tmp_path):
+    storage = YAMLStorage()
+    for idx in range(6):
+        _write_table(storage, tmp_path / f"table_{idx}.yaml", f"table_{idx}")
+
+    registry.load_from_directory(tmp_path, parallel=True, max_workers=2)
+
+    # Results are merged in sorted file order regardless of worker scheduling
+    names = [s.name for s in registry.list_schemas()]
+    assert names == [f"table_{idx}" for idx in range(6)]
+
+
+def test_load_from_directory_parallel_reports_all_errors(registry, tmp_path):
+    storage = YAMLStorage()
+    _write_table(storage, tmp_path / "good.yaml", "good")
+    (tmp_path / "bad_yaml.yaml").write_text("key: value: invalid", encoding="utf-8")
+    storage.save({"name": "no_columns"}, tmp_path / "bad_schema.yml")
+
+    with pytest.raises(SchemaLoadError) as exc:
+        registry.load_from_directory(tmp_path, parallel=True, max_workers=2)
+
+    assert set(exc.value.errors) == {
+        tmp_path / "bad_yaml.yaml",
+        tmp_path / "bad_schema.yml",
+    }
+    # Valid files are still registered
+    assert registry.get_schema("good") is not None
+
+
+def test_load_from_directory_parallel_registers_files_whole(registry, tmp_path):
+    storage = YAMLStorage()
+    _write_table(storage, tmp_path / "a.yaml", "users")
+    storage.save(
+        [
+            {"name": name, "columns": [{"name": "id", "data_type": "integer"}]}
+            for name in ("accounts", "users", "orders")
+        ],
+        tmp_path / "b.yaml",
+    )
+    _write_table(storage, tmp_path / "c.yaml", "orders")
+
+    with pytest.raises(SchemaLoadError) as exc:
+        registry.load_from_directory(tmp_path, parallel=True, max_workers=2)
+
+    assert exc.value.errors == {
+        tmp_path / "b.yaml": "Schema for table 'users' already exists"
+    }
+    # None of the clashing file's tables were registered
+    assert [s.name for s in registry.list_schemas()] == ["users", "orders"]
+
+
+def _ref(name, table, column="id"):
+    return ColumnSchema(
+        name=name,
+        data_type=DataType.REFERENCE,
+        reference_table=table,
+        reference_column=column,
+    )
+
+
+def test_resolve_multi_table_cycle(registry):
+    registry.register(TableSchema(name="a", columns=[_ref("id", "b")]))
+    registry.register(TableSchema(name="b", columns=[_ref("id", "c")]))
+    registry.register(TableSchema(name="c", columns=[_ref("id", "a")]))
+
+    with pytest.raises(ValueError) as exc:
+        registry.resolve_target_datatype("a", "id")
+    assert "Circular reference detected" in str(exc.value)
+    assert "a.id -> b.id -> c.id -> a.id" in str(exc.value)
+
+
+def test_resolve_long_chain_is_iterative(registry):
+    depth = 5000
+    registry.register(
+        TableSchema(
+            name="t0",
+            columns=[ColumnSchema(name="id", data_type=DataType.STRING)],
+        )
+    )
+    for idx in range(1, depth):
+        registry.register(
+            TableSchema(name=f"t{idx}", columns=[_ref("id", f"t{idx - 1}")])
+        )
+
+    assert registry.resolve_target_datatype(f"t{depth - 1}", "id") == DataType.STRING
+
+
+def test_resolve_self_table_reference(registry):
+    registry.register(
+        TableSchema(
+            name="categories",
+            columns=[
+                ColumnSchema(name="id", data_type=DataType.INTEGER, primary_key=True),
+                _ref("parent_id", "categories"),
+            ],
+        )
+    )
+    assert (
+        registry.resolve_target_datatype("categories", "parent_id") == DataType.INTEGER
+    )
+
+
+def test_resolve_all(registry, user_schema, post_schema):
+    registry.register(user_schema)
+    registry.register(post_schema)
+
+    resolved = registry.resolve_all()
+
+    assert len(resolved) == 5
+    assert resolved[("posts", "user_id")] == ("users", user_schema.columns[0])
+    assert resolved[("posts", "user_id")].column is user_schema.columns[0]
+    assert resolved[("posts", "content")].column.data_type == DataType.STRING
+
+
+def test_resolve_all_non_strict_skips_broken_references(registry, post_schema):
+    registry.register(post_schema)
+
+    with pytest.raises(ValueError):
+        registry.resolve_all()
+
+    resolved = registry.resolve_all(strict=False)
+    assert ("posts", "user_id") not in resolved
+    assert ("posts", "id") in resolved
+
+
+def test_resolution_memo_invalidated_on_change(registry, user_schema, post_schema):
+    registry.register(user_schema)
+    registry.register(post_schema)
+    assert registry.resolve_target_datatype("posts", "user_id") == DataType.INTEGER
+
+    registry.unregister("users")
+    registry.register(
+        TableSchema(
+            name="users",
+            columns=[ColumnSchema(name="id", data_type=DataType.STRING)],
+        )
+    )
+    assert registry.resolve_target_datatype("posts", "user_id") == DataType.STRING
@@ -0,0 +1,234 @@
+import os
+import threading
+import pytest
+from src.data.registry import SchemaRegistry
+from src.data.storage import YAMLStorage
+from src.data.watcher import SchemaWatcher
+
+
+def _users(extra_column=None):
+    columns = [{"name": "id", "data_type": "integer", "primary_key": True}]
+    if extra_column:
+        columns.append({"name": extra_column, "data_type": "string"})
+    return {"name": "users", "columns": columns}
+
+
+def _posts(reference_column="id"):
+    return {
+        "name": "posts",
+        "columns": [
+            {"name": "id", "data_type": "integer", "primary_key": True},
+            {
+                "name": "user_id",
+                "data_type": "reference",
+                "reference_table": "users",
+                "reference_column": reference_column,
+            },
+        ],
+    }
+
+
+def _tags():
+    return {
+        "name": "tags",
+        "columns": [{"name": "id", "data_type": "integer", "primary_key": True}],
+    }
+
+
+def _save(path, data):
+    YAMLStorage().save(data, path)
+    # Make sure the edit is visible even on coarse mtime filesystems
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def schema_dir(tmp_path):
+    _save(tmp_path / "users.yaml", _users())
+    _save(tmp_path / "posts.yaml", _posts())
+    _save(tmp_path / "tags.yaml", _tags())
+    return tmp_path
+
+
+@pytest.fixture
+def registry(schema_dir):
+    registry = SchemaRegistry()
+    registry.load_from_directory(schema_dir)
+    return registry
+
+
+def test_reload_without_changes_is_noop(registry, schema_dir):
+    result = registry.reload_directory(schema_dir)
+    assert not result
+    assert result.tables == set()
+
+
+def test_reload_detects_added_changed_removed(registry, schema_dir, monkeypatch):
+    _save(schema_dir / "users.yaml", _users(extra_column="email"))
+    (schema_dir / "tags.yaml").unlink()
+    _save(
+        schema_dir / "labels.yml",
+        {"name": "labels", "columns": [{"name": "id", "data_type": "integer"}]},
+    )
+
+    parsed = []
+    original_load = YAMLStorage.load
+
+    def tracking_load(self, file_path, **kwargs):
+        parsed.append(file_path.name)
+        return original_load(self, file_path, **kwargs)
+
+    monkeypatch.setattr(YAMLStorage, "load", tracking_load)
+
+    result = registry.reload_directory(schema_dir)
+
+    assert result.added == [schema_dir / "labels.yml"]
+    assert result.changed == [schema_dir / "users.yaml"]
+    assert result.removed == [schema_dir / "tags.yaml"]
+    assert result.tables == {"users", "tags", "labels"}
+    assert sorted(parsed) == ["labels.yml", "users.yaml"]
+
+    users = registry.get_schema("users")
+    assert users is not None
+    assert [c.name for c in users.columns] == ["id", "email"]
+    assert registry.get_schema("tags") is None
+    assert registry.get_schema("labels") is not None
+
+
+def test_touch_without_edit_is_not_reparsed(registry, schema_dir):
+    # Files parsed by a reload have a known content hash
+    path = schema_dir / "users.yaml"
+    _save(path, _users(extra_column="email"))
+    assert registry.reload_directory(schema_dir).changed == [path]
+
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 5_000_000_000))
+
+    assert not registry.reload_directory(schema_dir)
+
+
+def test_reload_invalidates_dependent_derived_state(registry, schema_dir):
+    assert registry.validate() == []
+    posts_ddl = registry.get_table_ddl("posts")
+    tags_ddl = registry.get_table_ddl("tags")
+
+    # Dropping the referenced column breaks validation of the dependent table
+    _save(
+        schema_dir / "users.yaml",
+        {"name": "users", "columns": [{"name": "uid", "data_type": "integer"}]},
+    )
+    _save(schema_dir / "posts.yaml", _posts(reference_column="uid"))
+    registry.reload_directory(schema_dir)
+
+    assert registry.validate() == []
+    assert registry.get_table_ddl("tags") is tags_ddl
+    assert registry.get_table_ddl("posts") != posts_ddl
+    assert "REFERENCES users (uid)" in registry.get_table_ddl("posts")
+
+
+def test_reload_keeps_previous_tables_on_parse_error(registry, schema_dir):
+    (schema_dir / "users.yaml").write_text("key: value: invalid", encoding="utf-8")
+
+    result = registry.reload_directory(schema_dir)
+    assert schema_dir / "users.yaml" in result.errors
+    assert registry.get_schema("users") is not None
+
+    # The broken file is not re-parsed until it changes again
+    assert registry.reload_directory(schema_dir).errors == {}
+
+    _save(schema_dir / "users.yaml", _users(extra_column="email"))
+    result = registry.reload_directory(schema_dir)
+    assert result.errors == {}
+    users = registry.get_schema("users")
+    assert users is not None
+    assert len(users.columns) == 2
+
+
+def test_reload_reports_duplicate_table(registry, schema_dir):
+    _save(schema_dir / "users_copy.yaml", _users())
+
+    result = registry.reload_directory(schema_dir)
+    assert "already exists" in result.errors[schema_dir / "users_copy.yaml"]
+    assert registry.get_schema("users") is not None
+
+    # Like a parse error, the clash is not reported again until the file changes
+    assert not registry.reload_directory(schema_dir)
+
+
+def test_reload_keeps_previous_tables_on_duplicate_table(registry, schema_dir):
+    posts = registry.get_schema("posts")
+    _save(schema_dir / "posts.yaml", [_posts(), _tags()])
+
+    result = registry.reload_directory(schema_dir)
+    assert "'tags' already exists" in result.errors[schema_dir / "posts.yaml"]
+    assert registry.get_schema("posts") is posts
+    assert registry.validate() == []
+
+    # Moving the table between files in one reload is fine
+    (schema_dir / "tags.yaml").unlink()
+    _save(schema_dir / "posts.yaml", [_posts(), _tags()])
+    result = registry.reload_directory(schema_dir)
+    assert result.errors == {}
+    assert {s.name for s in registry.list_schemas()} == {"users", "posts", "tags"}
+
+
+def test_ordered_schemas_cached_until_change(registry, schema_dir):
+    first = registry.get_ordered_schemas()
+    assert registry._ordered_cache is not None
+    registry.reload_directory(schema_dir)
+    assert registry._ordered_cache is not None
+
+    _save(schema_dir / "tags.yaml", {"name": "tags", "columns": []})
+    registry.reload_directory(schema_dir)
+    assert registry._ordered_cache is None
+    assert [s.name for s in registry.get_ordered_schemas()] == [s.name for s in first]
+
+
+def test_watcher_polling_applies_changes(registry, schema_dir):
+    reloaded = threading.Event()
+    watcher = SchemaWatcher(
+        registry,
+        schema_dir,
+        interval=0.05,
+        on_reload=lambda result: reloaded.set(),
+        use_inotify=False,
+    )
+    with watcher:
+        assert watcher.running
+        _save(schema_dir / "users.yaml", _users(extra_column="email"))
+        assert reloaded.wait(timeout=5)
+    assert not watcher.running
+
+    users = registry.get_schema("users")
+    assert users is not None
+    assert [c.name for c in users.columns] == ["id", "email"]
+
+
+def test_readers_never_see_a_partial_reload(registry, schema_dir):
+    errors = []
+    done = threading.Event()
+
+    def read():
+        while not done.is_set():
+            try:
+                names = [s.name for s in registry.get_ordered_schemas()]
+                assert names == ["tags", "users", "posts"], names
+                assert registry.validate() == []
+                registry.generate_ddl()
+            except Exception as e:  # pragma: no cover - reported below
+                errors.append(e)
+                return
+
+    readers = [threading.Thread(target=read) for _ in range(2)]
+    for reader in readers:
+        reader.start()
+    try:
+        for i in range(20):
+            _save(schema_dir / "users.yaml", _users(extra_column=f"c{i}"))
+            _save(schema_dir / "posts.yaml", _posts())
+            registry.reload_directory(schema_dir)
+    finally:
+        done.set()
+        for reader in readers:
+            reader.join()
+    assert errors == []
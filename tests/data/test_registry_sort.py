@@ -92,3 +92,99 @@ def test_self_reference_ignored(registry):
     ordered = registry.get_ordered_schemas()
     assert len(ordered) == 1
     assert ordered[0].name == "categories"
+
+
+def test_dependency_queries(registry, user_schema, post_schema):
+    registry.register(post_schema)
+    registry.register(user_schema)
+
+    assert registry.dependencies_of("posts") == ["users"]
+    assert registry.dependencies_of("users") == []
+    assert registry.dependents_of("users") == ["posts"]
+    assert registry.dependents_of("posts") == []
+
+    registry.unregister("posts")
+    assert registry.dependents_of("users") == []
+
+
+def test_dependents_of_unregistered_table(registry, post_schema):
+    registry.register(post_schema)
+    assert registry.dependents_of("users") == ["posts"]
+    with pytest.raises(ValueError):
+        registry.dependencies_of("users")
+
+
+def test_long_chain_does_not_recurse(registry):
+    depth = 10000
+    for idx in range(depth):
+        columns = [ColumnSchema(name="id", data_type=DataType.INTEGER)]
+        if idx:
+            columns.append(
+                ColumnSchema(
+                    name="parent_id",
+                    data_type=DataType.REFERENCE,
+                    reference_table=f"t{idx - 1:05d}",
+                )
+            )
+        registry.register(TableSchema(name=f"t{idx:05d}", columns=columns))
+
+    ordered = registry.get_ordered_schemas()
+    assert [s.name for s in ordered] == [f"t{idx:05d}" for idx in range(depth)]
+
+
+def test_cycle_reported_with_members(registry):
+    def table(name, ref):
+        return TableSchema(
+            name=name,
+            columns=[
+                ColumnSchema(
+                    name="ref", data_type=DataType.REFERENCE, reference_table=ref
+                )
+            ],
+        )
+
+    registry.register(table("a", "b"))
+    registry.register(table("b", "c"))
+    registry.register(table("c", "b"))
+    registry.register(table("d", "a"))
+
+    with pytest.raises(ValueError) as exc:
+        registry.get_ordered_schemas()
+    assert "(b -> c -> b)" in str(exc.value)
+
+
+def test_ordered_schemas_cached(registry, user_schema, post_schema):
+    registry.register(post_schema)
+    registry.register(user_schema)
+
+    first = registry.get_ordered_schemas()
+    assert registry.get_ordered_schemas() == first
+    assert registry._ordered_cache is not None
+
+    registry.unregister("posts")
+    assert registry._ordered_cache is None
+    assert [s.name for s in registry.get_ordered_schemas()] == ["users"]
+
+
+def test_dependency_levels(registry, user_schema, post_schema):
+    comments = TableSchema(
+        name="comments",
+        columns=[
+            ColumnSchema(name="id", data_type=DataType.INTEGER, primary_key=True),
+            ColumnSchema(
+                name="post_id", data_type=DataType.REFERENCE, reference_table="posts"
+            ),
+            ColumnSchema(
+                name="user_id", data_type=DataType.REFERENCE, reference_table="users"
+            ),
+        ],
+    )
+    tags = TableSchema(
+        name="tags",
+        columns=[ColumnSchema(name="id", data_type=DataType.INTEGER)],
+    )
+    for schema in (comments, post_schema, tags, user_schema):
+        registry.register(schema)
+
+    levels = [[s.name for s in level] for level in registry.dependency_levels()]
+    assert levels == [["tags", "users"], ["posts"], ["comments"]]
@@ -0,0 +1,185 @@
+from datetime import datetime, timedelta
+
+import pytest
+from pydantic import ValidationError
+from sqlalchemy import create_engine, event, text
+
+from src.data.generator import SchemaGenerator
+from src.data.loader import DataLoader
+from src.data.provision import provision
+from src.data.registry import SchemaRegistry
+from src.data.retention import (
+    RetentionEngine,
+    RetentionError,
+    TokenBucket,
+    retention_column,
+)
+from src.data.schema import RetentionPolicy, TableSchema
+
+NOW = datetime(2026, 3, 15, 12, 0)
+
+
+def _events(name="events", retention="30_days", **extra):
+    return TableSchema.model_validate(
+        {
+            "name": name,
+            "category": "dynamic",
+            "retention": retention,
+            "retention_column": "created_at",
+            "columns": [
+                {"name": "id", "data_type": "integer", "primary_key": True},
+                {"name": "created_at", "data_type": "timestamp"},
+            ],
+            **extra,
+        }
+    )
+
+
+@pytest.fixture
+def engine():
+    registry = SchemaRegistry()
+    registry.register(_events())
+    registry.register(_events("ledger", "fiscal_year"))
+    registry.register(_events("archive", "indefinite"))
+    engine = create_engine("sqlite://")
+    # In-memory SQLite is per thread, so apply the DDL serially
+    provision(registry, engine, max_workers=1)
+
+    loader = DataLoader(registry, engine)
+    for table in ("events", "ledger", "archive"):
+        loader.load_rows(
+            table,
+            ({"id": i, "created_at": NOW - timedelta(days=i)} for i in range(200)),
+        )
+    engine.registry = registry  # type: ignore[attr-defined]
+    return engine
+
+
+def _count(engine, table):
+    with engine.connect() as conn:
+        return conn.execute(text(f"SELECT COUNT(*) FROM {table}")).scalar()
+
+
+def test_retention_column_selection():
+    assert retention_column(_events()) == "created_at"
+
+    indexed = _events(indexes=[{"columns": ["created_at"]}])
+    indexed.retention_column = None
+    assert retention_column(indexed) == "created_at"
+
+    unindexed = _events()
+    unindexed.retention_column = None
+    assert retention_column(unindexed) is None
+
+    with pytest.raises(ValidationError, match="must name a TIMESTAMP column"):
+        _events(retention_column="id")
+
+
+def test_retention_column_indexed():
+    statements = SchemaGenerator().table_statements(_events())
+    assert statements[1:] == [
+        "CREATE INDEX ix_events_created_at ON events (created_at);"
+    ]
+
+
+def test_cutoffs():
+    engine = RetentionEngine(SchemaRegistry(), create_engine("sqlite://"))
+    assert engine.cutoff(RetentionPolicy.THIRTY_DAYS, NOW) == NOW - timedelta(days=30)
+    assert engine.cutoff(RetentionPolicy.FISCAL_YEAR, NOW) == datetime(2026, 1, 1)
+    assert engine.cutoff(RetentionPolicy.INDEFINITE, NOW) is None
+
+    october = RetentionEngine(
+        SchemaRegistry(), create_engine("sqlite://"), fiscal_year_start_month=10
+    )
+    assert october.cutoff(RetentionPolicy.FISCAL_YEAR, NOW) == datetime(2025, 10, 1)
+
+
+def test_purge_in_batches(engine):
+    retention = RetentionEngine(engine.registry, engine, batch_size=50, now=lambda: NOW)
+    assert retention.purge() == {"events": 169, "ledger": 126}
+
+    assert _count(engine, "events") == 31
+    assert _count(engine, "ledger") == 74
+    assert _count(engine, "archive") == 200
+    # Nothing left to purge
+    assert retention.purge_table("events") == 0
+
+
+def test_purge_reports_failing_tables():
+    registry = SchemaRegistry()
+    registry.register(_events("accounts"))
+    registry.register(
+        _events(
+            "statements",
+            "indefinite",
+            columns=[
+                {"name": "id", "data_type": "integer", "primary_key": True},
+                {"name": "created_at", "data_type": "timestamp"},
+                {
+                    "name": "account_id",
+                    "data_type": "reference",
+                    "reference_table": "accounts",
+                },
+            ],
+        )
+    )
+    registry.register(_events())
+    engine = create_engine("sqlite://")
+
+    @event.listens_for(engine, "connect")
+    def enable_foreign_keys(dbapi_conn, _):
+        dbapi_conn.execute("PRAGMA foreign_keys=ON")
+
+    provision(registry, engine, max_workers=1)
+    loader = DataLoader(registry, engine)
+    for table in ("accounts", "events"):
+        loader.load_rows(
+            table,
+            ({"id": i, "created_at": NOW - timedelta(days=i)} for i in range(200)),
+        )
+    # A statement kept forever still references an expired account
+    loader.load_rows("statements", [{"id": 1, "created_at": NOW, "account_id": 150}])
+
+    retention = RetentionEngine(registry, engine, now=lambda: NOW)
+    with pytest.raises(RetentionError, match="Failed to purge 1 table") as exc_info:
+        retention.purge()
+    assert list(exc_info.value.errors) == ["accounts"]
+    assert "IntegrityError" in exc_info.value.errors["accounts"]
+    # The failing table does not stop the others
+    assert exc_info.value.deleted == {"events": 169}
+    assert _count(engine, "events") == 31
+    assert _count(engine, "accounts") == 200
+
+
+def test_purge_throttled(engine):
+    clock = [0.0]
+    sleeps = []
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        clock[0] += seconds
+
+    retention = RetentionEngine(
+        engine.registry,
+        engine,
+        batch_size=50,
+        rows_per_second=50,
+        now=lambda: NOW,
+        clock=lambda: clock[0],
+        sleep=sleep,
+    )
+    assert retention.purge_table("events") == 169
+    # The first batch uses the initial burst, the rest wait for tokens
+    assert sleeps == pytest.approx([1.0, 1.0, 0.38])
+
+
+def test_token_bucket_refills():
+    clock = [0.0]
+    sleeps = []
+    bucket = TokenBucket(10, clock=lambda: clock[0], sleep=sleeps.append)
+    bucket.acquire(10)
+    clock[0] = 0.5
+    bucket.acquire(5)
+    assert sleeps == []
+    bucket.acquire(5)
+    assert sleeps == [pytest.approx(0.5)]
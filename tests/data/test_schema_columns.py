@@ -0,0 +1,73 @@
+import pickle
+
+from src.data.schema import TableSchema, ColumnSchema, DataType
+from src.data.registry import SchemaRegistry
+
+
+def _table():
+    return TableSchema(
+        name="users",
+        columns=[
+            ColumnSchema(name="id", data_type=DataType.INTEGER, primary_key=True),
+            ColumnSchema(name="name", data_type=DataType.STRING),
+        ],
+    )
+
+
+def test_get_column():
+    table = _table()
+    column = table.get_column("name")
+    assert column is not None
+    assert column.data_type == DataType.STRING
+    assert table.get_column("missing") is None
+
+
+def test_column_index_rebuilt_on_assignment():
+    table = _table()
+    assert table.get_column("email") is None
+
+    table.columns = [ColumnSchema(name="email", data_type=DataType.STRING)]
+    assert table.get_column("email") is not None
+    assert table.get_column("id") is None
+
+
+def test_column_index_in_place_mutation():
+    table = _table()
+    assert table.get_column("email") is None
+
+    table.columns.append(ColumnSchema(name="email", data_type=DataType.STRING))
+    table.invalidate_column_index()
+    assert table.get_column("email") is not None
+
+
+def test_column_index_does_not_affect_equality_or_dump():
+    table = _table()
+    table.get_column("id")
+    assert table == _table()
+    assert "column_index" not in table.model_dump()
+
+
+def test_column_index_not_carried_by_copies_or_pickles():
+    table = _table()
+    assert table.get_column("name") is not None
+
+    copy = table.model_copy(
+        update={"columns": [ColumnSchema(name="b", data_type=DataType.STRING)]}
+    )
+    assert copy.get_column("b") is not None
+    assert copy.get_column("name") is None
+
+    restored = pickle.loads(pickle.dumps(table))
+    assert "column_index" not in vars(restored)
+    assert restored.get_column("name") is not None
+
+
+def test_registry_column_lookup():
+    registry = SchemaRegistry()
+    registry.register(_table())
+    column = registry.get_column("users", "id")
+    assert column is not None
+    assert column.primary_key
+
+    registry.unregister("users")
+    assert registry.get_column("users", "id") is None
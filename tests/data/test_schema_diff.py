@@ -0,0 +1,246 @@
+import pytest
+from sqlalchemy import Column, Index, Integer, MetaData, String, Table, create_engine
+from sqlalchemy.dialects import sqlite
+from src.data.schema import TableSchema, ColumnSchema, DataType
+from src.data.registry import SchemaRegistry
+from src.data.generator import SchemaGenerator
+from src.data.diff import (
+    diff_database,
+    diff_metadata,
+    diff_registries,
+    registry_metadata,
+)
+
+
+def _users(*extra):
+    return TableSchema(
+        name="users",
+        columns=[
+            ColumnSchema(name="id", data_type=DataType.INTEGER, primary_key=True),
+            ColumnSchema(name="name", data_type=DataType.STRING),
+            *extra,
+        ],
+    )
+
+
+def _posts(*extra):
+    return TableSchema(
+        name="posts",
+        columns=[
+            ColumnSchema(name="id", data_type=DataType.INTEGER, primary_key=True),
+            ColumnSchema(name="title", data_type=DataType.STRING),
+            *extra,
+        ],
+    )
+
+
+def _registry(*schemas):
+    registry = SchemaRegistry()
+    for schema in schemas:
+        registry.register(schema)
+    return registry
+
+
+@pytest.fixture
+def current():
+    return _registry(_users(), _posts())
+
+
+def test_identical_registries_produce_no_statements(current):
+    assert diff_registries(current, _registry(_users(), _posts())) == []
+
+
+def test_added_and_dropped_columns(current):
+    target = _registry(
+        TableSchema(
+            name="users",
+            columns=[
+                ColumnSchema(name="id", data_type=DataType.INTEGER, primary_key=True),
+                ColumnSchema(name="email", data_type=DataType.STRING, nullable=False),
+            ],
+        ),
+        _posts(),
+    )
+
+    assert diff_registries(current, target) == [
+        "ALTER TABLE users DROP COLUMN name;",
+        "ALTER TABLE users ADD COLUMN email VARCHAR(255) NOT NULL;",
+    ]
+
+
+def test_type_and_nullability_changes(current):
+    target = _registry(
+        TableSchema(
+            name="users",
+            columns=[
+                ColumnSchema(name="id", data_type=DataType.INTEGER, primary_key=True),
+                ColumnSchema(name="name", data_type=DataType.JSON, nullable=False),
+            ],
+        ),
+        _posts(),
+    )
+
+    assert diff_registries(current, target) == [
+        "ALTER TABLE users MODIFY COLUMN name JSON NOT NULL;",
+    ]
+
+
+def test_new_foreign_key_added_after_columns(current):
+    target = _registry(
+        _users(),
+        _posts(
+            ColumnSchema(
+                name="user_id", data_type=DataType.REFERENCE, reference_table="users"
+            )
+        ),
+    )
+
+    statements = diff_registries(current, target)
+    assert statements == [
+        "ALTER TABLE posts ADD COLUMN user_id INTEGER;",
+        "CREATE INDEX ix_posts_user_id ON posts (user_id);",
+        "ALTER TABLE posts ADD CONSTRAINT fk_posts_user_id_users "
+        "FOREIGN KEY(user_id) REFERENCES users (id);",
+    ]
+
+
+def test_new_and_dropped_tables_ordered_by_dependencies():
+    comments = TableSchema(
+        name="comments",
+        columns=[
+            ColumnSchema(name="id", data_type=DataType.INTEGER, primary_key=True),
+            ColumnSchema(
+                name="post_id", data_type=DataType.REFERENCE, reference_table="posts"
+            ),
+        ],
+    )
+    tags = TableSchema(
+        name="tags",
+        columns=[ColumnSchema(name="id", data_type=DataType.INTEGER, primary_key=True)],
+    )
+    current = _registry(_users(), _posts(), comments)
+    target = _registry(_users(), tags)
+
+    statements = diff_registries(current, target)
+    assert statements[0] == "DROP TABLE comments;"
+    assert statements[1] == "DROP TABLE posts;"
+    assert statements[2].startswith("CREATE TABLE tags")
+    assert len(statements) == 3
+
+
+def test_unique_constraint_changes(current):
+    target = _registry(
+        TableSchema(
+            name="users",
+            columns=[
+                ColumnSchema(name="id", data_type=DataType.INTEGER, primary_key=True),
+                ColumnSchema(name="name", data_type=DataType.STRING),
+            ],
+            composite_unique_constraints=[["id", "name"]],
+        ),
+        _posts(),
+    )
+
+    assert diff_registries(current, target) == [
+        "ALTER TABLE users ADD CONSTRAINT uq_users_id_name UNIQUE (id, name);"
+    ]
+    assert diff_registries(target, current) == [
+        "ALTER TABLE users DROP INDEX uq_users_id_name;"
+    ]
+
+
+def test_type_change_rebuilds_dependent_foreign_key():
+    posts = _posts(
+        ColumnSchema(
+            name="user_id", data_type=DataType.REFERENCE, reference_table="users"
+        )
+    )
+    current = _registry(_users(), posts)
+    target = _registry(
+        TableSchema(
+            name="users",
+            columns=[
+                ColumnSchema(name="id", data_type=DataType.STRING, primary_key=True),
+                ColumnSchema(name="name", data_type=DataType.STRING),
+            ],
+        ),
+        posts,
+    )
+
+    statements = diff_registries(current, target)
+    assert statements[0] == "ALTER TABLE posts DROP FOREIGN KEY fk_posts_user_id_users;"
+    assert statements[-1].startswith(
+        "ALTER TABLE posts ADD CONSTRAINT fk_posts_user_id_users"
+    )
+
+
+def test_diff_against_reflected_database(current):
+    engine = create_engine("sqlite://")
+    generator = SchemaGenerator(dialect=sqlite.dialect())
+    for schema in current.get_ordered_schemas():
+        generator.create_table_from_schema(schema)
+    generator.metadata.create_all(engine)
+
+    assert diff_database(engine, current) == []
+
+    target = _registry(
+        _users(ColumnSchema(name="active", data_type=DataType.BOOLEAN)), _posts()
+    )
+    assert diff_database(engine, target) == [
+        "ALTER TABLE users ADD COLUMN active BOOL;"
+    ]
+
+
+def test_unknown_tables_dropped_only_on_request(current, caplog):
+    engine = create_engine("sqlite://")
+    generator = SchemaGenerator(dialect=sqlite.dialect())
+    for schema in current.get_ordered_schemas():
+        generator.create_table_from_schema(schema)
+    Table("legacy", generator.metadata, Column("id", Integer, primary_key=True))
+    generator.metadata.create_all(engine)
+
+    with caplog.at_level("WARNING", logger="src.data.diff"):
+        assert diff_database(engine, current) == []
+    assert "Leaving tables not in the registry: legacy" in caplog.text
+
+    assert diff_database(engine, current, drop_unknown_tables=True) == [
+        "DROP TABLE legacy;"
+    ]
+
+
+def test_unique_indexes_match_unique_constraints():
+    target = _registry(
+        TableSchema(
+            name="users",
+            columns=[
+                ColumnSchema(name="id", data_type=DataType.INTEGER, primary_key=True),
+                ColumnSchema(name="name", data_type=DataType.STRING),
+                ColumnSchema(name="email", data_type=DataType.STRING, unique=True),
+            ],
+            composite_unique_constraints=[["id", "name"]],
+        )
+    )
+    # MySQL reflects unique constraints as unique indexes
+    reflected = MetaData()
+    Table(
+        "users",
+        reflected,
+        Column("id", Integer, primary_key=True),
+        Column("name", String(255)),
+        Column("email", String(255)),
+        Index("email", "email", unique=True),
+        Index("uq_users_id_name", "id", "name", unique=True),
+    )
+    assert diff_metadata(reflected, registry_metadata(target)) == []
+
+    current = _registry(_users())
+    assert diff_metadata(registry_metadata(current), reflected) == [
+        "ALTER TABLE users ADD COLUMN email VARCHAR(255);",
+        "CREATE UNIQUE INDEX email ON users (email);",
+        "CREATE UNIQUE INDEX uq_users_id_name ON users (id, name);",
+    ]
+    assert diff_metadata(reflected, registry_metadata(current)) == [
+        "DROP INDEX email ON users;",
+        "DROP INDEX uq_users_id_name ON users;",
+        "ALTER TABLE users DROP COLUMN email;",
+    ]
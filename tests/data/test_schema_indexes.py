@@ -0,0 +1,150 @@
+import pytest
+from pydantic import ValidationError
+
+from src.data.generator import SchemaGenerator
+from src.data.registry import SchemaRegistry
+from src.data.schema import TableSchema
+
+
+def _events(**extra):
+    data = {
+        "name": "events",
+        "category": "dynamic",
+        "columns": [
+            {"name": "id", "data_type": "integer", "primary_key": True},
+            {"name": "created_at", "data_type": "timestamp", "primary_key": True},
+            {"name": "kind", "data_type": "string"},
+            {"name": "payload", "data_type": "json"},
+        ],
+    }
+    data.update(extra)
+    return TableSchema.model_validate(data)
+
+
+def test_declared_indexes_emitted():
+    schema = _events(
+        indexes=[
+            {"columns": ["kind", "created_at"]},
+            {
+                "name": "ix_events_kind_payload",
+                "columns": ["kind"],
+                "include": ["payload"],
+            },
+            {"columns": ["id", "created_at", "kind"], "unique": True},
+        ]
+    )
+    statements = SchemaGenerator().table_statements(schema)
+    assert statements[1:] == [
+        "CREATE UNIQUE INDEX ix_events_id_created_at_kind ON events (id, created_at, kind);",
+        "CREATE INDEX ix_events_kind_created_at ON events (kind, created_at);",
+        "CREATE INDEX ix_events_kind_payload ON events (kind, payload);",
+    ]
+
+
+def test_index_columns_validated():
+    with pytest.raises(ValidationError, match="unknown column 'missing'"):
+        _events(indexes=[{"columns": ["missing"]}])
+    with pytest.raises(ValidationError, match="includes key columns"):
+        _events(indexes=[{"columns": ["kind"], "include": ["kind"]}])
+    with pytest.raises(ValidationError, match="unique index cannot include"):
+        _events(indexes=[{"columns": ["kind"], "unique": True, "include": ["id"]}])
+
+
+def test_range_partition_clause():
+    schema = _events(
+        partition={
+            "type": "range",
+            "columns": ["created_at"],
+            "boundaries": ["2025-01-01", "2026-01-01"],
+        }
+    )
+    ddl = SchemaGenerator().table_statements(schema)[0]
+    assert ddl.endswith(
+        "PARTITION BY RANGE COLUMNS(created_at) ("
+        "PARTITION p0 VALUES LESS THAN ('2025-01-01'), "
+        "PARTITION p1 VALUES LESS THAN ('2026-01-01'), "
+        "PARTITION pmax VALUES LESS THAN (MAXVALUE));"
+    )
+
+
+def test_hash_partition_clause():
+    schema = _events(partition={"type": "hash", "columns": ["id"], "count": 8})
+    ddl = SchemaGenerator().table_statements(schema)[0]
+    assert ddl.endswith("PARTITION BY HASH(id) PARTITIONS 8;")
+
+
+def test_partition_validated():
+    with pytest.raises(ValidationError, match="requires boundaries"):
+        _events(partition={"type": "range", "columns": ["created_at"]})
+    with pytest.raises(ValidationError, match="requires a count"):
+        _events(partition={"type": "key", "columns": ["id"]})
+    with pytest.raises(ValidationError, match="unknown column"):
+        _events(partition={"type": "hash", "columns": ["nope"], "count": 2})
+    with pytest.raises(ValidationError, match="must include partitioning columns"):
+        _events(
+            partition={"type": "hash", "columns": ["id"], "count": 2},
+            indexes=[{"columns": ["kind"], "unique": True}],
+        )
+
+
+def test_partition_column_types():
+    with pytest.raises(ValidationError, match="HASH partitioning requires an INTEGER"):
+        _events(
+            partition={"type": "hash", "columns": ["kind"], "count": 4},
+            columns=[
+                {"name": "kind", "data_type": "string", "primary_key": True},
+            ],
+        )
+    with pytest.raises(ValidationError, match="does not support JSON column"):
+        _events(
+            partition={"type": "range", "columns": ["payload"], "boundaries": ["1"]},
+            columns=[{"name": "payload", "data_type": "json"}],
+        )
+    with pytest.raises(ValidationError, match="KEY partitioning does not support"):
+        _events(
+            partition={"type": "key", "columns": ["payload"], "count": 4},
+            columns=[{"name": "payload", "data_type": "json"}],
+        )
+    # KEY partitioning hashes any other type
+    schema = _events(
+        partition={"type": "key", "columns": ["kind"], "count": 4},
+        columns=[{"name": "kind", "data_type": "string", "primary_key": True}],
+    )
+    ddl = SchemaGenerator().table_statements(schema)[0]
+    assert ddl.endswith("PARTITION BY KEY(kind) PARTITIONS 4;")
+
+
+def test_partitioned_tables_have_no_foreign_keys():
+    reference = {
+        "name": "user_id",
+        "data_type": "reference",
+        "reference_table": "users",
+    }
+    with pytest.raises(ValidationError, match="cannot have REFERENCE columns"):
+        _events(
+            partition={"type": "key", "columns": ["id"], "count": 4},
+            columns=[
+                {"name": "id", "data_type": "integer", "primary_key": True},
+                reference,
+            ],
+        )
+
+    registry = SchemaRegistry()
+    registry.register(
+        _events(partition={"type": "hash", "columns": ["id"], "count": 4})
+    )
+    registry.register(
+        TableSchema.model_validate(
+            {
+                "name": "alerts",
+                "columns": [
+                    {"name": "id", "data_type": "integer", "primary_key": True},
+                    {**reference, "name": "event_id", "reference_table": "events"},
+                ],
+            }
+        )
+    )
+    assert registry.validate() == [
+        "alerts.event_id: References partitioned table 'events'; MySQL does not "
+        "support foreign keys to partitioned tables"
+    ]
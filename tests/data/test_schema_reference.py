@@ -2,7 +2,8 @@ import pytest
 from sqlalchemy.dialects import mysql
 
 from src.data.schema import TableSchema, ColumnSchema, DataType
-from src.data.generator import SchemaGenerator
+from src.data.generator import ProtobufGenerator, SchemaGenerator
+from src.data.registry import SchemaRegistry
 
 
 def dump(sql, *multiparams, **params):
@@ -77,3 +78,124 @@ def test_missing_reference_table_error():
         "Column ref_col is of type REFERENCE but has no reference_table defined"
         in str(excinfo.value)
     )
+
+
+def _string_keyed_catalog():
+    countries = TableSchema(
+        name="countries",
+        columns=[
+            ColumnSchema(name="code", data_type=DataType.STRING, primary_key=True),
+        ],
+    )
+    cities = TableSchema(
+        name="cities",
+        columns=[
+            ColumnSchema(name="id", data_type=DataType.INTEGER, primary_key=True),
+            ColumnSchema(
+                name="country_code",
+                data_type=DataType.REFERENCE,
+                reference_table="countries",
+                reference_column="code",
+            ),
+        ],
+    )
+    registry = SchemaRegistry()
+    registry.register(countries)
+    registry.register(cities)
+    return registry, [countries, cities]
+
+
+def test_reference_takes_resolved_target_type():
+    registry, tables = _string_keyed_catalog()
+    generator = SchemaGenerator(resolved_columns=registry.resolve_all(strict=False))
+    ddl = generator.generate_ddl(tables)
+    assert "country_code VARCHAR(255)" in ddl
+
+    proto = ProtobufGenerator(
+        resolved_columns=registry.resolve_all(strict=False)
+    ).generate_proto(tables)
+    assert "  string country_code = 2;" in proto
+
+    # Without resolved targets references fall back to integer keys
+    assert "country_code INTEGER" in SchemaGenerator().generate_ddl(tables)
+    assert "  int32 country_code = 2;" in ProtobufGenerator().generate_proto(tables)
+
+
+def test_reference_columns_indexed():
+    registry, tables = _string_keyed_catalog()
+    generator = SchemaGenerator()
+    generator.create_table_from_schema(tables[0])
+    statements = generator.table_statements(tables[1])
+    assert statements[1:] == [
+        "CREATE INDEX ix_cities_country_code ON cities (country_code);"
+    ]
+    assert "CREATE INDEX ix_cities_country_code" in registry.get_table_ddl("cities")
+    assert "country_code VARCHAR(255)" in registry.get_table_ddl("cities")
+
+
+def test_unique_reference_not_indexed_twice():
+    schema = TableSchema(
+        name="profiles",
+        columns=[
+            ColumnSchema(name="id", data_type=DataType.INTEGER, primary_key=True),
+            ColumnSchema(
+                name="user_id",
+                data_type=DataType.REFERENCE,
+                reference_table="profiles",
+                unique=True,
+            ),
+        ],
+    )
+    assert len(SchemaGenerator().table_statements(schema)) == 1
+
+
+def test_multi_hop_enum_reference_uses_owning_table():
+    # a.b_cs -> b.c_status -> c.status, an unnamed enum owned by c
+    c = TableSchema(
+        name="c",
+        columns=[
+            ColumnSchema(
+                name="status",
+                data_type=DataType.ENUM,
+                enum_values=["open", "closed"],
+                primary_key=True,
+            ),
+        ],
+    )
+    b = TableSchema(
+        name="b",
+        columns=[
+            ColumnSchema(
+                name="c_status",
+                data_type=DataType.REFERENCE,
+                reference_table="c",
+                reference_column="status",
+                primary_key=True,
+            ),
+        ],
+    )
+    a = TableSchema(
+        name="a",
+        columns=[
+            ColumnSchema(name="id", data_type=DataType.INTEGER, primary_key=True),
+            ColumnSchema(
+                name="b_cs",
+                data_type=DataType.REFERENCE,
+                reference_table="b",
+                reference_column="c_status",
+            ),
+        ],
+    )
+    registry = SchemaRegistry()
+    for table in (c, b, a):
+        registry.register(table)
+    assert registry.resolve_target_column("a", "b_cs") == ("c", c.columns[0])
+
+    resolved = registry.resolve_all(strict=False)
+    proto = ProtobufGenerator(resolved_columns=resolved).generate_proto([c, b, a])
+    assert "  CStatusEnum b_cs = 2;" in proto
+    assert "BStatusEnum" not in proto
+    assert proto.count("enum CStatusEnum {") == 1
+
+    ddl = SchemaGenerator(resolved_columns=resolved).generate_ddl([c, b, a])
+    assert "b_cs ENUM('open','closed')" in ddl
@@ -0,0 +1,92 @@
+import pytest
+from pydantic import ValidationError
+
+from src.data.generator import ProtobufGenerator, SchemaGenerator
+from src.data.registry import SchemaRegistry
+from src.data.schema import ColumnSchema, DataType, TableSchema
+
+
+def _accounts():
+    return TableSchema(
+        name="accounts",
+        columns=[
+            ColumnSchema(
+                name="id", data_type=DataType.INTEGER, width=64, primary_key=True
+            ),
+            ColumnSchema(name="rank", data_type=DataType.INTEGER, width=16),
+            ColumnSchema(name="handle", data_type=DataType.STRING, length=32),
+            ColumnSchema(
+                name="country",
+                data_type=DataType.STRING,
+                length=2,
+                fixed_length=True,
+            ),
+            ColumnSchema(name="bio", data_type=DataType.TEXT),
+            ColumnSchema(
+                name="balance", data_type=DataType.DECIMAL, precision=12, scale=2
+            ),
+            ColumnSchema(name="external_id", data_type=DataType.UUID),
+        ],
+    )
+
+
+def test_sized_sql_types():
+    ddl = SchemaGenerator().generate_ddl([_accounts()])
+    assert "id BIGINT AUTO_INCREMENT" in ddl
+    assert "`rank` SMALLINT" in ddl
+    assert "handle VARCHAR(32)" in ddl
+    assert "country CHAR(2)" in ddl
+    assert "bio TEXT" in ddl
+    assert "balance DECIMAL(12, 2)" in ddl
+    assert "external_id BINARY(16)" in ddl
+
+
+def test_sized_proto_types():
+    proto = ProtobufGenerator().generate_proto([_accounts()])
+    assert "  int64 id = 1;" in proto
+    assert "  int32 rank = 2;" in proto
+    assert "  string balance = 6;" in proto
+    assert "  bytes external_id = 7;" in proto
+
+
+def test_reference_to_bigint_key():
+    orders = TableSchema(
+        name="orders",
+        columns=[
+            ColumnSchema(name="id", data_type=DataType.INTEGER, primary_key=True),
+            ColumnSchema(
+                name="account_id",
+                data_type=DataType.REFERENCE,
+                reference_table="accounts",
+            ),
+        ],
+    )
+    registry = SchemaRegistry()
+    registry.register(_accounts())
+    registry.register(orders)
+
+    assert "account_id BIGINT" in registry.get_table_ddl("orders")
+    proto = ProtobufGenerator(
+        resolved_columns=registry.resolve_all(strict=False)
+    ).generate_proto([orders])
+    assert "  int64 account_id = 2;" in proto
+
+
+@pytest.mark.parametrize(
+    "options, message",
+    [
+        ({"data_type": DataType.TEXT, "length": 10}, "length only applies"),
+        ({"data_type": DataType.STRING, "fixed_length": True}, "requires a length"),
+        ({"data_type": DataType.FLOAT, "precision": 5}, "only apply to DECIMAL"),
+        (
+            {"data_type": DataType.DECIMAL, "precision": 2, "scale": 4},
+            "at least the scale",
+        ),
+        ({"data_type": DataType.DECIMAL}, "DECIMAL requires a precision"),
+        ({"data_type": DataType.INTEGER, "width": 8}, "must be 16, 32 or 64"),
+        ({"data_type": DataType.STRING, "width": 64}, "only applies to INTEGER"),
+    ],
+)
+def test_type_options_validated(options, message):
+    with pytest.raises(ValidationError, match=message):
+        ColumnSchema(name="value", **options)
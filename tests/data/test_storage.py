@@ -115,3 +115,26 @@ def test_schema_serialization(yaml_storage, tmp_path):
     assert loaded_table.name == "users"
     assert loaded_table.columns[0].name == "id"
     assert loaded_table.columns[0].data_type == DataType.INTEGER
+
+
+def test_fast_load_returns_plain_types(yaml_storage, tmp_path):
+    """Test that the fast loader returns plain dicts and lists."""
+    file_path = tmp_path / "fast.yaml"
+    file_path.write_text(
+        "# comment\nname: 'quoted'\nitems:\n  - 1\n  - two\n", encoding="utf-8"
+    )
+
+    data = yaml_storage.load(file_path, fast=True)
+
+    assert type(data) is dict
+    assert type(data["items"]) is list
+    assert data == {"name": "quoted", "items": [1, "two"]}
+
+
+def test_fast_load_invalid_yaml(yaml_storage, tmp_path):
+    """Test that the fast loader reports parse errors the same way."""
+    file_path = tmp_path / "invalid.yaml"
+    file_path.write_text("key: value: invalid", encoding="utf-8")
+
+    with pytest.raises(YAMLError):
+        yaml_storage.load(file_path, fast=True)
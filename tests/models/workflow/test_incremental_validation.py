@@ -0,0 +1,161 @@
+import random
+import uuid
+
+import pytest
+
+from src.models.workflow.definition import WorkflowDefinition
+from src.models.workflow.edge import WorkflowEdge
+from src.models.workflow.enums import WorkflowNodeType
+from src.models.workflow.incremental import IncrementalWorkflowValidator
+from src.models.workflow.node import ProcessNode, TriggerNode, WorkflowNode
+from src.models.workflow.properties import ProcessProps, TriggerProps
+from src.models.workflow.validation import validate_connectivity
+
+
+def _node(node_id: str, trigger: bool = False) -> WorkflowNode:
+    if trigger:
+        return TriggerNode(
+            id=node_id,
+            label=node_id,
+            type=WorkflowNodeType.TRIGGER,
+            properties=TriggerProps(event_type="m"),
+        )
+    return ProcessNode(
+        id=node_id,
+        label=node_id,
+        type=WorkflowNodeType.PROCESS,
+        properties=ProcessProps(),
+    )
+
+
+def _edge(source: str, target: str) -> WorkflowEdge:
+    return WorkflowEdge(source_id=source, target_id=target)
+
+
+def _workflow():
+    return WorkflowDefinition(
+        id=uuid.uuid4(),
+        name="Editing",
+        nodes=[_node("t", trigger=True), _node("a"), _node("b")],
+        edges=[_edge("t", "a"), _edge("a", "b")],
+    )
+
+
+def test_edits_report_changed_errors():
+    wf = _workflow()
+    validator = IncrementalWorkflowValidator(wf)
+    assert validator.errors == []
+
+    delta = validator.add_node(_node("c"))
+    assert delta.added == {"Unreachable nodes found (Islands): c"}
+    assert not delta.removed
+
+    delta = validator.add_edge(_edge("b", "c"))
+    assert delta.removed == {"Unreachable nodes found (Islands): c"}
+
+    delta = validator.add_edge(_edge("c", "a"))
+    assert delta.added == {"Cycle detected involving nodes: a, b, c"}
+
+    # A parallel edge keeps the cycle when one copy is removed
+    assert not validator.add_edge(_edge("c", "a"))
+    assert not validator.remove_edge("c", "a")
+    delta = validator.remove_edge("c", "a")
+    assert delta.removed == {"Cycle detected involving nodes: a, b, c"}
+
+    delta = validator.remove_edge("t", "a")
+    assert delta.added == {"Unreachable nodes found (Islands): a, b, c"}
+    # The last edge takes the removed edge's place
+    assert [e.target_id for e in wf.edges] == ["c", "b"]
+
+
+def test_dangling_edges_and_triggers():
+    wf = _workflow()
+    validator = IncrementalWorkflowValidator(wf)
+
+    delta = validator.add_edge(_edge("b", "d"))
+    assert delta.added == {"Edge target d does not exist"}
+    delta = validator.add_node(_node("d"))
+    assert delta.removed == {"Edge target d does not exist"}
+    assert not delta.added
+
+    delta = validator.remove_node("t")
+    assert delta.added == {
+        "Workflow must have at least one Trigger node",
+        "Unreachable nodes found (Islands): d, a, b",
+    }
+    # The last node takes the removed node's place
+    assert [n.id for n in wf.nodes] == ["d", "a", "b"]
+    assert all("t" not in (e.source_id, e.target_id) for e in wf.edges)
+
+    with pytest.raises(ValueError, match="already exists"):
+        validator.add_node(_node("a"))
+    with pytest.raises(ValueError, match="No edge"):
+        validator.remove_edge("a", "d")
+
+
+def test_matches_full_validation():
+    rng = random.Random(42)
+    for _ in range(50):
+        count = rng.randint(1, 15)
+        names = [f"n{i}" for i in range(count + 3)]
+        wf = WorkflowDefinition(
+            id=uuid.uuid4(),
+            name="Random",
+            nodes=[_node(n, trigger=i == 0) for i, n in enumerate(names[:count])],
+            edges=[
+                _edge(rng.choice(names), rng.choice(names))
+                for _ in range(rng.randint(0, 20))
+            ],
+        )
+        validator = IncrementalWorkflowValidator(wf)
+        assert validator.errors == validate_connectivity(wf)
+
+        for _ in range(30):
+            before = set(validator.errors)
+            present = [n.id for n in wf.nodes]
+            roll = rng.random()
+            if roll < 0.4:
+                delta = validator.add_edge(_edge(rng.choice(names), rng.choice(names)))
+            elif roll < 0.7 and wf.edges:
+                edge = rng.choice(wf.edges)
+                delta = validator.remove_edge(edge.source_id, edge.target_id)
+            elif roll < 0.85 and len(present) < len(names):
+                missing = [n for n in names if n not in present]
+                delta = validator.add_node(
+                    _node(rng.choice(missing), trigger=rng.random() < 0.2)
+                )
+            elif present:
+                delta = validator.remove_node(rng.choice(present))
+            else:
+                continue
+
+            expected = validate_connectivity(wf)
+            assert validator.errors == expected
+            assert delta.added == set(expected) - before
+            assert delta.removed == before - set(expected)
+
+
+def test_edits_on_a_long_chain_stay_local():
+    # Edges that agree with the topological order, and removals, must not
+    # walk the rest of the chain or the definition's lists
+    count = 20_000
+    names = [f"n{i}" for i in range(count)]
+    wf = WorkflowDefinition(
+        id=uuid.uuid4(),
+        name="Chain",
+        nodes=[_node(n, trigger=i == 0) for i, n in enumerate(names)],
+        edges=[_edge(a, b) for a, b in zip(names, names[1:])],
+    )
+    validator = IncrementalWorkflowValidator(wf)
+    for i in range(2_000):
+        assert not validator.add_edge(_edge(names[i], names[i + 1]))
+        assert not validator.remove_edge(names[i], names[i + 1])
+        validator.remove_edge(names[-2], names[-1])
+        validator.add_edge(_edge(names[-2], names[-1]))
+    assert len(wf.edges) == count - 1
+    assert validator.errors == []
+
+    # Closing a cycle around the start of the chain only visits its span
+    delta = validator.add_edge(_edge(names[2], names[1]))
+    assert delta.added == {"Cycle detected involving nodes: n1, n2"}
+    assert validator.errors == validate_connectivity(wf)
@@ -0,0 +1,111 @@
+import pickle
+import uuid
+
+from src.models.workflow.definition import WorkflowDefinition
+from src.models.workflow.edge import WorkflowEdge
+from src.models.workflow.enums import WorkflowNodeType
+from src.models.workflow.graph import WorkflowGraph
+from src.models.workflow.node import CompletionNode, ProcessNode, TriggerNode
+from src.models.workflow.properties import EmptyProps, ProcessProps, TriggerProps
+from src.models.workflow.validation import validate_connectivity
+
+
+def _workflow():
+    return WorkflowDefinition(
+        id=uuid.uuid4(),
+        name="Graph",
+        nodes=[
+            TriggerNode(
+                id="t",
+                label="T",
+                type=WorkflowNodeType.TRIGGER,
+                properties=TriggerProps(event_type="m"),
+            ),
+            ProcessNode(
+                id="a",
+                label="A",
+                type=WorkflowNodeType.PROCESS,
+                properties=ProcessProps(),
+            ),
+            ProcessNode(
+                id="b",
+                label="B",
+                type=WorkflowNodeType.PROCESS,
+                properties=ProcessProps(),
+            ),
+            CompletionNode(
+                id="end",
+                label="End",
+                type=WorkflowNodeType.COMPLETION,
+                properties=EmptyProps(),
+            ),
+        ],
+        edges=[
+            WorkflowEdge(source_id="t", target_id="a"),
+            WorkflowEdge(source_id="t", target_id="b"),
+            WorkflowEdge(source_id="a", target_id="end"),
+            WorkflowEdge(source_id="b", target_id="end"),
+            WorkflowEdge(source_id="b", target_id="missing"),
+        ],
+    )
+
+
+def test_graph_index():
+    graph = _workflow().graph
+    assert len(graph) == 4
+    assert graph.triggers == ["t"]
+    node = graph.node("a")
+    assert node is not None and node.label == "A"
+    assert graph.node("missing") is None
+    assert "end" in graph and "missing" not in graph
+
+    assert graph.successors("t") == ["a", "b"]
+    assert graph.predecessors("end") == ["a", "b"]
+    assert graph.in_degree("end") == 2
+    assert graph.out_degree("b") == 1
+    assert [e.target_id for e in graph.edges_from("t")] == ["a", "b"]
+    assert [e.target_id for e in graph.dangling_edges] == ["missing"]
+
+
+def test_reachability():
+    graph = _workflow().graph
+    assert graph.reachable_from() == {"t", "a", "b", "end"}
+    assert graph.reachable_from(["b"]) == {"b", "end"}
+
+
+def test_graph_cached_until_changed():
+    wf = _workflow()
+    graph = wf.graph
+    assert wf.graph is graph
+
+    wf.edges = wf.edges[:2]
+    assert wf.graph is not graph
+    assert wf.graph.predecessors("end") == []
+
+    graph = wf.graph
+    wf.edges.append(WorkflowEdge(source_id="a", target_id="end"))
+    assert wf.graph is graph
+    wf.invalidate_graph()
+    assert wf.graph.predecessors("end") == ["a"]
+
+
+def test_graph_not_serialized():
+    wf = _workflow()
+    assert isinstance(wf.graph, WorkflowGraph)
+    assert "graph" not in wf.model_dump()
+    assert WorkflowDefinition.model_validate_json(wf.model_dump_json()) == wf
+
+
+def test_graph_not_carried_by_copies_or_pickles():
+    wf = _workflow()
+    assert wf.graph.predecessors("end") == ["a", "b"]
+
+    copy = wf.model_copy(update={"edges": []})
+    assert copy.graph.predecessors("end") == []
+    assert validate_connectivity(copy) == [
+        "Unreachable nodes found (Islands): a, b, end"
+    ]
+
+    restored = pickle.loads(pickle.dumps(wf))
+    assert "graph" not in vars(restored)
+    assert restored.graph.predecessors("end") == ["a", "b"]
@@ -1,6 +1,8 @@
 import pytest
 import uuid
+from typing import List
 from src.models.workflow.node import (
+    WorkflowNode,
     TriggerNode,
     ProcessNode,
     CompletionNode,
@@ -9,7 +11,7 @@ from src.models.workflow.edge import WorkflowEdge
 from src.models.workflow.definition import WorkflowDefinition
 from src.models.workflow.properties import TriggerProps, ProcessProps, EmptyProps
 from src.models.workflow.enums import WorkflowNodeType
-from src.models.workflow.validation import validate_workflow
+from src.models.workflow.validation import validate_connectivity, validate_workflow
 
 
 @pytest.fixture
@@ -180,3 +182,54 @@ def test_polymorphic_deserialization():
     assert isinstance(wf.nodes[1], ProcessNode)
     assert wf.nodes[0].properties.event_type == "api"
     assert wf.nodes[1].properties.handler_ref == "ref"
+
+
+def _chain_workflow(node_count, extra_edges=()):
+    nodes: List[WorkflowNode] = [
+        TriggerNode(
+            id="n0",
+            label="T",
+            type=WorkflowNodeType.TRIGGER,
+            properties=TriggerProps(event_type="m"),
+        )
+    ]
+    nodes.extend(
+        ProcessNode(
+            id=f"n{i}",
+            label="P",
+            type=WorkflowNodeType.PROCESS,
+            properties=ProcessProps(),
+        )
+        for i in range(1, node_count)
+    )
+    edges = [
+        WorkflowEdge(source_id=f"n{i}", target_id=f"n{i + 1}")
+        for i in range(node_count - 1)
+    ]
+    edges.extend(WorkflowEdge(source_id=s, target_id=t) for s, t in extra_edges)
+    return WorkflowDefinition(id=uuid.uuid4(), name="Chain", nodes=nodes, edges=edges)
+
+
+def test_validation_reports_every_cycle():
+    wf = _chain_workflow(8, [("n3", "n1"), ("n5", "n5"), ("n7", "n6"), ("n6", "n4")])
+    assert validate_connectivity(wf) == [
+        "Cycle detected involving nodes: n1, n2, n3",
+        "Cycle detected involving nodes: n4, n5, n6, n7",
+    ]
+
+    wf = _chain_workflow(3, [("n2", "n2")])
+    assert validate_connectivity(wf) == ["Cycle detected involving nodes: n2"]
+
+
+def test_validation_islands_in_declaration_order():
+    wf = _chain_workflow(4)
+    wf.edges = wf.edges[:1]
+    assert validate_connectivity(wf) == ["Unreachable nodes found (Islands): n2, n3"]
+
+
+def test_validation_long_chain():
+    # Deeper than the recursion limit
+    wf = _chain_workflow(100_000, [("n99999", "n50000")])
+    errors = validate_connectivity(wf)
+    assert len(errors) == 1
+    assert errors[0].startswith("Cycle detected involving nodes: n50000, n50001")
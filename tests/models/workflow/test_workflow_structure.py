@@ -0,0 +1,159 @@
+import uuid
+from typing import Dict, Optional
+
+from src.models.workflow.definition import WorkflowDefinition
+from src.models.workflow.edge import WorkflowEdge
+from src.models.workflow.enums import WorkflowNodeType
+from src.models.workflow.graph import dominator_tree
+from src.models.workflow.node import (
+    BranchNode,
+    CompletionNode,
+    DecisionNode,
+    JoinNode,
+    ProcessNode,
+    TriggerNode,
+    WorkflowNode,
+)
+from src.models.workflow.properties import EmptyProps, ProcessProps, TriggerProps
+from src.models.workflow.validation import validate_structure, validate_workflow
+
+_TYPES = {
+    "t": WorkflowNodeType.TRIGGER,
+    "p": WorkflowNodeType.PROCESS,
+    "d": WorkflowNodeType.DECISION,
+    "b": WorkflowNodeType.BRANCH,
+    "j": WorkflowNodeType.JOIN,
+    "end": WorkflowNodeType.COMPLETION,
+}
+
+
+def _node(node_id: str) -> WorkflowNode:
+    # The id prefix picks the node type, e.g. "b1" is a Branch
+    node_type = _TYPES[node_id.rstrip("0123456789")]
+    if node_type == WorkflowNodeType.TRIGGER:
+        return TriggerNode(
+            id=node_id,
+            label=node_id,
+            type=node_type,
+            properties=TriggerProps(event_type="m"),
+        )
+    if node_type == WorkflowNodeType.PROCESS:
+        return ProcessNode(
+            id=node_id, label=node_id, type=node_type, properties=ProcessProps()
+        )
+    node_class = {
+        WorkflowNodeType.DECISION: DecisionNode,
+        WorkflowNodeType.BRANCH: BranchNode,
+        WorkflowNodeType.JOIN: JoinNode,
+        WorkflowNodeType.COMPLETION: CompletionNode,
+    }[node_type]
+    return node_class(
+        id=node_id, label=node_id, type=node_type, properties=EmptyProps()
+    )
+
+
+def _workflow(*edges: str) -> WorkflowDefinition:
+    """Builds a workflow from "source>target" or "source>target:condition" edges."""
+    node_ids: Dict[str, None] = {}
+    workflow_edges = []
+    for spec in edges:
+        route, _, condition = spec.partition(":")
+        source, target = route.split(">")
+        node_ids.setdefault(source)
+        node_ids.setdefault(target)
+        cond: Optional[str] = condition or None
+        workflow_edges.append(
+            WorkflowEdge(source_id=source, target_id=target, condition=cond)
+        )
+    return WorkflowDefinition(
+        id=uuid.uuid4(),
+        name="Structure",
+        nodes=[_node(n) for n in node_ids],
+        edges=workflow_edges,
+    )
+
+
+def test_well_formed_workflow():
+    wf = _workflow(
+        "t>p1",
+        "p1>d1",
+        "d1>b1:approved",
+        "d1>p4:rejected",
+        "b1>p2",
+        "b1>b2",
+        "b2>p5",
+        "b2>p6",
+        "p5>j2",
+        "p6>j2",
+        "j2>j1",
+        "p2>j1",
+        "j1>p3",
+        "p3>end",
+        "p4>end",
+    )
+    assert validate_workflow(wf) == []
+
+
+def test_paths_must_reach_completion():
+    wf = _workflow("t>d1:yes", "t>p1", "d1>end:yes", "d1>p2:no", "p2>p3", "p3>p2")
+    errors = validate_structure(wf)
+    assert errors == ["Nodes cannot reach a Completion node: p1, p2, p3"]
+
+    wf = _workflow("t>p1")
+    assert validate_structure(wf) == ["Workflow must have at least one Completion node"]
+
+
+def test_decisions_need_conditions():
+    wf = _workflow("t>d1", "d1>p1:ok", "d1>p2", "d1>p3: ", "p1>end", "p2>end", "p3>end")
+    assert validate_structure(wf) == [
+        "Decision node d1 has outgoing edges without a condition: p2, p3"
+    ]
+
+    wf = _workflow("t>d1", "t>end")
+    assert "Decision node d1 has no outgoing edges" in validate_structure(wf)
+
+
+def test_branch_join_pairing():
+    # The arms of b1 never meet again
+    wf = _workflow("t>b1", "b1>p1", "b1>p2", "p1>end", "p2>end")
+    assert validate_structure(wf) == ["Branch node b1 has no matching Join node"]
+
+    # Exclusive decision paths cannot be joined
+    wf = _workflow("t>d1", "d1>p1:a", "d1>p2:b", "p1>j1", "p2>j1", "j1>end")
+    assert validate_structure(wf) == ["Join node j1 has no matching Branch node"]
+
+    # One arm escapes past the join
+    wf = _workflow("t>b1", "b1>p1", "b1>p2", "p1>j1", "p2>j1", "p2>end", "j1>end")
+    assert validate_structure(wf) == [
+        "Branch node b1 has no matching Join node",
+        "Join node j1 has no matching Branch node",
+    ]
+
+
+def test_dominator_tree():
+    # 0 -> 1 -> {2, 3} -> 4 -> 1 (loop); 5 is unreachable
+    successors = [[1], [2, 3], [4], [4], [1], [4]]
+    predecessors = [[], [0, 4], [1], [1], [2, 3, 5], []]
+    reached, idom = dominator_tree(successors, predecessors, [0])
+    assert reached == [True, True, True, True, True, False]
+    assert idom == [6, 0, 1, 1, 1, -1]
+
+    reached, ipdom = dominator_tree(predecessors, successors, [4])
+    assert ipdom[1] == 4 and ipdom[2] == 4 and ipdom[4] == 6
+
+
+def test_many_edges_into_one_node():
+    # Every step of a long chain also routes to one shared handler (p0); the
+    # dominator computation must stay near-linear for this shape
+    steps = 50_000
+    edges = ["t>p1", f"p{steps}>end", "p0>end"]
+    for i in range(1, steps):
+        edges.append(f"p{i}>p{i + 1}")
+    edges.extend(f"p{i}>p0" for i in range(1, steps + 1))
+    wf = _workflow(*edges)
+    assert validate_workflow(wf) == []
+
+    flow = wf.graph.flow
+    handler = wf.graph.positions["p0"]
+    assert wf.graph.node_ids[flow.idom[handler]] == "p1"
+    assert flow.ipdom[handler] == wf.graph.positions["end"]
@@ -0,0 +1,94 @@
+import json
+
+import pytest
+
+from src.scripts.benchmark import (
+    BenchmarkSuite,
+    Measurement,
+    compare,
+    load_baseline,
+    main,
+    measure,
+    save_baseline,
+)
+
+
+def test_measure_runs_setup_each_time():
+    inputs = []
+
+    def setup():
+        inputs.append([])
+        return inputs[-1]
+
+    seconds, peak = measure(setup, lambda state: state.extend(range(10000)), 3)
+    assert len(inputs) == 4
+    assert seconds > 0
+    assert peak > 10000
+
+
+def test_compare_flags_regressions():
+    baseline = {
+        m.key: m
+        for m in [
+            Measurement("generate_ddl", 100, 1.0, 10_000_000),
+            Measurement("generate_proto", 100, 0.5, 1_000_000),
+            Measurement("validate_workflow", 100, 0.001, 1000),
+        ]
+    }
+    current = [
+        Measurement("generate_ddl", 100, 1.3, 10_500_000),
+        Measurement("generate_proto", 100, 0.55, 2_000_000),
+        # Tiny absolute differences are ignored
+        Measurement("validate_workflow", 100, 0.002, 2000),
+        Measurement("validate_workflow", 1000, 9.0, 9000),
+    ]
+    regressions = compare(current, baseline, threshold=0.2)
+    assert [(r.key, r.metric) for r in regressions] == [
+        ("generate_ddl[100]", "seconds"),
+        ("generate_proto[100]", "peak_bytes"),
+    ]
+    assert str(regressions[0]) == "generate_ddl[100] seconds: 1 -> 1.3 (+30%)"
+    assert compare(current, baseline, threshold=1.5) == []
+
+    failed = [Measurement("generate_ddl", 100, 0.0, 0, "RecursionError: too deep")]
+    assert compare(failed, baseline)[0].metric == "error (RecursionError: too deep)"
+
+
+def test_baseline_round_trip(tmp_path):
+    path = tmp_path / "baseline.json"
+    results = [
+        Measurement("generate_ddl", 10, 0.1, 1024),
+        Measurement("generate_ddl", 100, 0.0, 0, "ValueError: boom"),
+    ]
+    save_baseline(results, path)
+    assert load_baseline(path) == {"generate_ddl[10]": results[0]}
+
+    path.write_text(json.dumps({"version": 99, "results": {}}))
+    with pytest.raises(ValueError, match="Unsupported baseline version"):
+        load_baseline(path)
+
+
+def test_suite_runs_every_benchmark(tmp_path):
+    suite = BenchmarkSuite(scales=[10, 20], repeats=1, workdir=tmp_path)
+    results = suite.run()
+    assert [m.key for m in results][:2] == [
+        "load_from_directory[10]",
+        "load_from_directory[20]",
+    ]
+    assert len(results) == 10
+    assert all(m.error is None and m.seconds > 0 for m in results)
+
+    with pytest.raises(ValueError, match="Unknown benchmarks: nope"):
+        suite.run(["nope"])
+
+
+def test_main_fails_on_regression(tmp_path, capsys):
+    baseline = tmp_path / "baseline.json"
+    args = ["--scales", "10", "--repeats", "1", "--only", "generate_ddl"]
+    assert main([*args, "--save", str(baseline)]) == 0
+
+    data = json.loads(baseline.read_text())
+    data["results"]["generate_ddl[10]"]["seconds"] = 1e-9
+    baseline.write_text(json.dumps(data))
+    assert main([*args, "--baseline", str(baseline)]) == 1
+    assert "generate_ddl[10] seconds" in capsys.readouterr().out
@@ -0,0 +1,83 @@
+from collections import Counter
+
+from src.data.registry import SchemaRegistry
+from src.data.schema import DataType
+from src.models.workflow.enums import WorkflowNodeType
+from src.models.workflow.validation import validate_workflow
+from src.scripts.synthetic import (
+    SchemaSpec,
+    WorkflowSpec,
+    generate_tables,
+    generate_workflow,
+    main,
+    write_schema_directory,
+)
+
+
+def test_tables_are_seeded():
+    spec = SchemaSpec(tables=40, seed=7)
+    assert generate_tables(spec) == generate_tables(spec)
+    assert generate_tables(spec) != generate_tables(SchemaSpec(tables=40, seed=8))
+
+
+def test_schema_shape():
+    spec = SchemaSpec(tables=60, depth=4, fan_out=3, namespaces=3, enum_reuse=1.0)
+    tables = generate_tables(spec)
+    registry = SchemaRegistry()
+    for table in tables:
+        registry.register(table)
+
+    assert registry.validate() == []
+    assert len(registry.dependency_levels()) == 4
+    for table in tables:
+        refs = [c for c in table.columns if c.data_type == DataType.REFERENCE]
+        assert len(refs) <= 3
+    assert {t.namespace for t in tables} == {"ns_0", "ns_1", "ns_2"}
+    enum_names = [
+        c.enum_name for t in tables for c in t.columns if c.data_type == DataType.ENUM
+    ]
+    assert enum_names and all(n and n.startswith("shared_enum_") for n in enum_names)
+    assert len(registry.enums()) < len(enum_names)
+
+
+def test_schema_directory_loads(tmp_path):
+    spec = SchemaSpec(tables=25, tables_per_file=10)
+    paths = write_schema_directory(spec, tmp_path)
+    assert len(paths) == 3
+
+    registry = SchemaRegistry()
+    registry.load_from_directory(tmp_path)
+    assert [s.name for s in registry.list_schemas()] == [
+        t.name for t in generate_tables(spec)
+    ]
+    assert "CREATE TABLE table_00024" in registry.generate_ddl()
+
+
+def test_workflow_shape():
+    spec = WorkflowSpec(nodes=300, branch_density=0.2, decision_density=0.2, seed=3)
+    workflow = generate_workflow(spec)
+    assert workflow == generate_workflow(spec)
+    assert len(workflow.nodes) == 300
+    assert validate_workflow(workflow) == []
+
+    counts = Counter(n.type for n in workflow.nodes)
+    assert counts[WorkflowNodeType.TRIGGER] == counts[WorkflowNodeType.COMPLETION] == 1
+    assert counts[WorkflowNodeType.BRANCH] == counts[WorkflowNodeType.JOIN] > 0
+    assert counts[WorkflowNodeType.DECISION] > 0
+    decisions = {n.id for n in workflow.nodes if n.type == WorkflowNodeType.DECISION}
+    assert all(e.condition for e in workflow.edges if e.source_id in decisions)
+
+
+def test_linear_workflow():
+    workflow = generate_workflow(
+        WorkflowSpec(nodes=50, branch_density=0, decision_density=0)
+    )
+    assert len(workflow.edges) == 49
+
+
+def test_cli(tmp_path, capsys):
+    main(["workflow", str(tmp_path / "wf.json"), "--nodes", "20"])
+    main(["schema", str(tmp_path / "schemas"), "--tables", "5", "--fan-out", "1"])
+    assert (tmp_path / "wf.json").exists()
+    assert len(list((tmp_path / "schemas").glob("*.yaml"))) == 5
+    assert "Wrote 5 schema files" in capsys.readouterr().out